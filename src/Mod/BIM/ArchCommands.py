@@ -759,6 +759,7 @@ def pruneIncluded(objectslist,strict=False,silent=False):
     is removed only if the parent is also part of the selection."""
     import Draft
     newlist = []
+    names = None # lazily built set of the objects in objectslist, for fast membership tests
     for obj in objectslist:
         toplevel = True
         if obj.isDerivedFrom("Part::Feature"):
@@ -796,7 +797,10 @@ def pruneIncluded(objectslist,strict=False,silent=False):
                         toplevel = False
 
                     if toplevel == False and strict:
-                        if parent not in objectslist and parent not in newlist:
+                        # newlist only contains objects of objectslist
+                        if names is None:
+                            names = set((o.Document.Name, o.Name) for o in objectslist)
+                        if (parent.Document.Name, parent.Name) not in names:
                             toplevel = True
         if toplevel:
             newlist.append(obj)
@@ -236,6 +236,10 @@ class _ArchSchedule:
 
         self.data = {} # store all results in self.data, so it lives even without spreadsheet
         self.li = 1 # row index - starts at 2 to leave 2 blank rows for the title
+        # rows sharing the same objects and filters are evaluated only once
+        selections = {} # Objects column -> (pruned objects, ifcfile)
+        filtered = {} # (Objects column, Filter column) -> filtered objects or elements
+        props = {} # object name -> {upper-cased property name: property name}
 
         for i in range(len(obj.Operation)):
             self.li += 1
@@ -259,38 +263,26 @@ class _ArchSchedule:
             ifcfile = None
             elts = None
             if val:
-                import Draft
-                import Arch
-                if objs:
-                    objs = objs.split(";")
-                    objs = [FreeCAD.ActiveDocument.getObject(o) for o in objs]
-                    objs = [o for o in objs if o is not None]
+                key = objs
+                if key in selections:
+                    objs, ifcfile = selections[key]
                 else:
-                    if hasattr(getattr(FreeCAD.ActiveDocument, "Proxy", None), "ifcfile"):
-                        ifcfile = FreeCAD.ActiveDocument.Proxy.ifcfile
-                    objs = FreeCAD.ActiveDocument.Objects
-                if len(objs) == 1:
-                    if hasattr(objs[0], "StepId"):
-                        from nativeifc import ifc_tools
-                        ifcfile = ifc_tools.get_ifcfile(objs[0])
-                    # remove object itself if the object is a group
-                    if objs[0].isDerivedFrom("App::DocumentObjectGroup"):
-                        objs = objs[0].Group
-                objs = Draft.get_group_contents(objs)
-                objs = self.expandArrays(objs)
-                # Remove included objects (e.g. walls that are part of another wall,
-                # base geometry, etc)
-                objs = Arch.pruneIncluded(objs, strict=True, silent=True)
-                # Remove all schedules and spreadsheets:
-                objs = [o for o in objs if Draft.get_type(o) not in ["Schedule", "Spreadsheet::Sheet"]]
+                    objs, ifcfile = self.get_objects(objs)
+                    selections[key] = (objs, ifcfile)
 
                 # filter elements
 
                 if obj.Filter[i]:
+                    fkey = (key, obj.Filter[i])
+                    if not fkey in filtered:
+                        if ifcfile:
+                            filtered[fkey] = self.get_ifc_elements(ifcfile, obj.Filter[i])
+                        else:
+                            filtered[fkey] = self.apply_filter(objs, obj.Filter[i], props)
                     if ifcfile:
-                        elts = self.get_ifc_elements(ifcfile, obj.Filter[i])
+                        elts = filtered[fkey]
                     else:
-                        objs = self.apply_filter(objs, obj.Filter[i])
+                        objs = filtered[fkey]
 
                 # perform operation: count or retrieve property
 
@@ -303,35 +295,79 @@ class _ArchSchedule:
         self.setSpreadsheetData(obj)
         self.save_ifc_props(obj)
 
-    def apply_filter(self, objs, filters):
-        """Applies the given filters to the given list of objects"""
+    def get_objects(self, objs):
+        """Returns the top-level objects described by the given Objects column
+        value, and the IFC file to use instead, if any"""
+
+        import Draft
+        import Arch
+
+        ifcfile = None
+        if objs:
+            objs = objs.split(";")
+            objs = [FreeCAD.ActiveDocument.getObject(o) for o in objs]
+            objs = [o for o in objs if o is not None]
+        else:
+            if hasattr(getattr(FreeCAD.ActiveDocument, "Proxy", None), "ifcfile"):
+                ifcfile = FreeCAD.ActiveDocument.Proxy.ifcfile
+            objs = FreeCAD.ActiveDocument.Objects
+        if len(objs) == 1:
+            if hasattr(objs[0], "StepId"):
+                from nativeifc import ifc_tools
+                ifcfile = ifc_tools.get_ifcfile(objs[0])
+            # remove object itself if the object is a group
+            if objs[0].isDerivedFrom("App::DocumentObjectGroup"):
+                objs = objs[0].Group
+        objs = Draft.get_group_contents(objs)
+        objs = self.expandArrays(objs)
+        # Remove included objects (e.g. walls that are part of another wall,
+        # base geometry, etc)
+        objs = Arch.pruneIncluded(objs, strict=True, silent=True)
+        # Remove all schedules and spreadsheets:
+        objs = [o for o in objs if Draft.get_type(o) not in ["Schedule", "Spreadsheet::Sheet"]]
+        return objs, ifcfile
+
+    def apply_filter(self, objs, filters, props=None):
+        """Applies the given filters to the given list of objects. props is an optional
+        dictionary caching the upper-cased property names of each object between calls"""
+
+        if not objs:
+            return []
+        if props is None:
+            props = {}
+        tests = []
+        for f in filters.split(";"):
+            args = [a.strip() for a in f.strip().split(":")]
+            if args[0][0] == "!":
+                inv = True
+                prop = args[0][1:].upper()
+            else:
+                inv = False
+                prop = args[0].upper()
+            fval = args[1].upper()
+            if prop == "TYPE":
+                prop = "IFCTYPE"
+            tests.append((inv, prop, fval))
 
         nobjs = []
         for o in objs:
-            props = [p.upper() for p in o.PropertiesList]
+            oprops = props.get(o.Name)
+            if oprops is None:
+                oprops = {}
+                for p in reversed(o.PropertiesList):
+                    oprops[p.upper()] = p
+                props[o.Name] = oprops
             ok = True
-            for f in filters.split(";"):
-                args = [a.strip() for a in f.strip().split(":")]
-                if args[0][0] == "!":
-                    inv = True
-                    prop = args[0][1:].upper()
-                else:
-                    inv = False
-                    prop = args[0].upper()
-                fval = args[1].upper()
-                if prop == "TYPE":
-                    prop = "IFCTYPE"
+            for inv, prop, fval in tests:
                 if inv:
-                    if prop in props:
-                        csprop = o.PropertiesList[props.index(prop)]
-                        if fval in getattr(o,csprop).upper():
+                    if prop in oprops:
+                        if fval in getattr(o,oprops[prop]).upper():
                             ok = False
                 else:
-                    if not (prop in props):
+                    if not (prop in oprops):
                         ok = False
                     else:
-                        csprop = o.PropertiesList[props.index(prop)]
-                        if not (fval in getattr(o,csprop).upper()):
+                        if not (fval in getattr(o,oprops[prop]).upper()):
                             ok = False
             if ok:
                 nobjs.append(o)
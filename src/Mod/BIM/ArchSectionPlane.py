@@ -91,15 +91,83 @@ def getSectionData(source):
     return objs,cutplane,onlySolids,clip,direction
 
 
-def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesByObject=False):
+def getCutPlane(cutplane):
+
+    """returns the center and the normal of the given cut plane. The cut volume
+    returned by ArchCommands.getCutVolume lies on the side the normal points to"""
+
+    if hasattr(cutplane,"Shape"):
+        cutplane = cutplane.Shape
+    face = cutplane.Faces[0]
+    return face.CenterOfMass,face.normalAt(0,0)
+
+
+def classifyBoundBox(boundBox,center,normal,tolerance=1e-6):
+
+    """returns 1 if the given bounding box lies entirely on the side of the
+    given plane the normal points to, -1 if it lies entirely on the other
+    side and 0 if the plane crosses it"""
+
+    dmin = dmax = None
+    for x in (boundBox.XMin,boundBox.XMax):
+        for y in (boundBox.YMin,boundBox.YMax):
+            for z in (boundBox.ZMin,boundBox.ZMax):
+                d = normal.dot(Vector(x,y,z).sub(center))
+                if dmin is None or d < dmin:
+                    dmin = d
+                if dmax is None or d > dmax:
+                    dmax = d
+    if dmin > tolerance:
+        return 1
+    if dmax < -tolerance:
+        return -1
+    return 0
+
+
+def cutSolid(sub,cutface,cutvolume,invcutvolume,showHidden,side=0):
+
+    """returns the visible shapes, the section faces and the hidden shapes
+    obtained by cutting a solid with the given cut volumes. side is the
+    result of classifyBoundBox for the solid, solids that are not crossed
+    by the cut plane don't need any boolean operation"""
+
+    import Part
+    import DraftGeomUtils
+    if sub.Volume < 0:
+        sub = sub.reversed() # Use reversed as sub is immutable.
+    if side < 0:
+        return [sub],[],[]
+    if side > 0:
+        return [],[],([sub] if showHidden else [])
+    visible = []
+    sections = []
+    hidden = []
+    c = sub.cut(cutvolume)
+    s = sub.section(cutface)
+    try:
+        wires = DraftGeomUtils.findWires(s.Edges)
+        for w in wires:
+            f = Part.Face(w)
+            sections.append(f)
+    except Part.OCCError:
+        #print "ArchView: unable to get a face"
+        sections.append(s)
+    visible.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+    if showHidden:
+        c = sub.cut(invcutvolume)
+        hidden.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+    return visible,sections,hidden
+
+
+def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesByObject=False,cache=None):
 
     """
     returns a list of shapes (visible, hidden, cut lines...)
-    obtained from performing a series of booleans against the given cut plane
+    obtained from performing a series of booleans against the given cut plane.
+    If a cache dictionary is given, the results of unchanged solids are reused
+    from the previous call with the same cache and cut plane
     """
 
-    import Part
-    import DraftGeomUtils
     shapes = []
     hshapes = []
     sshapes = []
@@ -151,28 +219,38 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                     objectShapes.append((o,[o.Shape]))
 
     cutface,cutvolume,invcutvolume = ArchCommands.getCutVolume(cutplane,shapes,clip)
+    # Without clipping, the cut volumes are half spaces bounded by the cut plane,
+    # solids on one side of it can be classified by their bounding box alone and
+    # the result for a solid only depends on the solid and the plane.
+    plane = None
+    planekey = None
+    if cutvolume and not clip:
+        plane = getCutPlane(cutplane)
+        planekey = (tuple(plane[0]),tuple(plane[1]),showHidden)
+    used = {}
     shapes = []
     for o, shapeList in objectShapes:
         tmpSshapes = []
         for sh in shapeList:
             for sub in (sh.SubShapes if sh.ShapeType == "Compound" else [sh]):
                 if cutvolume:
-                    if sub.Volume < 0:
-                        sub = sub.reversed() # Use reversed as sub is immutable.
-                    c = sub.cut(cutvolume)
-                    s = sub.section(cutface)
-                    try:
-                        wires = DraftGeomUtils.findWires(s.Edges)
-                        for w in wires:
-                            f = Part.Face(w)
-                            tmpSshapes.append(f)
-                    except Part.OCCError:
-                        #print "ArchView: unable to get a face"
-                        tmpSshapes.append(s)
-                    shapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
-                    if showHidden:
-                        c = sub.cut(invcutvolume)
-                        hshapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+                    result = None
+                    key = None
+                    if planekey and (cache is not None):
+                        key = (planekey,sub.hashCode())
+                        entry = cache.get(key,used.get(key))
+                        if entry and entry[0].isSame(sub):
+                            result = entry[1]
+                    if result is None:
+                        side = 0
+                        if plane:
+                            side = classifyBoundBox(sub.BoundBox,plane[0],plane[1])
+                        result = cutSolid(sub,cutface,cutvolume,invcutvolume,showHidden,side)
+                    if key:
+                        used[key] = (sub,result)
+                    shapes.extend(result[0])
+                    tmpSshapes.extend(result[1])
+                    hshapes.extend(result[2])
                 else:
                     shapes.append(sub)
 
@@ -182,6 +260,11 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                 if groupSshapesByObject:
                     objectSshapes.append((o, tmpSshapes))
 
+    if cache is not None:
+        # only keep the solids of this section
+        cache.clear()
+        cache.update(used)
+
     if groupSshapesByObject:
         return shapes,hshapes,sshapes,cutface,cutvolume,invcutvolume,objectSshapes
     else:
@@ -412,10 +495,15 @@ def getSVG(source,
             # invcutvolume = source.Proxy.shapecache[5] # Unused
             objectSshapes = source.Proxy.shapecache[6]
         else:
+            cutcache = None
+            if hasattr(source,"Proxy"):
+                if getattr(source.Proxy,"cutcache",None) is None:
+                    source.Proxy.cutcache = {}
+                cutcache = source.Proxy.cutcache
             if showFill:
-                vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume,objectSshapes = getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,True)
+                vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume,objectSshapes = getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,True,cache=cutcache)
             else:
-                vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden)
+                vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,cache=cutcache)
                 objectSshapes = []
             source.Proxy.shapecache = [vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume,objectSshapes]
 
@@ -36,6 +36,7 @@ import TechDraw
 import WorkingPlane
 
 from bimtests.TestArchRoof import TestArchRoof
+from bimtests.TestArchSchedule import TestArchSchedule
 from bimtests.TestArchSpace import TestArchSpace
 from bimtests.TestArchWall import TestArchWall
 
@@ -110,6 +111,33 @@ class ArchTest(unittest.TestCase):
         s = Arch.makeSectionPlane([])
         self.assertTrue(s,"Arch Section failed")
 
+    def testSectionCutCache(self):
+        App.Console.PrintLog ('Checking Arch Section cut cache...\n')
+        import ArchSectionPlane
+        cutplane = Part.makePlane(100,100,App.Vector(-50,-50,0))
+        center,normal = ArchSectionPlane.getCutPlane(cutplane)
+        self.assertEqual(normal,App.Vector(0,0,1))
+        objs = []
+        for z in (-15.5,-5,5.5):
+            o = App.ActiveDocument.addObject("Part::Feature","Box")
+            o.Shape = Part.makeBox(10,10,10,App.Vector(0,0,z))
+            objs.append(o)
+        self.assertEqual(ArchSectionPlane.classifyBoundBox(objs[0].Shape.BoundBox,center,normal),-1)
+        self.assertEqual(ArchSectionPlane.classifyBoundBox(objs[1].Shape.BoundBox,center,normal),0)
+        self.assertEqual(ArchSectionPlane.classifyBoundBox(objs[2].Shape.BoundBox,center,normal),1)
+
+        cache = {}
+        vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,True,False,False,True,cache=cache)
+        self.assertEqual(len(vshapes),2)
+        self.assertEqual(len(hshapes),2)
+        self.assertEqual(len(sshapes),1)
+        self.assertEqual(len(cache),3)
+        results = [r for s,r in cache.values()]
+        vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,True,False,False,True,cache=cache)
+        self.assertEqual(len(vshapes),2)
+        self.assertEqual(len(sshapes),1)
+        self.assertTrue(all(any(r is x for x in results) for s,r in cache.values()))
+
     def testStairs(self):
         App.Console.PrintLog ('Checking Arch Stairs...\n')
         s = Arch.makeStairs()
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 The FreeCAD Project Association                    *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 2.1 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+
+# Unit tests for the Arch schedule module
+
+import Arch
+import Draft
+import FreeCAD as App
+from bimtests import TestArchBase
+
+
+def previous_apply_filter(objs, filters):
+    """the filtering of _ArchSchedule.apply_filter before the filters were parsed once per call"""
+
+    nobjs = []
+    for o in objs:
+        props = [p.upper() for p in o.PropertiesList]
+        ok = True
+        for f in filters.split(";"):
+            args = [a.strip() for a in f.strip().split(":")]
+            if args[0][0] == "!":
+                inv = True
+                prop = args[0][1:].upper()
+            else:
+                inv = False
+                prop = args[0].upper()
+            fval = args[1].upper()
+            if prop == "TYPE":
+                prop = "IFCTYPE"
+            if inv:
+                if prop in props:
+                    csprop = o.PropertiesList[props.index(prop)]
+                    if fval in getattr(o,csprop).upper():
+                        ok = False
+            else:
+                if not (prop in props):
+                    ok = False
+                else:
+                    csprop = o.PropertiesList[props.index(prop)]
+                    if not (fval in getattr(o,csprop).upper()):
+                        ok = False
+        if ok:
+            nobjs.append(o)
+    return nobjs
+
+
+def previous_prune_included(objectslist):
+    """Arch.pruneIncluded(objectslist, strict=True) before the parents were looked up in a set"""
+
+    newlist = []
+    for obj in objectslist:
+        toplevel = True
+        if obj.isDerivedFrom("Part::Feature"):
+            if Draft.getType(obj) not in ["Window","Clone","Pipe","Rebar","Roof"]:
+                for parent in obj.InList:
+                    if not parent.isDerivedFrom("Part::Feature"):
+                        pass
+                    elif Draft.getType(parent) in ["Space","Facebinder","Window","Roof","Clone","Site","Project"]:
+                        pass
+                    elif parent.isDerivedFrom("Part::Part2DObject"):
+                        pass
+                    elif parent.isDerivedFrom("PartDesign::FeatureBase"):
+                        pass
+                    elif parent.isDerivedFrom("PartDesign::Body") and obj == parent.BaseFeature:
+                        pass
+                    elif parent.isDerivedFrom("PartDesign::SubShapeBinder") or (hasattr(parent, "TypeId") and parent.TypeId == "PartDesign::ShapeBinder"):
+                        pass
+                    elif hasattr(parent,"Host") and parent.Host == obj:
+                        pass
+                    elif hasattr(parent,"Hosts") and obj in parent.Hosts:
+                        pass
+                    elif hasattr(parent,"TypeId") and parent.TypeId == "Part::Mirroring":
+                        pass
+                    elif hasattr(parent,"CloneOf"):
+                        if parent.CloneOf:
+                            if parent.CloneOf.Name != obj.Name:
+                                toplevel = False
+                        else:
+                            toplevel = False
+                    else:
+                        toplevel = False
+
+                    if toplevel == False:
+                        if parent not in objectslist and parent not in newlist:
+                            toplevel = True
+        if toplevel:
+            newlist.append(obj)
+    return newlist
+
+
+class TestArchSchedule(TestArchBase.TestArchBase):
+
+    def setUp(self):
+        super().setUp()
+        # walls, one of them added to another one, and structures,
+        # some of them in a group
+        self.lines = [Draft.makeLine(App.Vector(0,1000*i,0),App.Vector(2000+500*i,1000*i,0)) for i in range(3)]
+        self.walls = [Arch.makeWall(l,width=200,height=3000) for l in self.lines]
+        self.walls[0].Description = "Exterior wall"
+        self.walls[1].Description = "interior wall"
+        self.walls[0].Additions = [self.walls[2]]
+        self.beam = Arch.makeStructure(length=4000,width=200,height=300)
+        self.beam.IfcType = "Beam"
+        self.beam.Description = "Exterior beam"
+        self.column = Arch.makeStructure(length=300,width=300,height=3000)
+        self.column.IfcType = "Column"
+        self.group = self.document.addObject("App::DocumentObjectGroup","Group")
+        self.group.Group = [self.walls[1],self.beam]
+        self.document.recompute()
+
+    def testSchedulePruneIncluded(self):
+        operation = "Checking Arch Schedule pruning of included objects..."
+        self.printTestMessage(operation)
+
+        objs = self.document.Objects
+        selections = [
+            objs,
+            self.walls,
+            self.walls[1:],
+            self.lines + [self.walls[1]],
+            list(reversed(objs)),
+            Draft.get_group_contents(objs),
+        ]
+        for sel in selections:
+            self.assertEqual(Arch.pruneIncluded(sel,strict=True,silent=True),
+                             previous_prune_included(sel))
+        self.assertNotIn(self.walls[2],Arch.pruneIncluded(self.walls,strict=True,silent=True))
+        self.assertIn(self.walls[2],Arch.pruneIncluded(self.walls[1:],strict=True,silent=True))
+
+    def testScheduleApplyFilter(self):
+        operation = "Checking Arch Schedule filters..."
+        self.printTestMessage(operation)
+
+        sc = Arch.makeSchedule()
+        objs = self.document.Objects
+        filters = [
+            "IfcType:Wall",
+            "Type:beam",
+            "!IfcType:Wall",
+            "Description:exterior",
+            "!Description:exterior",
+            "Label:Wall;!Description:interior",
+            " ifctype : Column ; !label : Wall ",
+            "NoSuchProperty:x",
+            "!NoSuchProperty:x",
+        ]
+        props = {}
+        for f in filters:
+            expected = previous_apply_filter(objs,f)
+            self.assertEqual(sc.Proxy.apply_filter(objs,f),expected,f)
+            # with the property names shared between the calls
+            self.assertEqual(sc.Proxy.apply_filter(objs,f,props),expected,f)
+        self.assertEqual(sc.Proxy.apply_filter([],"IfcType:Wall"),[])
+
+    def testScheduleSharedRows(self):
+        operation = "Checking Arch Schedule rows sharing objects and filters..."
+        self.printTestMessage(operation)
+
+        rows = [
+            ("Walls",              "Count",  "",   "",                "IfcType:Wall"),
+            ("Wall length",        "Length", "m",  "",                "IfcType:Wall"),
+            ("Exterior",           "Count",  "",   "",                "Description:exterior"),
+            ("All",                "Count",  "",   "",                ""),
+            ("Group",              "Count",  "",   self.group.Name,   ""),
+            ("Group walls",        "Count",  "",   self.group.Name,   "IfcType:Wall"),
+            ("Group height",       "Height", "mm", self.group.Name,   "!IfcType:Column"),
+            ("",                   "",       "",   "",                ""),
+            ("Selected walls",     "Count",  "",   ";".join(w.Name for w in self.walls), ""),
+            ("Walls again",        "Count",  "",   "",                "IfcType:Wall"),
+        ]
+        sc = Arch.makeSchedule()
+        sc.Operation = [r[0] for r in rows]
+        sc.Value = [r[1] for r in rows]
+        sc.Unit = [r[2] for r in rows]
+        sc.Objects = [r[3] for r in rows]
+        sc.Filter = [r[4] for r in rows]
+        sc.Proxy.execute(sc)
+        data = dict(sc.Proxy.data)
+
+        # every row evaluated on its own, like before the rows shared their objects
+        single = Arch.makeSchedule()
+        for i, r in enumerate(rows):
+            if not r[0]:
+                continue
+            single.Operation, single.Value, single.Unit, single.Objects, single.Filter = [[v] for v in r]
+            single.Proxy.execute(single)
+            for col in "ABC":
+                self.assertEqual(data.get(col+str(i+2)),single.Proxy.data.get(col+"2"),r[0])
+        self.assertEqual(data["B2"],"2")
+        self.assertEqual(data["B4"],"2")
+        self.assertEqual(data["B7"],"1")
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""
+Benchmark of the cycle time estimation and the machine state tracker.
+
+Run it with FreeCADCmd:
+
+    FreeCADCmd -c "import CAMTests.BenchmarkCycleTime as b; b.run()"
+"""
+
+import random
+import time
+
+import Path
+import Path.Base.CycleTime as PathCycleTime
+import Path.Base.MachineState as PathMachineState
+
+
+def makeCommands(count, seed=0):
+    """Returns count random feed, arc, rapid and drill commands."""
+    rnd = random.Random(seed)
+    commands = []
+    for _ in range(count):
+        r = rnd.random()
+        x, y = rnd.uniform(0, 100), rnd.uniform(0, 100)
+        if r < 0.1:
+            commands.append(Path.Command("G0", {"X": x, "Y": y, "Z": 5}))
+        elif r < 0.25:
+            commands.append(Path.Command("G2", {"X": x, "Y": y, "I": 1, "J": 1, "F": 20}))
+        elif r < 0.27:
+            params = {"X": x, "Y": y, "Z": -5, "R": 2, "Q": 1, "F": 5}
+            commands.append(Path.Command("G83", params))
+        else:
+            z = rnd.uniform(-1, 0)
+            commands.append(Path.Command("G1", {"X": x, "Y": y, "Z": z, "F": 20}))
+    return commands
+
+
+def _rate(func, commands):
+    start = time.perf_counter()
+    func(commands)
+    return len(commands) / (time.perf_counter() - start)
+
+
+def run(count=1000000):
+    """Prints the commands per second of the estimations and of the machine state."""
+    commands = makeCommands(count)
+    limits = PathCycleTime.MachineLimits(20, 5, 100, 50)
+    accelerated = PathCycleTime.MachineLimits(20, 5, 100, 50, (500, 500, 200))
+
+    def track(commands):
+        machine = PathMachineState.MachineState()
+        for command in commands:
+            machine.addCommand(command)
+
+    path = Path.Path(commands)
+    results = [
+        ("C++ Path.getCycleTime", lambda c: path.getCycleTime(20, 5, 100, 50)),
+        ("estimate", lambda c: PathCycleTime.estimate(c, limits)),
+        ("estimate with acceleration", lambda c: PathCycleTime.estimate(c, accelerated)),
+        ("MachineState.addCommand", track),
+    ]
+    for name, func in results:
+        print("%-28s %10.0f commands/s" % (name, _rate(func, commands)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""
+Benchmark of the wire ordering used by V-carve, engrave and deburr.
+
+The wires are the strokes of a generated dense font layout. Run it with FreeCADCmd:
+
+    FreeCADCmd -c "import CAMTests.BenchmarkWireOrder as b; b.run()"
+"""
+
+import random
+import time
+
+import FreeCAD
+import PathScripts.PathUtils as PathUtils
+
+
+def makeFontLayout(lines=40, columns=80, seed=0):
+    """Returns begin and end points of the strokes of lines of random glyphs."""
+    rnd = random.Random(seed)
+    begins = []
+    ends = []
+    for line in range(lines):
+        for column in range(columns):
+            x0, y0 = column * 6.0, line * -10.0
+            for _ in range(rnd.randint(3, 9)):
+                x, y = x0 + rnd.uniform(0, 4), y0 + rnd.uniform(0, 8)
+                begins.append(FreeCAD.Vector(x, y, 0))
+                ends.append(FreeCAD.Vector(x + rnd.uniform(-2, 2), y + rnd.uniform(-3, 3), 0))
+    return (begins, ends)
+
+
+def sortQuadratic(begins, ends, start=FreeCAD.Vector(0, 0, 0)):
+    """The greedy ordering V-carve used before, scanning all wires for every pick."""
+    begin = dict(enumerate(begins))
+    end = dict(enumerate(ends))
+    result = []
+    while begin:
+        bIdx = min(begin, key=lambda i: start.distanceToPoint(begin[i]))
+        eIdx = min(end, key=lambda i: start.distanceToPoint(end[i]))
+        if start.distanceToPoint(begin[bIdx]) < start.distanceToPoint(end[eIdx]):
+            result.append((bIdx, False))
+            start = end[bIdx]
+        else:
+            result.append((eIdx, True))
+            start = begin[eIdx]
+        del begin[result[-1][0]]
+        del end[result[-1][0]]
+    return result
+
+
+def _length(begins, ends, order):
+    last = FreeCAD.Vector(0, 0, 0)
+    length = 0
+    for i, flip in order:
+        length += last.distanceToPoint(ends[i] if flip else begins[i])
+        last = begins[i] if flip else ends[i]
+    return length
+
+
+def run(lines=40, columns=80, timeBudget=5):
+    """Prints the time and the rapid distance of the orderings."""
+    begins, ends = makeFontLayout(lines, columns)
+    print("%d wires" % len(begins))
+    results = [
+        ("quadratic greedy", lambda: sortQuadratic(begins, ends)),
+        ("sort_wires", lambda: PathUtils.sort_wires(begins, ends, timeBudget=0)),
+        ("sort_wires refined", lambda: PathUtils.sort_wires(begins, ends, timeBudget=timeBudget)),
+    ]
+    for name, func in results:
+        start = time.perf_counter()
+        order = func()
+        seconds = time.perf_counter() - start
+        print("%-20s %8.2f s  rapid %10.1f" % (name, seconds, _length(begins, ends, order)))
+
+
+if __name__ == "__main__":
+    run()
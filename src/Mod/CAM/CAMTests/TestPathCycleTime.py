@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+
+import Path
+import Path.Base.CycleTime as PathCycleTime
+
+from CAMTests.PathTestUtils import PathTestBase
+
+
+def _estimate(gcode, limits):
+    return PathCycleTime.estimate(Path.Path(gcode).Commands, limits)
+
+
+class TestPathCycleTime(PathTestBase):
+    """Unit tests for the kinematic cycle time estimation."""
+
+    def setUp(self):
+        self.limits = PathCycleTime.MachineLimits(10, 5, 100, 50)
+        self.accelerated = PathCycleTime.MachineLimits(10, 5, 100, 50, (10, 10, 10))
+
+    def test00(self):
+        """Verify moves without acceleration limits."""
+        self.assertRoughly(_estimate("G1 X100", self.limits), 10)
+        self.assertRoughly(_estimate("G1 X100 F20", self.limits), 5)
+        self.assertRoughly(_estimate("G1 Z-10", self.limits), 2)
+        # the vertical rapid rate limits the diagonal rapid
+        self.assertRoughly(_estimate("G0 X30 Y40 Z50", self.limits), 1)
+
+    def test01(self):
+        """Verify arc lengths."""
+        quarter = _estimate("G0 X10\nG2 X0 Y-10 I-10 J0 F10", self.limits) - 0.1
+        self.assertRoughly(quarter, math.pi * 5 / 10)
+        circle = _estimate("G0 X10\nG3 X10 Y0 I-10 J0 F10", self.limits) - 0.1
+        self.assertRoughly(circle, math.pi * 2)
+        helix = _estimate("G0 X10\nG3 X10 Y0 Z-5 I-10 J0 F10", self.limits) - 0.1
+        self.assertRoughly(helix, math.hypot(math.pi * 20, 5) / 10)
+
+    def test02(self):
+        """Verify acceleration and blending of moves."""
+        self.assertRoughly(_estimate("G1 X100", self.accelerated), 11)
+        # collinear moves blend without slowing down
+        self.assertRoughly(_estimate("G1 X50\nG1 X100", self.accelerated), 11)
+        # a right angle stops the machine
+        self.assertRoughly(_estimate("G1 X50\nG1 Y50", self.accelerated), 12)
+        # a short move does not reach the feed rate
+        self.assertRoughly(_estimate("G1 X2.5", self.accelerated), 1)
+
+    def test03(self):
+        """Verify drill cycles and dwells."""
+        gcode = "G0 Z10\nG98\nG81 X0 Y0 Z-5 R5 F5"
+        self.assertRoughly(_estimate(gcode, self.limits), 0.2 + 0.1 + 2 + 0.3)
+        gcode = "G0 Z10\nG99\nG82 X0 Y0 Z-5 R5 P1.5 F5"
+        self.assertRoughly(_estimate(gcode, self.limits), 0.2 + 0.1 + 2 + 1.5 + 0.2)
+        gcode = "G0 Z10\nG98\nG83 X0 Y0 Z-5 R5 Q5 F5"
+        clearance = PathCycleTime.PeckClearance
+        peck = 0.1 + (5 - clearance) / 50 + clearance / 5
+        self.assertRoughly(_estimate(gcode, self.limits), 0.2 + 0.1 + 2 + peck + 0.3)
+        self.assertRoughly(_estimate("G4 P2.5", self.limits), 2.5)
+
+    def test04(self):
+        """Verify formatting of cycle times."""
+        self.assertEqual(PathCycleTime.formatCycleTime(3661.4), "01:01:01")
+        self.assertEqual(PathCycleTime.formatCycleTime(90000), "25:00:00")
+        self.assertEqual(PathCycleTime.parseCycleTime("25:00:00"), 90000)
+        self.assertIsNone(PathCycleTime.parseCycleTime("Feedrate Error"))
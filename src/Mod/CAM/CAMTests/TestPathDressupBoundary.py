@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import random
+
+import FreeCAD
+import Part
+import Path
+import Path.Dressup.Boundary as PathDressupBoundary
+
+from CAMTests.PathTestUtils import PathTestBase
+
+
+class TestPathDressupBoundary(PathTestBase):
+    """Unit tests for the classification of moves by a prismatic boundary."""
+
+    def test00(self):
+        """Verify which shapes are prismatic boundaries."""
+        box = Part.makeBox(100, 50, 20)
+        self.assertIsNotNone(PathDressupBoundary.prismaticBoundary(box))
+        cylinder = Part.makeCylinder(20, 10)
+        self.assertIsNotNone(PathDressupBoundary.prismaticBoundary(cylinder))
+        self.assertIsNone(PathDressupBoundary.prismaticBoundary(Part.makeSphere(10)))
+        self.assertIsNone(PathDressupBoundary.prismaticBoundary(Part.makeCone(10, 5, 10)))
+        self.assertIsNone(PathDressupBoundary.prismaticBoundary(box.Faces[0]))
+
+    def test01(self):
+        """Verify classification of moves by a box."""
+        boundary = PathDressupBoundary.prismaticBoundary(Part.makeBox(100, 50, 20))
+        pos = FreeCAD.Vector(10, 10, 5)
+        self.assertTrue(boundary.classify(Path.Command("G1", {"X": 90, "Y": 40}), pos))
+        self.assertTrue(boundary.classify(Path.Command("G2", {"X": 10, "I": 5}), pos))
+        above = FreeCAD.Vector(0, 0, 25)
+        self.assertFalse(boundary.classify(Path.Command("G1", {"Z": 30}), above))
+        beside = FreeCAD.Vector(-5, 60, 5)
+        self.assertFalse(boundary.classify(Path.Command("G1", {"Y": 80}), beside))
+        # moves crossing or touching the boundary are left to the booleans
+        self.assertIsNone(boundary.classify(Path.Command("G1", {"X": 110}), pos))
+        self.assertIsNone(boundary.classify(Path.Command("G1", {"X": 100}), pos))
+        self.assertIsNone(boundary.classify(Path.Command("G1", {"Z": 30}), pos))
+        self.assertIsNone(boundary.classify(Path.Command("G2", {"X": 10, "I": 20}), pos))
+        self.assertIsNone(boundary.classify(Path.Command("G81", {"Z": 0}), pos))
+
+    def test02(self):
+        """Verify classification agrees with the booleans of the dressup."""
+        shape = Part.makeCylinder(30, 20).cut(Part.makeCylinder(10, 20))
+        boundary = PathDressupBoundary.prismaticBoundary(shape)
+        self.assertIsNotNone(boundary)
+        rnd = random.Random(0)
+        for _ in range(200):
+            pos = FreeCAD.Vector(rnd.uniform(-40, 40), rnd.uniform(-40, 40), rnd.uniform(-5, 25))
+            params = {"X": pos.x + rnd.uniform(-5, 5), "Y": pos.y + rnd.uniform(-5, 5)}
+            cmd = Path.Command("G1", params)
+            included = boundary.classify(cmd, pos)
+            if included is None:
+                continue
+            edge = Path.Geom.edgeForCmd(cmd, pos)
+            self.assertEqual(len(edge.common(shape).Edges), 1 if included else 0)
+            self.assertEqual(len(edge.cut(shape).Edges), 0 if included else 1)
@@ -21,6 +21,7 @@
 # ***************************************************************************
 
 import CAMTests.PathTestUtils as PathTestUtils
+import Part
 import math
 
 from FreeCAD import Vector
@@ -67,3 +68,30 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         h = 2.5 * math.tan((60 / 180.0) * math.pi) * 1.01
         print(h)
         self.assertConeAt(tag.solid, Vector(0, 0, -h * 0.01), 2.5, 0, h)
+
+    def test05(self):
+        """Verify tags of the same size get their own solid at their own position."""
+        tag1 = Tag(0, 0, 0, 4, 5, 90, 1, True)
+        tag2 = Tag(1, 10, 20, 4, 5, 90, 1, True)
+        tag1.createSolidsAt(0, 0)
+        tag2.createSolidsAt(3, 0)
+
+        self.assertFalse(tag1.solid.isSame(tag2.solid))
+        self.assertRoughly(tag1.solid.Volume, tag2.solid.Volume)
+        self.assertRoughly(tag1.realRadius, tag2.realRadius)
+        self.assertCoincide(
+            tag1.solid.BoundBox.Center + Vector(10, 20, 3), tag2.solid.BoundBox.Center
+        )
+
+    def test06(self):
+        """Verify edges outside a tag's footprint don't intersect it."""
+        tag = Tag(0, 0, 0, 4, 5, 90, 0, True)
+        tag.createSolidsAt(0, 0)
+
+        edge = Part.Edge(Part.LineSegment(Vector(-10, 5, 1), Vector(10, 5, 1)))
+        self.assertFalse(tag.overlaps(edge))
+        self.assertIsNone(tag.intersects(edge, edge.FirstParameter))
+
+        edge = Part.Edge(Part.LineSegment(Vector(-10, 0, 1), Vector(10, 0, 1)))
+        self.assertTrue(tag.overlaps(edge))
+        self.assertCoincide(tag.intersects(edge, edge.FirstParameter), Vector(-2, 0, 1))
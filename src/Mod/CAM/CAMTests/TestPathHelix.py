@@ -28,6 +28,7 @@ import Path
 import Path.Base.SetupSheetOpPrototype as PathSetupSheetOpPrototype
 import Path.Main.Job as PathJob
 import Path.Op.Helix as PathHelix
+import Path.Op.PocketShape as PathPocketShape
 import CAMTests.PathTestUtils as PathTestUtils
 
 FIXTURE_PATH = pathlib.Path(__file__).parent / "Fixtures"
@@ -223,6 +224,74 @@ class TestPathHelix(PathTestUtils.PathTestBase):
         check(self.doc.Helix002, "CCW", "Inside", "Climb")
         check(self.doc.Helix003, "CCW", "Outside", "Conventional")
 
+    def testRecomputeUnchangedHelix(self):
+        """Verify that an unchanged Helix keeps its Path and a modified one is recomputed"""
+
+        op = PathHelix.Create("Helix")
+        op.Proxy.execute(op)
+        size = op.Path.Size
+        self.assertTrue(size > 0)
+
+        executed = []
+        opExecute = op.Proxy.opExecute
+
+        def countedOpExecute(obj):
+            executed.append(obj.Name)
+            return opExecute(obj)
+
+        op.Proxy.opExecute = countedOpExecute
+        op.Proxy.execute(op)
+        self.assertEqual(executed, [])
+        self.assertEqual(op.Path.Size, size)
+
+        op.StepOver = 25
+        op.Proxy.execute(op)
+        self.assertEqual(executed, [op.Name])
+
+        self.job.Tools.Group[0].HorizFeed = 123
+        op.Proxy.execute(op)
+        self.assertEqual(executed, [op.Name, op.Name])
+
+    def testRecomputeHelixAfterModelChange(self):
+        """Verify that a Helix is recomputed if the dimensions of the model change"""
+
+        op = PathHelix.Create("Helix")
+        op.Proxy.execute(op)
+        fingerprint = op.Proxy.fingerprint(op)
+
+        executed = []
+        opExecute = op.Proxy.opExecute
+
+        def countedOpExecute(obj):
+            executed.append(obj.Name)
+            return opExecute(obj)
+
+        op.Proxy.opExecute = countedOpExecute
+        self.doc.Pad.Length = self.doc.Pad.Length.Value + 2
+        self.doc.recompute()
+        op.Proxy.execute(op)
+        self.assertNotEqual(op.Proxy.fingerprint(op), fingerprint)
+        self.assertIn(op.Name, executed)
+
+    def testRecomputeRestMachiningAfterPrecedingOp(self):
+        """Verify that a rest machining op is recomputed if a preceding op changes its Path"""
+
+        helix = PathHelix.Create("Helix")
+        helix.Proxy.execute(helix)
+        pocket = PathPocketShape.Create("Pocket")
+        pocket.UseRestMachining = True
+        fingerprint = pocket.Proxy.fingerprint(pocket)
+        self.assertEqual(pocket.Proxy.fingerprint(pocket), fingerprint)
+
+        helix.Direction = "CCW" if helix.Direction == "CW" else "CW"
+        helix.Proxy.execute(helix)
+        self.assertNotEqual(pocket.Proxy.fingerprint(pocket), fingerprint)
+
+        pocket.UseRestMachining = False
+        fingerprint = pocket.Proxy.fingerprint(pocket)
+        helix.Active = False
+        self.assertEqual(pocket.Proxy.fingerprint(pocket), fingerprint)
+
     def assertPathDirection(self, path, expected_direction, msg=None):
         """Asserts that the given path goes into the expected direction.
 
@@ -147,3 +147,52 @@ class TestPathHelpers(PathTestBase):
         l = Part.makeLine(v1, v2)
         results = PathUtils.filterArcs(l)
         self.assertTrue(len(results) == 0)
+
+    def test03(self):
+        """Test PathUtils sort_locations"""
+
+        # a grid of holes, the default attractor x sorts them column by column
+        locations = [{"x": x * 10.0, "y": y * 10.0} for y in range(3) for x in range(4)]
+        result = PathUtils.sort_locations(list(locations), ["x", "y"], timeBudget=0)
+        self.assertEqual(result[:6], [locations[i] for i in [0, 4, 8, 9, 5, 1]])
+        self.assertEqual(len(result), len(locations))
+
+        # attracted by y they are sorted row by row
+        result = PathUtils.sort_locations(list(locations), ["x", "y"], ["y"], timeBudget=0)
+        self.assertEqual(result[:6], [locations[i] for i in [0, 1, 2, 3, 7, 6]])
+
+    def test04(self):
+        """Test PathUtils sort_locations tour refinement"""
+
+        locations = [{"x": (i * 37) % 101 * 1.0, "y": (i * 53) % 97 * 1.0} for i in range(200)]
+
+        def length(tour):
+            return sum(
+                ((a["x"] - b["x"]) ** 2 + (a["y"] - b["y"]) ** 2) ** 0.5
+                for a, b in zip(tour, tour[1:])
+            )
+
+        greedy = PathUtils.sort_locations(list(locations), ["x", "y"], timeBudget=0)
+        refined = PathUtils.sort_locations(list(locations), ["x", "y"], timeBudget=5)
+        self.assertEqual(refined[0], greedy[0])
+        self.assertEqual(sorted(map(id, refined)), sorted(map(id, locations)))
+        self.assertLessEqual(length(refined), length(greedy))
+
+    def test05(self):
+        """Test PathUtils sort_wires"""
+
+        V = FreeCAD.Vector
+        begins = [V(10, 0, 0), V(20, 0, 0), V(0, 5, 0), V(0, 10, 0)]
+        ends = [V(20, 1, 0), V(30, 0, 0), V(0, 0, 0), V(9, 0, 0)]
+
+        # the wire ending at the origin is entered at its end and reversed
+        result = PathUtils.sort_wires(begins, ends, timeBudget=0)
+        self.assertEqual(result, [(2, True), (3, False), (0, False), (1, False)])
+
+        # equally close wires are taken in their order
+        result = PathUtils.sort_wires(begins, ends, reversible=False, timeBudget=0)
+        self.assertEqual(result, [(2, False), (0, False), (1, False), (3, False)])
+
+        # refinement keeps all wires
+        result = PathUtils.sort_wires(begins * 20, ends * 20, timeBudget=5)
+        self.assertEqual(sorted(i for i, _ in result), list(range(80)))
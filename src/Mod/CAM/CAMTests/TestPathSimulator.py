@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+
+import Part
+import Path
+import Path.Main.Simulator as Simulator
+
+from CAMTests.PathTestUtils import PathTestBase
+from FreeCAD import Vector
+
+
+class TestPathSimulator(PathTestBase):
+    """Unit tests for the headless voxel simulation."""
+
+    def setUp(self):
+        self.stock = Part.makeBox(100, 100, 10)
+        self.simulation = Simulator.VoxelSimulation()
+        self.simulation.begin(self.stock, 0.1)
+
+    def test00(self):
+        """Verify arcs are broken into moves on the arc."""
+        cmd = Path.Command("G2", {"X": 50, "Y": 40, "Z": 5, "I": 0, "J": -10})
+        commands = self.simulation.arcCommands(cmd, Vector(40, 50, 10))
+        self.assertTrue(len(commands) > 1)
+        for c in commands:
+            self.assertEqual(c.Name, "G1")
+            self.assertRoughly(math.hypot(c.x - 40, c.y - 40), 10)
+        self.assertCoincide(commands[-1].Placement.Base, Vector(50, 40, 5))
+
+    def test01(self):
+        """Verify drill cycles are expanded."""
+        drill = Path.Command("G81", {"X": 10, "Y": 20, "Z": -3, "R": 2})
+        self.assertEqual(len(self.simulation.commandsFor(drill)), 4)
+        self.assertEqual(len(self.simulation.commandsFor(drill)), 3)
+        self.simulation.commandsFor(Path.Command("G0", {"Z": 20}))
+        self.assertEqual(len(self.simulation.commandsFor(drill)), 4)
+        self.assertEqual(self.simulation.commandsFor(Path.Command("G4", {"P": 1})), [])
+
+    def test02(self):
+        """Verify the removed volume of a slot."""
+        self.simulation.setTool(Part.makeCylinder(2, 20), 0.1)
+        volume = self.simulation.volume()
+        self.assertRoughly(volume, self.stock.Volume, self.stock.Volume * 0.02)
+
+        commands = Path.Path("G0 X10 Y50 Z20\nG1 Z5\nG1 X90").Commands
+        self.assertEqual(self.simulation.applyCommands(commands), 3)
+        self.assertCoincide(self.simulation.position.Base, Vector(90, 50, 5))
+
+        slot = 80 * 4 * 5 + math.pi * 2 * 2 * 5
+        removed = volume - self.simulation.volume()
+        self.assertRoughly(removed, slot, slot * 0.15)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import array
+import importlib.util
+import shutil
+import tempfile
+import types
+import unittest
+
+import Path.Op.SurfaceSupport as PathSurfaceSupport
+
+from CAMTests.PathTestUtils import PathTestBase
+
+if importlib.util.find_spec("ocl") or importlib.util.find_spec("opencamlib"):
+    import Path.Op.Surface as PathSurface
+else:
+    PathSurface = None
+
+
+def _squareTile(shared, tile):
+    (start, stop) = tile
+    return [(v, v * v) for v in shared[start:stop]]
+
+
+class _FakeOcl:
+    """Minimal stand in for the ocl module, to test the STL cache without OpenCamLib."""
+
+    class STLSurf:
+        def __init__(self):
+            self.triangles = []
+
+        def addTriangle(self, t):
+            self.triangles.append(t)
+
+    @staticmethod
+    def Triangle(p1, p2, p3):
+        return (p1, p2, p3)
+
+    @staticmethod
+    def Point(x, y, z):
+        return (x, y, z)
+
+
+class TestPathSurfaceSupport(PathTestBase):
+    """Unit tests for the scan tile support functions of the 3D Surface and Waterline operations."""
+
+    def test00(self):
+        """Verify scan tiles cover all items in order."""
+        self.assertEqual(PathSurfaceSupport.makeScanTiles(0, 4), [])
+        self.assertEqual(PathSurfaceSupport.makeScanTiles(3, 8), [(0, 1), (1, 2), (2, 3)])
+
+        tiles = PathSurfaceSupport.makeScanTiles(103, 4)
+        self.assertEqual(len(tiles), 16)
+        self.assertEqual(tiles[0][0], 0)
+        self.assertEqual(tiles[-1][1], 103)
+        for t1, t2 in zip(tiles, tiles[1:]):
+            self.assertEqual(t1[1], t2[0])
+
+    def test01(self):
+        """Verify scan tile results are returned in tile order."""
+        items = list(range(50))
+        expected = [(v, v * v) for v in items]
+        tiles = PathSurfaceSupport.makeScanTiles(len(items), 3)
+
+        for workers in (1, 3):
+            results = PathSurfaceSupport.runScanTiles(_squareTile, items, tiles, workers)
+            self.assertEqual([r for tile in results for r in tile], expected)
+
+    def test02(self):
+        """Verify the STL cache reuses and evicts STL objects."""
+        facets = array.array("d", range(18))
+        made = []
+
+        def makeFacets():
+            made.append(True)
+            return facets
+
+        cache = PathSurfaceSupport.STLCache(2)
+        stl = cache.getSTL(("model", "a", 0.01), makeFacets, _FakeOcl)
+        self.assertEqual(len(stl.triangles), 2)
+        self.assertEqual(stl.triangles[1][2], (15.0, 16.0, 17.0))
+        self.assertIs(cache.getSTL(("model", "a", 0.01), makeFacets, _FakeOcl), stl)
+        self.assertEqual(len(made), 1)
+
+        # a different tolerance is a different STL object
+        cache.getSTL(("model", "a", 0.02), makeFacets, _FakeOcl)
+        cache.getSTL(("model", "a", 0.01), makeFacets, _FakeOcl)
+        cache.getSTL(("model", "b", 0.01), makeFacets, _FakeOcl)
+        self.assertEqual(len(made), 3)
+        # the least recently used one is evicted
+        self.assertNotIn(("model", "a", 0.02), cache.stls)
+        self.assertIn(("model", "a", 0.01), cache.stls)
+
+        # size 0 disables the cache
+        cache.setLimits(0)
+        self.assertEqual(len(cache.stls), 0)
+        cache.getSTL(("model", "a", 0.01), makeFacets, _FakeOcl)
+        self.assertEqual(len(cache.stls), 0)
+        self.assertEqual(len(made), 4)
+
+    def test03(self):
+        """Verify the STL cache reads triangles stored by another cache from disk."""
+        directory = tempfile.mkdtemp()
+        try:
+            facets = array.array("d", range(9))
+            key = ("model", "a", 0.01)
+            PathSurfaceSupport.STLCache(2, directory).getSTL(key, lambda: facets, _FakeOcl)
+
+            def makeFacets():
+                self.fail("triangles should be read from the cache directory")
+
+            stl = PathSurfaceSupport.STLCache(2, directory).getSTL(key, makeFacets, _FakeOcl)
+            self.assertEqual(stl.triangles, [((0.0, 1.0, 2.0), (3.0, 4.0, 5.0), (6.0, 7.0, 8.0))])
+        finally:
+            shutil.rmtree(directory)
+
+    @unittest.skipIf(PathSurface is None, "OpenCamLib is not installed")
+    def test04(self):
+        """Verify the Surface drop cutter scans return the same points in one process and pooled."""
+        ocl = PathSurface.ocl
+        stl = ocl.STLSurf()
+        stl.addTriangle(ocl.Triangle(ocl.Point(0, 0, 0), ocl.Point(20, 0, 2), ocl.Point(0, 20, 4)))
+        # the drop cutter does not keep a reference to the STL and cutter objects
+        cutter = ocl.CylCutter(2.0, 10.0)
+        pdc = ocl.PathDropCutter()
+        pdc.setSTL(stl)
+        pdc.setCutter(cutter)
+        pdc.setZ(-1.0)
+        pdc.setSampling(0.5)
+        scanItems = [("Line", (0.0, y), (20.0, y)) for y in range(0, 20, 2)]
+        scanItems.append(("Arc", ((5.0, 0.0, 0.0), (0.0, 5.0, 0.0), (0.0, 0.0, 0.0)), True))
+
+        proxy = PathSurface.ObjectSurface.__new__(PathSurface.ObjectSurface)
+        scans = {}
+        for workers in (1, 3):
+            obj = types.SimpleNamespace(ScanWorkers=workers)
+            scans[workers] = [
+                [(p.x, p.y, p.z) for p in scan]
+                for scan in proxy._planarDropCutScans(obj, pdc, scanItems)
+            ]
+        self.assertEqual(len(scans[1]), len(scanItems))
+        self.assertEqual(scans[3], scans[1])
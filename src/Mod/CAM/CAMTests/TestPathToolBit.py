@@ -24,6 +24,7 @@ import Path.Tool.Bit as PathToolBit
 import CAMTests.PathTestUtils as PathTestUtils
 import glob
 import os
+import tempfile
 
 TestToolDir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "Tools")
 TestInvalidDir = os.path.join(
@@ -151,3 +152,28 @@ class TestPathToolBit(PathTestUtils.PathTestBase):
         path = PathToolBit.findToolBit(testToolBit())
         self.assertIsNot(path, None)
         self.assertEqual(path, testToolBit())
+
+    def test30(self):
+        """Find tool files in sub directories and files added later on"""
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "Shape", "sub", "dir"))
+            os.makedirs(os.path.join(root, "Bit"))
+            shape = os.path.join(root, "Shape", "sub", "dir", TestToolShapeName)
+            open(shape, "w").close()
+            bit = os.path.join(root, "Bit", TestToolBitName)
+
+            self.assertEqual(PathToolBit.findToolShape(TestToolShapeName, bit), shape)
+            self.assertEqual(
+                PathToolBit.findToolShape(os.path.join("dir", TestToolShapeName), bit), shape
+            )
+            self.assertIsNone(PathToolBit.findToolShape("added.fcstd", bit))
+
+            stats = PathToolBit.toolFileIndexStats()
+            added = os.path.join(root, "Shape", "sub", "added.fcstd")
+            open(added, "w").close()
+            # don't depend on the file system's time stamp resolution
+            st = os.stat(os.path.dirname(added))
+            os.utime(os.path.dirname(added), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.assertEqual(PathToolBit.findToolShape("added.fcstd", bit), added)
+            self.assertEqual(PathToolBit.toolFileIndexStats()["builds"], stats["builds"] + 1)
+        PathToolBit.clearToolFileIndex()
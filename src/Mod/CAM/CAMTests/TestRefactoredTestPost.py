@@ -21,6 +21,9 @@
 # *                                                                         *
 # ***************************************************************************
 
+import os
+import tempfile
+
 import FreeCAD
 
 import Path
@@ -130,6 +133,97 @@ class TestRefactoredTestPost(PathTestUtils.PathTestBase):
     #
     #############################################################################
 
+    def test00010(self):
+        """Test that the fast parse produces the same G-code as the generic parse."""
+        path = [
+            Path.Command("(comment)"),
+            Path.Command("G90"),
+            Path.Command("G0 X10 Y20 Z30"),
+            Path.Command("G1 X10 Y30 Z30 F123.456"),
+            Path.Command("G1 X10 Y30 Z20 F123.456"),
+            Path.Command("G1 Y40 F100"),
+            Path.Command("G2 X20 Y40 I5 J0 K0 F100"),
+            Path.Command("G1 A45 F50"),
+            Path.Command("G4 P2"),
+            Path.Command("M6 T2"),
+            Path.Command("M3 S3000"),
+            Path.Command("G91"),
+            Path.Command("G0 X-1 Y-1"),
+            Path.Command("G90"),
+            Path.Command("G99"),
+            Path.Command("G81 X1 Y2 Z-3 R4 F50"),
+            Path.Command("G83 X5 Y6 Z-7 R8 Q1 F50"),
+            Path.Command("G80"),
+            Path.Command("G0 X0 Y0 Z30"),
+        ]
+        self.profile_op.Path = Path.Path(path)
+        for args in (
+            "",
+            "--comments --line-numbers",
+            "--axis-modal --modal",
+            "--inches --feed-precision=2",
+            "--translate_drill --comments",
+            "--wait-for-spindle=1.5 --no-tlo --no-tool_change --comments",
+        ):
+            self.job.PostProcessorArgs = args
+            self.post.values["FAST_PARSE"] = False
+            expected = self.post.export()[0][1]
+            self.post.reinitialize()
+            self.assertTrue(self.post.values["FAST_PARSE"])
+            self.assertEqual(self.post.export()[0][1], expected, args)
+            self.post.reinitialize()
+
+    #############################################################################
+
+    def test00020(self):
+        """Test that export_to_files writes the same G-code as export."""
+        self.profile_op.Path = Path.Path(
+            [Path.Command("G0 X10 Y20 Z30"), Path.Command("G1 X20 Y30 Z20 F100")]
+        )
+        self.job.PostProcessorArgs = "--comments"
+        expected = self.post.export()
+        self.assertTrue(self.post.streaming_export)
+        self.post.reinitialize()
+
+        reported = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            def get_filename(partname):
+                return os.path.join(tmpdir, f"{partname}.nc")
+
+            def progress(done, count, label):
+                reported.append((done, count, label))
+
+            written = self.post.export_to_files(get_filename, progress)
+            self.assertEqual(len(written), len(expected))
+            for filename, (partname, gcode) in zip(written, expected):
+                self.assertEqual(filename, get_filename(partname))
+                with open(filename, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), gcode)
+        self.assertTrue(reported)
+        self.assertIn("Profile", [label for _, _, label in reported])
+
+    def test00021(self):
+        """Test that export_to_files removes the partial file if postprocessing fails."""
+        self.profile_op.Path = Path.Path(
+            [Path.Command("G0 X10 Y20 Z30"), Path.Command("G1 X20 Y30 Z20 F100")]
+        )
+        self.job.PostProcessorArgs = ""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            def get_filename(partname):
+                return os.path.join(tmpdir, f"{partname}.nc")
+
+            def progress(done, count, label):
+                raise RuntimeError(f"cancelled after {label}")
+
+            with self.assertRaises(RuntimeError):
+                self.post.export_to_files(get_filename, progress)
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    #############################################################################
+
     def test00100(self):
         """Test axis modal.
 
@@ -582,6 +582,24 @@ M5
         )
         self.assertEqual(gcode.splitlines()[18], "M3 P90")
 
+    def test_spindle_percent_several_commands(self):
+        """Test spindle speed conversion of every command of a path"""
+
+        commands = [
+            Path.Command("M3 S3600"),
+            Path.Command("G1 X10 Y10 Z-1"),
+            Path.Command("M3 S1800"),
+            Path.Command("G1 X20"),
+            Path.Command("M4 S1200"),
+        ]
+        gcode = self.get_gcode(
+            commands, "--machine=A350 --toolhead=50W_CNC --spindle-percent --no-header"
+        )
+        self.assertEqual(
+            gcode.splitlines()[18:23],
+            ["M3 P30", "G1 X10.000 Y10.000 Z-1.000", "M3 P15", "G1 X20.000", "M4 P10"],
+        )
+
     def test_comment(self):
         """Test comment"""
 
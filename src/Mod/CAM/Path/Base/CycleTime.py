@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import Path
+
+__title__ = "CAM Cycle Time"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Kinematic estimation of the time it takes a machine to run a path."
+
+"""
+The estimation follows the path the way a trajectory planner does. Every move accelerates and
+decelerates with the limit of the slowest axis involved, arcs are limited by their centripetal
+acceleration and a move blends into the next one with a speed depending on the angle between
+them. Drill cycles are expanded into their rapid, feed, peck and dwell moves.
+"""
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+INF = float("inf")
+
+# distance the drill retracts between pecks of a G73 and stops above the last peck of a G83
+PeckClearance = 0.254
+
+CmdMoveRapid = frozenset(Path.Geom.CmdMoveRapid)
+CmdMoveLinear = frozenset(Path.Geom.CmdMoveRapid + Path.Geom.CmdMoveStraight)
+CmdMoveArc = frozenset(Path.Geom.CmdMoveArc)
+CmdMoveCW = frozenset(Path.Geom.CmdMoveCW)
+CmdMoveDrill = frozenset(Path.Geom.CmdMoveDrill)
+CmdDwell = frozenset(["G4", "G04"])
+
+# arc planes, given as the indexes of the two plane axes and of the normal axis
+Planes = {"G17": (0, 1, 2), "G18": (2, 0, 1), "G19": (1, 2, 0)}
+
+
+class MachineLimits:
+    """Rates and accelerations of the machine used to estimate cycle times.
+    Rates are in mm/s and accelerations in mm/s^2. An acceleration of 0 lets the axis
+    reach any rate instantly."""
+
+    __slots__ = (
+        "HorizFeed",
+        "VertFeed",
+        "HorizRapid",
+        "VertRapid",
+        "AccelX",
+        "AccelY",
+        "AccelZ",
+    )
+
+    def __init__(self, hFeed, vFeed, hRapid=0.0, vRapid=0.0, acceleration=(0.0, 0.0, 0.0)):
+        self.HorizFeed = hFeed
+        self.VertFeed = vFeed
+        # without rapid rates rapid moves are timed with the feed rates
+        self.HorizRapid = hRapid if hRapid > 0 else hFeed
+        self.VertRapid = vRapid if vRapid > 0 else vFeed
+        self.AccelX, self.AccelY, self.AccelZ = acceleration
+
+    def _limits(self):
+        """Returns the limits as a tuple, unlimited accelerations are infinite."""
+        return (
+            self.HorizFeed,
+            self.VertFeed,
+            self.HorizRapid,
+            self.VertRapid,
+            self.AccelX if self.AccelX > 0 else INF,
+            self.AccelY if self.AccelY > 0 else INF,
+            self.AccelZ if self.AccelZ > 0 else INF,
+        )
+
+
+def limitsForToolController(tc, acceleration=None):
+    """limitsForToolController(tc, acceleration=None) ... returns the MachineLimits for the rates
+    of the tool controller. The acceleration defaults to the one of the preferences."""
+    if acceleration is None:
+        acceleration = Path.Preferences.machineAcceleration()
+    return MachineLimits(
+        tc.HorizFeed.Value,
+        tc.VertFeed.Value,
+        tc.HorizRapid.Value,
+        tc.VertRapid.Value,
+        acceleration,
+    )
+
+
+def formatCycleTime(seconds):
+    """formatCycleTime(seconds) ... returns seconds as HH:MM:SS"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%02d:%02d:%02d" % (hours, minutes, seconds)
+
+
+def parseCycleTime(cycleTime):
+    """parseCycleTime(cycleTime) ... returns the seconds of a HH:MM:SS string, None if the string
+    is not a time."""
+    try:
+        return sum(x * int(t) for x, t in zip([1, 60, 3600], reversed(cycleTime.split(":"))))
+    except Exception:
+        return None
+
+
+def _moveTime(length, vIn, vOut, rate, accel):
+    """Time of a move with a trapezoidal velocity profile, entering with vIn and leaving with
+    vOut. Both have to be lower than rate."""
+    if accel == INF:
+        return length / rate
+    dAcc = (rate * rate - vIn * vIn) / (2 * accel)
+    dDec = (rate * rate - vOut * vOut) / (2 * accel)
+    if dAcc + dDec <= length:
+        return (2 * rate - vIn - vOut) / accel + (length - dAcc - dDec) / rate
+    peak = math.sqrt(accel * length + (vIn * vIn + vOut * vOut) / 2)
+    if peak < vIn or peak < vOut:
+        # too short to change the speed as required, assume a constant change
+        return 2 * length / (vIn + vOut)
+    return (2 * peak - vIn - vOut) / accel
+
+
+def _acceleration(ux, uy, uz, limits):
+    """Acceleration along the unit direction, limited by the slowest axis."""
+    accel = INF
+    if ux:
+        accel = limits[4] / abs(ux)
+    if uy:
+        accel = min(accel, limits[5] / abs(uy))
+    if uz:
+        accel = min(accel, limits[6] / abs(uz))
+    return accel
+
+
+def _rapidRate(ux, uy, uz, limits):
+    """Rapid rate along the unit direction, every axis is limited to its own rate."""
+    rate = INF
+    xy = math.hypot(ux, uy)
+    if xy > Path.Geom.Tolerance:
+        rate = limits[2] / xy
+    if uz:
+        rate = min(rate, limits[3] / abs(uz))
+    return rate
+
+
+def _pointTime(dx, dy, dz, feed, limits):
+    """Time of a move from stand still to stand still, a rapid move if feed is 0."""
+    length = math.sqrt(dx * dx + dy * dy + dz * dz)
+    if length < Path.Geom.Tolerance:
+        return 0.0
+    ux, uy, uz = dx / length, dy / length, dz / length
+    rate = feed if feed > 0 else _rapidRate(ux, uy, uz, limits)
+    return _moveTime(length, 0.0, 0.0, rate, _acceleration(ux, uy, uz, limits))
+
+
+def _arcMove(cw, plane, start, end, offset, feed, limits):
+    """Returns length, rate, acceleration and the start and end directions of an arc.
+    Returns None for degenerated arcs."""
+    a, b, n = plane
+    ca = start[a] + offset[a]
+    cb = start[b] + offset[b]
+    ra, rb = start[a] - ca, start[b] - cb
+    radius = math.hypot(ra, rb)
+    if radius < Path.Geom.Tolerance:
+        return None
+    ea, eb = end[a] - ca, end[b] - cb
+    sweep = math.atan2(eb, ea) - math.atan2(rb, ra)
+    if cw:
+        sweep = -sweep
+    sweep %= 2 * math.pi
+    if sweep < Path.Geom.Tolerance:
+        sweep = 2 * math.pi
+    planar = radius * sweep
+    dn = end[n] - start[n]
+    length = math.hypot(planar, dn)
+
+    # tangents in the plane, scaled to leave room for the helical component
+    scale = (-1 if cw else 1) * planar / length
+    sDir = [0.0, 0.0, 0.0]
+    eDir = [0.0, 0.0, 0.0]
+    sDir[n] = eDir[n] = dn / length
+    sDir[a], sDir[b] = -rb / radius * scale, ra / radius * scale
+    er = math.hypot(ea, eb) or radius
+    eDir[a], eDir[b] = -eb / er * scale, ea / er * scale
+
+    axis = (limits[4], limits[5], limits[6])
+    accel = min(axis[a], axis[b])
+    rate = feed
+    if accel != INF:
+        # centripetal acceleration
+        rate = min(rate, math.sqrt(accel * radius))
+    return (length, rate, accel, sDir, eDir)
+
+
+def _drillTime(name, x, y, z, nx, ny, depth, height, peck, dwell, feed, initial, limits):
+    """Returns the time of a drill cycle and the height the drill is retracted to."""
+    seconds = 0.0
+    if z < height:
+        seconds += _pointTime(0.0, 0.0, height - z, 0.0, limits)
+        z = height
+    retract = z if initial else height
+    seconds += _pointTime(nx - x, ny - y, 0.0, 0.0, limits)
+    seconds += _pointTime(0.0, 0.0, height - z, 0.0, limits)
+
+    total = height - depth
+    if total <= 0:
+        return (seconds, retract)
+
+    if name in ["G73", "G83"] and peck > 0:
+        pos = nxt = 0.0
+        while True:
+            nxt = min(nxt + peck, total)
+            seconds += _pointTime(0.0, 0.0, nxt - pos, feed, limits)
+            if nxt >= total:
+                break
+            if name == "G83":
+                # back to the retract plane and down again close to the last peck
+                pos = max(nxt - PeckClearance, 0.0)
+                seconds += _pointTime(0.0, 0.0, nxt, 0.0, limits)
+                seconds += _pointTime(0.0, 0.0, pos, 0.0, limits)
+            else:
+                pos = max(nxt - PeckClearance, 0.0)
+                seconds += _pointTime(0.0, 0.0, nxt - pos, 0.0, limits)
+    else:
+        seconds += _pointTime(0.0, 0.0, total, feed, limits)
+
+    if name == "G82" and dwell > 0:
+        seconds += dwell
+    if name == "G85":
+        seconds += _pointTime(0.0, 0.0, total, feed, limits)
+        seconds += _pointTime(0.0, 0.0, retract - height, 0.0, limits)
+    else:
+        seconds += _pointTime(0.0, 0.0, retract - depth, 0.0, limits)
+    return (seconds, retract)
+
+
+def estimate(commands, limits):
+    """estimate(commands, limits) ... returns the seconds it takes to run commands on a machine
+    with the given MachineLimits.
+    Moves take their feed rate from the path, moves without feed rate use the horizontal or
+    vertical feed of limits. A move is only timed once the next command is known, because the
+    speed at which it blends into the next move depends on the angle between them."""
+
+    lim = limits._limits()
+    hFeed, vFeed = lim[0], lim[1]
+    if hFeed <= 0 or vFeed <= 0:
+        return 0.0
+
+    x = y = z = 0.0
+    feed = 0.0
+    plane = Planes["G17"]
+    initial = True
+    cycle = {"Z": 0.0, "R": 0.0, "Q": 0.0, "P": 0.0}
+
+    # local names keep the loop fast
+    sqrt = math.sqrt
+    moveTime = _moveTime
+    tolerance = Path.Geom.Tolerance
+    linear, arcs, rapids = CmdMoveLinear, CmdMoveArc, CmdMoveRapid
+
+    seconds = 0.0
+    # the pending move, which is timed once the next move is known
+    pLen = 0.0
+    pRate = pAccel = vIn = 0.0
+    pDir = None
+
+    for cmd in commands:
+        name = cmd.Name
+
+        if name in linear:
+            params = cmd.Parameters
+            nx = params.get("X", x)
+            ny = params.get("Y", y)
+            nz = params.get("Z", z)
+            if "F" in params:
+                feed = params["F"]
+            dx, dy, dz = nx - x, ny - y, nz - z
+            x, y, z = nx, ny, nz
+            length = sqrt(dx * dx + dy * dy + dz * dz)
+            if length < tolerance:
+                continue
+            ux, uy, uz = dx / length, dy / length, dz / length
+            if name in rapids:
+                rate = _rapidRate(ux, uy, uz, lim)
+            elif feed > 0:
+                rate = feed
+            else:
+                rate = vFeed if dz else hFeed
+            accel = _acceleration(ux, uy, uz, lim)
+            sDir = eDir = (ux, uy, uz)
+
+        elif name in arcs:
+            params = cmd.Parameters
+            if "F" in params:
+                feed = params["F"]
+            start = (x, y, z)
+            x = params.get("X", x)
+            y = params.get("Y", y)
+            z = params.get("Z", z)
+            offset = (params.get("I", 0.0), params.get("J", 0.0), params.get("K", 0.0))
+            arc = _arcMove(name in CmdMoveCW, plane, start, (x, y, z), offset, feed or hFeed, lim)
+            if arc is None:
+                continue
+            length, rate, accel, sDir, eDir = arc
+
+        else:
+            if name in CmdMoveDrill:
+                params = cmd.Parameters
+                if "F" in params:
+                    feed = params["F"]
+                for p in cycle:
+                    if p in params:
+                        cycle[p] = params[p]
+                nx = params.get("X", x)
+                ny = params.get("Y", y)
+                extra, nz = _drillTime(
+                    name,
+                    x,
+                    y,
+                    z,
+                    nx,
+                    ny,
+                    cycle["Z"],
+                    cycle["R"],
+                    cycle["Q"],
+                    cycle["P"],
+                    feed or vFeed,
+                    initial,
+                    lim,
+                )
+                x, y, z = nx, ny, nz
+            elif name in CmdDwell:
+                extra = cmd.Parameters.get("P", 0.0)
+            elif name.startswith("M"):
+                # the machine comes to a stand still for spindle, coolant and tool changes
+                extra = 0.0
+            else:
+                if name in Planes:
+                    plane = Planes[name]
+                elif name in ["G98", "G99"]:
+                    initial = name == "G98"
+                continue
+
+            if pLen:
+                seconds += moveTime(pLen, vIn, 0.0, pRate, pAccel)
+                pLen = 0.0
+            seconds += extra
+            continue
+
+        # time the pending move, it blends into this one
+        if pLen:
+            cos = pDir[0] * sDir[0] + pDir[1] * sDir[1] + pDir[2] * sDir[2]
+            vOut = min(pRate, rate) * cos if cos > 0 else 0.0
+            if pAccel != INF:
+                vOut = min(vOut, sqrt(vIn * vIn + 2 * pAccel * pLen))
+            seconds += moveTime(pLen, vIn, vOut, pRate, pAccel)
+            vIn = vOut
+        else:
+            vIn = 0.0
+        pLen, pRate, pAccel, pDir = length, rate, accel, eDir
+
+    if pLen:
+        seconds += moveTime(pLen, vIn, 0.0, pRate, pAccel)
+    return seconds
@@ -38,26 +38,35 @@ else:
 
 
 class MachineState:
-    def __init__(self):
-        self.WCSLIST = [
-            "G53",
-            "G54",
-            "G55",
-            "G56",
-            "G57",
-            "G58",
-            "G59",
-            "G59.1",
-            "G59.2",
-            "G59.3",
-            "G59.4",
-            "G59.5",
-            "G59.6",
-            "G59.7",
-            "G59.8",
-            "G59.9",
-        ]
+    """Tracks the position and the modal state of the machine while commands are processed.
+    The state is kept in slots and addCommand compares the fields it touches, which keeps
+    the tracker cheap enough to follow every command of a path."""
+
+    __slots__ = ("X", "Y", "Z", "A", "B", "C", "F", "Coolant", "WCS", "Spindle", "S", "T")
+
+    WCSLIST = [
+        "G53",
+        "G54",
+        "G55",
+        "G56",
+        "G57",
+        "G58",
+        "G59",
+        "G59.1",
+        "G59.2",
+        "G59.3",
+        "G59.4",
+        "G59.5",
+        "G59.6",
+        "G59.7",
+        "G59.8",
+        "G59.9",
+    ]
+
+    # command parameters which are part of the machine state
+    PARAMETERS = ("X", "Y", "Z", "A", "B", "C", "F", "S", "T")
 
+    def __init__(self):
         self.X = 0.0  #: float = field(default=0)
         self.Y = 0.0  #: float = field(default=0)
         self.Z = 0.0  #: float = field(default=0)
@@ -73,36 +82,40 @@ class MachineState:
 
     def addCommand(self, command):
         """Processes a command and updates the internal state of the machine. Returns true if the command has alterned the machine state"""
-        oldstate = self.getState()
-        if command.Name == "M6":
-            self.T = int(command.Parameters["T"])
-            return not oldstate == self.getState()
-
-        if command.Name in ["M3", "M4"]:
-            self.S = command.Parameters["S"]
-            self.Spindle = "CW" if command.Name == "M3" else "CCW"
-            return not oldstate == self.getState()
-
-        if command.Name in ["M2", "M5"]:
+        name = command.Name
+        if name == "M6":
+            tool = int(command.Parameters["T"])
+            changed = tool != self.T
+            self.T = tool
+            return changed
+
+        if name in ["M3", "M4"]:
+            speed = command.Parameters["S"]
+            spindle = "CW" if name == "M3" else "CCW"
+            changed = speed != self.S or spindle != self.Spindle
+            self.S = speed
+            self.Spindle = spindle
+            return changed
+
+        if name in ["M2", "M5"]:
+            changed = self.S != 0 or self.Spindle != "off"
             self.S = 0
             self.Spindle = "off"
-            return not oldstate == self.getState()
-
-        if command.Name in self.WCSLIST:
-            self.WCS = command.Name
-            return not oldstate == self.getState()
-
-        if command.Name in Path.Geom.CmdMoveDrill:
-            oldZ = self.Z
-            for p in command.Parameters:
-                self.__setattr__(p, command.Parameters[p])
-            self.__setattr__("Z", oldZ)
-            return not oldstate == self.getState()
-
-        for p in command.Parameters:
-            self.__setattr__(p, command.Parameters[p])
-
-        return not oldstate == self.getState()
+            return changed
+
+        if name in self.WCSLIST:
+            changed = name != self.WCS
+            self.WCS = name
+            return changed
+
+        # drill cycles return to the initial height
+        skip = "Z" if name in Path.Geom.CmdMoveDrill else None
+        changed = False
+        for p, value in command.Parameters.items():
+            if p in self.PARAMETERS and p != skip and getattr(self, p) != value:
+                setattr(self, p, value)
+                changed = True
+        return changed
 
     def getState(self):
         """
@@ -27,6 +27,11 @@ import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import Path.Main.Stock as PathStock
 import PathScripts.PathUtils as PathUtils
+import math
+
+from lazy_loader.lazy_loader import LazyLoader
+
+Part = LazyLoader("Part", globals(), "Part")
 
 if False:
     Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
@@ -44,6 +49,172 @@ def _vstr(v):
     return "-"
 
 
+def _segmentsTouch(ax, ay, bx, by, cx, cy, dx, dy, margin):
+    """Returns True if segment a-b intersects or comes closer than margin to segment c-d."""
+
+    def orient(px, py, qx, qy, rx, ry):
+        return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+    def dist(px, py, qx, qy, rx, ry):
+        # distance of p to segment q-r
+        ux, uy = rx - qx, ry - qy
+        length2 = ux * ux + uy * uy
+        t = 0.0 if length2 == 0 else ((px - qx) * ux + (py - qy) * uy) / length2
+        t = min(1.0, max(0.0, t))
+        return math.hypot(qx + t * ux - px, qy + t * uy - py)
+
+    o1 = orient(ax, ay, bx, by, cx, cy)
+    o2 = orient(ax, ay, bx, by, dx, dy)
+    o3 = orient(cx, cy, dx, dy, ax, ay)
+    o4 = orient(cx, cy, dx, dy, bx, by)
+    if o1 * o2 < 0 and o3 * o4 < 0:
+        return True
+    return (
+        dist(ax, ay, cx, cy, dx, dy) < margin
+        or dist(bx, by, cx, cy, dx, dy) < margin
+        or dist(cx, cy, ax, ay, bx, by) < margin
+        or dist(dx, dy, ax, ay, bx, by) < margin
+    )
+
+
+class PrismaticBoundary:
+    """class PrismaticBoundary...
+    Boundary solid which is an extrusion of its cross section along the Z axis, like most stocks.
+    The cross section is discretized once into polygons and their segments are stored in a grid,
+    which allows classifying a move as inside or outside without any boolean operation.
+    Moves closer to the boundary than the discretization error are not classified.
+    Use prismaticBoundary() to create an instance for a shape.
+    """
+
+    def __init__(self, wires, zMin, zMax, deflection=0.01):
+        self.zMin = zMin
+        self.zMax = zMax
+        self.margin = 2 * deflection
+
+        self.segments = []
+        for wire in wires:
+            pts = wire.discretize(Deflection=deflection)
+            for p0, p1 in zip(pts, pts[1:]):
+                self.segments.append((p0.x, p0.y, p1.x, p1.y))
+
+        xs = [c for s in self.segments for c in (s[0], s[2])]
+        ys = [c for s in self.segments for c in (s[1], s[3])]
+        self.xMin, self.yMin = min(xs), min(ys)
+        width = max(xs) - self.xMin
+        height = max(ys) - self.yMin
+        # about one segment per cell
+        self.cell = max(math.sqrt(width * height / len(self.segments)), self.margin, 1e-3)
+
+        self.grid = {}
+        self.rows = {}
+        for i, (x0, y0, x1, y1) in enumerate(self.segments):
+            c0, r0 = self._index(min(x0, x1), min(y0, y1))
+            c1, r1 = self._index(max(x0, x1), max(y0, y1))
+            for r in range(r0, r1 + 1):
+                self.rows.setdefault(r, []).append(i)
+                for c in range(c0, c1 + 1):
+                    self.grid.setdefault((c, r), []).append(i)
+
+    def _index(self, x, y):
+        return (
+            int(math.floor((x - self.xMin) / self.cell)),
+            int(math.floor((y - self.yMin) / self.cell)),
+        )
+
+    def _segmentsIn(self, xMin, yMin, xMax, yMax):
+        """Returns the indexes of all segments in the grid cells overlapping the box."""
+        c0, r0 = self._index(xMin, yMin)
+        c1, r1 = self._index(xMax, yMax)
+        found = set()
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > len(self.grid):
+            for c, r in self.grid:
+                if c0 <= c <= c1 and r0 <= r <= r1:
+                    found.update(self.grid[(c, r)])
+            return found
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                found.update(self.grid.get((c, r), ()))
+        return found
+
+    def isInside(self, x, y):
+        """isInside(x, y) ... returns True if the point is inside the cross section polygons."""
+        inside = False
+        for i in self.rows.get(self._index(x, y)[1], ()):
+            x0, y0, x1, y1 = self.segments[i]
+            if (y0 > y) != (y1 > y):
+                if x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+                    inside = not inside
+        return inside
+
+    def classify(self, cmd, pos):
+        """classify(cmd, pos) ... returns True if the move of cmd starting at pos is completely
+        inside the boundary, False if it is completely outside, and None if the move might cross
+        the boundary or is not a move that can be classified."""
+        params = cmd.Parameters
+        x0, y0, z0 = pos.x, pos.y, pos.z
+        x1 = params.get("X", x0)
+        y1 = params.get("Y", y0)
+        z1 = params.get("Z", z0)
+
+        if cmd.Name in Path.Geom.CmdMoveArc:
+            cx = x0 + params.get("I", 0.0)
+            cy = y0 + params.get("J", 0.0)
+            r = math.hypot(x0 - cx, y0 - cy)
+            box = (cx - r, cy - r, cx + r, cy + r)
+            line = None
+        elif cmd.Name in Path.Geom.CmdMoveStraight or cmd.Name in Path.Geom.CmdMoveRapid:
+            if Path.Geom.pointsCoincide(pos, FreeCAD.Vector(x1, y1, z1)):
+                return None
+            box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+            line = (x0, y0, x1, y1)
+        else:
+            return None
+
+        m = self.margin
+        zLo, zHi = min(z0, z1), max(z0, z1)
+        if zHi < self.zMin - m or zLo > self.zMax + m:
+            return False
+        if zLo < self.zMin + m or zHi > self.zMax - m:
+            return None
+
+        for i in self._segmentsIn(box[0] - m, box[1] - m, box[2] + m, box[3] + m):
+            # the box of an arc is only classified if no segment is close to it at all
+            if line is None or _segmentsTouch(*line, *self.segments[i], m):
+                return None
+        return self.isInside(x0, y0)
+
+
+def prismaticBoundary(shape, deflection=0.01):
+    """prismaticBoundary(shape, deflection=0.01) ... returns a PrismaticBoundary for shape, or None
+    if shape is not a solid extruded along the Z axis."""
+    if not shape.Solids:
+        return None
+    bb = shape.BoundBox
+    for face in shape.Faces:
+        surface = face.Surface
+        if isinstance(surface, Part.Plane):
+            if Path.Geom.isRoughly(abs(surface.Axis.z), 1):
+                z = face.BoundBox.ZMin
+                if Path.Geom.isRoughly(z, bb.ZMin, deflection) or Path.Geom.isRoughly(
+                    z, bb.ZMax, deflection
+                ):
+                    continue
+            elif Path.Geom.isRoughly(surface.Axis.z, 0):
+                continue
+        elif isinstance(surface, Part.Cylinder):
+            if Path.Geom.isRoughly(abs(surface.Axis.z), 1):
+                continue
+        elif isinstance(surface, Part.SurfaceOfExtrusion):
+            if Path.Geom.isRoughly(abs(surface.Direction.z), 1):
+                continue
+        return None
+
+    wires = shape.slice(FreeCAD.Vector(0, 0, 1), (bb.ZMin + bb.ZMax) / 2)
+    if not wires:
+        return None
+    return PrismaticBoundary(wires, bb.ZMin, bb.ZMax, deflection)
+
+
 class DressupPathBoundary(object):
     def __init__(self, obj, base, job):
         obj.addProperty(
@@ -196,6 +367,8 @@ class PathBoundary:
         )
         self.strG0ZclearanceHeight = Path.Command("G0", {"Z": self.clearanceHeight})
 
+        prismatic = prismaticBoundary(self.boundary)
+
         cmd = path.Commands[0]
         pos = cmd.Placement.Base  # bogus m/c position to create first edge
         bogusX = True
@@ -209,14 +382,24 @@ class PathBoundary:
                     bogusX = "X" not in cmd.Parameters
                 if bogusY:
                     bogusY = "Y" not in cmd.Parameters
-                edge = Path.Geom.edgeForCmd(cmd, pos)
+                included = prismatic.classify(cmd, pos) if prismatic else None
+                if included is None:
+                    edge = Path.Geom.edgeForCmd(cmd, pos)
+                    if edge:
+                        inside = edge.common(self.boundary).Edges
+                        outside = edge.cut(self.boundary).Edges
+                        if not self.inside:  # UI "inside boundary" param
+                            tmp = inside
+                            inside = outside
+                            outside = tmp
+                else:
+                    # the move stays clear of the boundary, it's completely on one side
+                    edge = cmd
+                    if included == self.inside:
+                        inside, outside = [cmd], []
+                    else:
+                        inside, outside = [], [cmd]
                 if edge:
-                    inside = edge.common(self.boundary).Edges
-                    outside = edge.cut(self.boundary).Edges
-                    if not self.inside:  # UI "inside boundary" param
-                        tmp = inside
-                        inside = outside
-                        outside = tmp
                     # it's really a shame that one cannot trust the sequence and/or
                     # orientation of edges
                     if 1 == len(inside) and 0 == len(outside):
@@ -44,6 +44,11 @@ else:
 
 translate = FreeCAD.Qt.translate
 
+# Tag solids, and in particular their fillets, only depend on the tag's dimensions. They are
+# built once at the origin and each tag gets a placed copy.
+_TagSolidCache = {}
+_TagSolidCacheSize = 64
+
 
 def debugEdge(edge, prefix, force=False):
     if force or Path.Log.getLevel(Path.Log.thisModule()) == Path.Log.Level.DEBUG:
@@ -133,6 +138,7 @@ class Tag:
         self.r1 = None
         self.r2 = None
         self.solid = None
+        self.boundBox = None
         self.z = None
 
     def fullWidth(self):
@@ -152,13 +158,37 @@ class Tag:
         self.toolRadius = R
         r1 = self.fullWidth() / 2
         self.r1 = r1
-        self.r2 = r1
+        key = (r1, self.height, self.angle, self.radius)
+        entry = _TagSolidCache.get(key)
+        if entry is None:
+            entry = self.createSolid(r1)
+            if len(_TagSolidCache) >= _TagSolidCacheSize:
+                _TagSolidCache.clear()
+            _TagSolidCache[key] = entry
+        solid, self.r2, self.actualHeight, self.realRadius, self.isSquare = entry
+        self.solid = solid.copy()
+        if not Path.Geom.isRoughly(0, R):  # testing is easier if the solid is not rotated
+            angle = -Path.Geom.getAngle(self.originAt(0)) * 180 / math.pi
+            Path.Log.debug("solid.rotate(%f)" % angle)
+            self.solid.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), angle)
+        orig = self.originAt(z - 0.01 * self.actualHeight)
+        Path.Log.debug("solid.translate(%s)" % orig)
+        self.solid.translate(orig)
+        self.boundBox = self.solid.BoundBox
+        self.boundBox.enlarge(Path.Geom.Tolerance)
+
+    def createSolid(self, r1):
+        """createSolid(r1) ... returns the tag's solid at the origin together with
+        (r2, actualHeight, realRadius, isSquare)."""
+        r2 = r1
+        actualHeight = self.height
+        isSquare = False
         height = self.height * 1.01
         radius = 0
         if Path.Geom.isRoughly(90, self.angle) and height > 0:
             # cylinder
-            self.isSquare = True
-            self.solid = Part.makeCylinder(r1, height)
+            isSquare = True
+            solid = Part.makeCylinder(r1, height)
             radius = min(min(self.radius, r1), self.height)
             Path.Log.debug("Part.makeCylinder(%f, %f)" % (r1, height))
         elif self.angle > 0.0 and height > 0.0:
@@ -175,26 +205,24 @@ class Tag:
                 # triangular
                 r2 = 0
                 height = r1 * tangens * 1.01
-                self.actualHeight = height
-            self.r2 = r2
+                actualHeight = height
             Path.Log.debug("Part.makeCone(%f, %f, %f)" % (r1, r2, height))
-            self.solid = Part.makeCone(r1, r2, height)
+            solid = Part.makeCone(r1, r2, height)
         else:
             # degenerated case - no tag
             Path.Log.debug("Part.makeSphere(%f / 10000)" % (r1))
-            self.solid = Part.makeSphere(r1 / 10000)
-        if not Path.Geom.isRoughly(0, R):  # testing is easier if the solid is not rotated
-            angle = -Path.Geom.getAngle(self.originAt(0)) * 180 / math.pi
-            Path.Log.debug("solid.rotate(%f)" % angle)
-            self.solid.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), angle)
-        orig = self.originAt(z - 0.01 * self.actualHeight)
-        Path.Log.debug("solid.translate(%s)" % orig)
-        self.solid.translate(orig)
+            solid = Part.makeSphere(r1 / 10000)
         radius = min(self.radius, radius)
-        self.realRadius = radius
         if not Path.Geom.isRoughly(0, radius):
+            # the fillet is applied before placing the solid, its shape does not depend on the
+            # tag's location and is shared by all tags of the same size
             Path.Log.debug("makeFillet(%.4f)" % radius)
-            self.solid = self.solid.makeFillet(radius, [self.solid.Edges[0]])
+            solid = solid.makeFillet(radius, [solid.Edges[0]])
+        return (solid, r2, actualHeight, radius, isSquare)
+
+    def overlaps(self, shape):
+        """overlaps(shape) ... returns False if shape cannot possibly touch the tag's solid."""
+        return self.boundBox.intersect(shape.BoundBox)
 
     def filterIntersections(self, pts, face):
         if (
@@ -259,6 +287,9 @@ class Tag:
             zLast = edge.valueAt(edge.LastParameter).z
             zMax = self.top()
             if isDefinitelySmaller(zFirst, zMax) or isDefinitelySmaller(zLast, zMax):
+                if not self.overlaps(edge):
+                    # edge passes the tag's footprint, no need to ask OCC
+                    return None
                 return self.nextIntersectionClosestTo(edge, self.solid, edge.valueAt(param))
         return None
 
@@ -1148,7 +1179,7 @@ class ObjectTagDressup:
         for i, tag in enumerate(self.pathData.sortedTags(rawTags)):
             if tag.enabled:
                 if prev:
-                    if prev.solid.common(tag.solid).Faces:
+                    if prev.overlaps(tag.solid) and prev.solid.common(tag.solid).Faces:
                         Path.Log.info("Tag #%d intersects with previous tag - disabling\n" % i)
                         Path.Log.debug("this tag = %d [%s]" % (i, tag.solid.BoundBox))
                         tag.enabled = False
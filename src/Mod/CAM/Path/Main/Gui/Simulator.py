@@ -26,10 +26,11 @@ import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
 import Path.Main.Job as PathJob
+import Path.Main.Simulator as Simulator
 import PathGui
-import PathSimulator
 import math
 import os
+import threading
 
 from FreeCAD import Vector, Base
 
@@ -70,6 +71,9 @@ class PathSimulation:
         self.debug = False
         self.timer = QtCore.QTimer()
         QtCore.QObject.connect(self.timer, QtCore.SIGNAL("timeout()"), self.PerformCut)
+        self.batchTimer = QtCore.QTimer()
+        QtCore.QObject.connect(self.batchTimer, QtCore.SIGNAL("timeout()"), self.PerformBatchFrame)
+        self.batch = None
         self.stdrot = FreeCAD.Rotation(Vector(0, 0, 1), 0)
         self.iprogress = 0
         self.numCommands = 0
@@ -105,7 +109,7 @@ class PathSimulation:
         self.disableAnim = False
         self.isVoxel = True
         self.firstDrill = True
-        self.voxSim = PathSimulator.PathSim()
+        self.voxSim = Simulator.VoxelSimulation()
         self.SimulateMill()
         self.initdone = True
 
@@ -156,15 +160,12 @@ class PathSimulation:
 
         self.stock = self.job.Stock.Shape
         if self.isVoxel:
-            maxlen = self.stock.BoundBox.XLength
-            if maxlen < self.stock.BoundBox.YLength:
-                maxlen = self.stock.BoundBox.YLength
-            self.resolution = 0.01 * self.accuracy * maxlen
-            self.voxSim.BeginSimulation(self.stock, self.resolution)
+            self.voxSim.begin(self.stock, self.accuracy)
+            self.resolution = self.voxSim.resolution
             (
                 self.cutMaterial.Mesh,
                 self.cutMaterialIn.Mesh,
-            ) = self.voxSim.GetResultMesh()
+            ) = self.voxSim.resultMeshes()
         else:
             self.cutMaterial.Shape = self.stock
         self.busy = False
@@ -193,9 +194,12 @@ class PathSimulation:
                 )
 
             self.cutTool.ViewObject.show()
-            self.voxSim.SetToolShape(self.cutTool.Shape, 0.05 * self.accuracy)
+            if self.isVoxel:
+                self.voxSim.setTool(self.cutTool.Shape, self.accuracy)
         self.icmd = 0
         self.curpos = FreeCAD.Placement(self.initialPos, self.stdrot)
+        if self.isVoxel:
+            self.voxSim.reset(self.initialPos)
         self.cutTool.Placement = self.curpos
         self.opCommands = PathUtils.getPathWithPlacement(self.operation).Commands
 
@@ -312,56 +316,13 @@ class PathSimulation:
         self.busy = True
 
         cmd = self.opCommands[self.icmd]
-        # for cmd in job.Path.Commands:
-        if cmd.Name in ["G0", "G1", "G2", "G3"]:
-            self.firstDrill = True
-            if cmd.Name in ["G2", "G3"] and (cmd.k or 0) == 0:
-                cx = self.curpos.Base.x + (cmd.i or 0)
-                cy = self.curpos.Base.y + (cmd.j or 0)
-                a0 = math.atan2(self.curpos.Base.y - cy, self.curpos.Base.x - cx)
-                a1 = math.atan2(cmd.y - cy, cmd.x - cx)
-                da = a1 - a0
-                if cmd.Name == "G3":
-                    da = da % (2 * math.pi)
-                else:
-                    da = -((-da) % (2 * math.pi))
-                r = math.sqrt((cmd.i or 0) ** 2 + (cmd.j or 0) ** 2)
-                n = math.ceil(math.sqrt(r / self.resolution * da * da))
-                da = da / n
-                dz = (cmd.z - self.curpos.Base.z) / n
-                cmd.Name = "G1"
-                for i in range(n):
-                    a0 += da
-                    cmd.x = cx + r * math.cos(a0)
-                    cmd.y = cy + r * math.sin(a0)
-                    cmd.z = self.curpos.Base.z + dz
-                    self.curpos = self.voxSim.ApplyCommand(self.curpos, cmd)
-            else:
-                self.curpos = self.voxSim.ApplyCommand(self.curpos, cmd)
-            if not self.disableAnim:
-                self.cutTool.Placement = self.curpos
-                (
-                    self.cutMaterial.Mesh,
-                    self.cutMaterialIn.Mesh,
-                ) = self.voxSim.GetResultMesh()
-        if cmd.Name in ["G80"]:
-            self.firstDrill = True
-        if cmd.Name in ["G73", "G81", "G82", "G83"]:
-            extendcommands = []
-            if self.firstDrill:
-                extendcommands.append(Path.Command("G0", {"Z": cmd.r}))
-                self.firstDrill = False
-            extendcommands.append(Path.Command("G0", {"X": cmd.x, "Y": cmd.y, "Z": cmd.r}))
-            extendcommands.append(Path.Command("G1", {"X": cmd.x, "Y": cmd.y, "Z": cmd.z}))
-            extendcommands.append(Path.Command("G1", {"X": cmd.x, "Y": cmd.y, "Z": cmd.r}))
-            for ecmd in extendcommands:
-                self.curpos = self.voxSim.ApplyCommand(self.curpos, ecmd)
-                if not self.disableAnim:
-                    self.cutTool.Placement = self.curpos
-                    (
-                        self.cutMaterial.Mesh,
-                        self.cutMaterialIn.Mesh,
-                    ) = self.voxSim.GetResultMesh()
+        self.curpos = self.voxSim.applyCommand(cmd)
+        if not self.disableAnim:
+            self.cutTool.Placement = self.curpos
+            (
+                self.cutMaterial.Mesh,
+                self.cutMaterialIn.Mesh,
+            ) = self.voxSim.resultMeshes()
         self.icmd += 1
         self.iprogress += 1
         self.UpdateProgress()
@@ -380,6 +341,58 @@ class PathSimulation:
         else:
             self.PerformCutBoolean()
 
+    def RunBatch(self, commands):
+        # runs on the worker thread, must not touch any document object
+        try:
+            self.voxSim.applyCommands(commands)
+        except Exception as e:
+            self.batchError = e
+
+    def StartBatch(self):
+        if self.resetSimulation:
+            self.resetSimulation = False
+            self.SetupSimulation()
+        self.batchError = None
+        self.batchStart = (self.icmd, self.iprogress)
+        self.voxSim.abort = False
+        self.voxSim.applied = 0
+        self.batch = threading.Thread(target=self.RunBatch, args=(self.opCommands[self.icmd :],))
+        self.batch.start()
+        self.batchTimer.start(int(1000 / max(Path.Preferences.simulationFrameRate(), 0.1)))
+
+    def StopBatch(self):
+        if self.batch is not None:
+            self.voxSim.abort = True
+            self.batch.join()
+            self.PerformBatchFrame()
+
+    def PerformBatchFrame(self):
+        # whole operations are simulated on a worker thread, the display is only refreshed at
+        # the configured frame rate and whenever an operation is done
+        running = self.batch.is_alive()
+        self.icmd = self.batchStart[0] + self.voxSim.applied
+        self.iprogress = self.batchStart[1] + self.voxSim.applied
+        self.curpos = self.voxSim.position
+        self.UpdateProgress()
+        self.ViewShape()
+        if running:
+            return
+        self.batchTimer.stop()
+        self.batch = None
+        if self.batchError is not None:
+            Path.Log.error("Simulation failed: %s" % self.batchError)
+            self.EndSimulation()
+            return
+        if self.voxSim.abort:
+            return
+        if self.icmd >= len(self.opCommands):
+            self.ioperation += 1
+            if self.ioperation >= len(self.activeOps):
+                self.EndSimulation()
+                return
+            self.SetupOperation(self.ioperation)
+        self.StartBatch()
+
     def RapidMove(self, cmd, curpos):
         path = Path.Geom.edgeForCmd(cmd, curpos)  # hack to overcome occ bug
         if path is None:
@@ -519,6 +532,7 @@ class PathSimulation:
         form.toolButtonFF.setEnabled(not isBusy)
 
     def EndSimulation(self):
+        self.StopBatch()
         self.UpdateProgress()
         self.timer.stop()
         self.GuiBusy(False)
@@ -542,8 +556,11 @@ class PathSimulation:
         if self.InvalidOperation():
             return
         self.GuiBusy(True)
-        self.timer.start(1)
         self.disableAnim = True
+        if self.isVoxel:
+            self.StartBatch()
+        else:
+            self.timer.start(1)
 
     def SimStep(self):
         if self.InvalidOperation():
@@ -563,11 +580,12 @@ class PathSimulation:
             (
                 self.cutMaterial.Mesh,
                 self.cutMaterialIn.Mesh,
-            ) = self.voxSim.GetResultMesh()
+            ) = self.voxSim.resultMeshes()
         else:
             self.cutMaterial.Shape = self.stock
 
     def SimPause(self):
+        self.StopBatch()
         if self.disableAnim:
             self.ViewShape()
         self.GuiBusy(False)
@@ -25,12 +25,12 @@ from PySide import QtCore
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD
 import Path
+import Path.Base.CycleTime as PathCycleTime
 import Path.Base.SetupSheet as PathSetupSheet
 import Path.Base.Util as PathUtil
 import Path.Main.Stock as PathStock
 import Path.Tool.Controller as PathToolController
 import json
-import time
 
 
 # lazily loaded modules
@@ -644,26 +644,25 @@ class ObjectJob:
                 if PathUtil.opProperty(op, "Active") is False:
                     continue
 
-                # Skip operations that don't have a cycletime attribute
-                if PathUtil.opProperty(op, "CycleTime") is None:
-                    continue
-
-                formattedCycleTime = PathUtil.opProperty(op, "CycleTime")
-                opCycleTime = 0
-                try:
-                    # Convert the formatted time from HH:MM:SS to just seconds
-                    opCycleTime = sum(
-                        x * int(t)
-                        for x, t in zip([1, 60, 3600], reversed(formattedCycleTime.split(":")))
-                    )
-                except Exception:
-                    continue
-
-                if opCycleTime > 0:
+                opCycleTime = self._opCycleTime(op)
+                if opCycleTime:
                     seconds = seconds + opCycleTime
 
-        cycleTimeString = time.strftime("%H:%M:%S", time.gmtime(seconds))
-        self.obj.CycleTime = cycleTimeString
+        self.obj.CycleTime = PathCycleTime.formatCycleTime(seconds)
+
+    def _opCycleTime(self, op):
+        """Returns the estimated seconds of op, None if there is no estimate."""
+        # dressups use the estimate of the operation they are based on
+        while not hasattr(op, "CycleTime") and hasattr(op, "Base"):
+            op = op.Base
+        if getattr(op, "CycleTime", None) is None:
+            return None
+
+        # the unrounded estimate is only known if the op was executed in this session
+        seconds = getattr(getattr(op, "Proxy", None), "cycleTime", None)
+        if seconds is None:
+            seconds = PathCycleTime.parseCycleTime(op.CycleTime)
+        return seconds
 
     def addOperation(self, op, before=None, removeBefore=False):
         group = self.obj.Operations.Group
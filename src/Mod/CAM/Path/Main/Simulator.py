@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import Path.Base.Util as PathUtil
+import Path.Dressup.Utils as PathDressup
+import PathScripts.PathUtils as PathUtils
+import math
+
+from FreeCAD import Vector
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+Mesh = LazyLoader("Mesh", globals(), "Mesh")
+PathSimulator = LazyLoader("PathSimulator", globals(), "PathSimulator")
+
+__title__ = "CAM Voxel Simulation"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Headless voxel simulation of the material removed by the operations of a job."
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+DrillCycles = ["G73", "G81", "G82", "G83"]
+
+
+class VoxelSimulation:
+    """Applies path commands to a voxel model of the stock.
+
+    The simulation does not touch the document, it can be driven from a script or from a worker
+    thread. Arcs in the XY plane and drill cycles are broken into linear moves before they are
+    handed to the voxel simulator."""
+
+    def __init__(self):
+        self.sim = PathSimulator.PathSim()
+        self.resolution = None
+        self.position = None
+        self.firstDrill = True
+        self.applied = 0
+        self.abort = False
+
+    def begin(self, stock, accuracy):
+        """begin(stock, accuracy) ... start a new simulation of stock, accuracy is the voxel size
+        in percent of the larger of the stock's X and Y extent."""
+        bb = stock.BoundBox
+        self.resolution = 0.01 * accuracy * max(bb.XLength, bb.YLength)
+        self.sim.BeginSimulation(stock, self.resolution)
+        self.firstDrill = True
+        self.reset(Vector(0, 0, bb.ZMax))
+
+    def reset(self, position):
+        """reset(position) ... move the tool to position without cutting anything."""
+        self.position = FreeCAD.Placement(position, FreeCAD.Rotation(Vector(0, 0, 1), 0))
+
+    def setTool(self, shape, accuracy):
+        """setTool(shape, accuracy) ... use shape for all subsequent cuts."""
+        self.sim.SetToolShape(shape, 0.05 * accuracy)
+
+    def arcCommands(self, cmd, pos):
+        """arcCommands(cmd, pos) ... returns the linear moves approximating the XY arc cmd
+        starting at pos."""
+        i = cmd.Parameters.get("I", 0)
+        j = cmd.Parameters.get("J", 0)
+        x = cmd.Parameters.get("X", pos.x)
+        y = cmd.Parameters.get("Y", pos.y)
+        z = cmd.Parameters.get("Z", pos.z)
+        cx = pos.x + i
+        cy = pos.y + j
+        a0 = math.atan2(pos.y - cy, pos.x - cx)
+        a1 = math.atan2(y - cy, x - cx)
+        da = a1 - a0
+        if cmd.Name == "G3":
+            da = da % (2 * math.pi)
+        else:
+            da = -((-da) % (2 * math.pi))
+        r = math.sqrt(i * i + j * j)
+        n = max(1, math.ceil(math.sqrt(r / self.resolution * da * da)))
+        da = da / n
+        dz = (z - pos.z) / n
+        commands = []
+        for k in range(1, n + 1):
+            a = a0 + k * da
+            commands.append(
+                Path.Command(
+                    "G1",
+                    {"X": cx + r * math.cos(a), "Y": cy + r * math.sin(a), "Z": pos.z + k * dz},
+                )
+            )
+        return commands
+
+    def drillCommands(self, cmd):
+        """drillCommands(cmd) ... returns the moves of the drill cycle cmd."""
+        commands = []
+        if self.firstDrill:
+            commands.append(Path.Command("G0", {"Z": cmd.r}))
+            self.firstDrill = False
+        commands.append(Path.Command("G0", {"X": cmd.x, "Y": cmd.y, "Z": cmd.r}))
+        commands.append(Path.Command("G1", {"X": cmd.x, "Y": cmd.y, "Z": cmd.z}))
+        commands.append(Path.Command("G1", {"X": cmd.x, "Y": cmd.y, "Z": cmd.r}))
+        return commands
+
+    def commandsFor(self, cmd):
+        """commandsFor(cmd) ... returns the commands the voxel simulator has to apply for cmd."""
+        if cmd.Name in ["G0", "G1", "G2", "G3"]:
+            self.firstDrill = True
+            if cmd.Name in ["G2", "G3"] and cmd.Parameters.get("K", 0) == 0:
+                return self.arcCommands(cmd, self.position.Base)
+            return [cmd]
+        if cmd.Name in ["G80"]:
+            self.firstDrill = True
+        elif cmd.Name in DrillCycles:
+            return self.drillCommands(cmd)
+        return []
+
+    def applyCommand(self, cmd):
+        """applyCommand(cmd) ... cut the stock along cmd and return the new tool position."""
+        for c in self.commandsFor(cmd):
+            self.position = self.sim.ApplyCommand(self.position, c)
+        return self.position
+
+    def applyCommands(self, commands):
+        """applyCommands(commands) ... cut the stock along all commands.
+        The number of processed commands is available in applied while this is running, setting
+        abort stops the simulation after the current command."""
+        self.applied = 0
+        self.abort = False
+        for cmd in commands:
+            if self.abort:
+                break
+            self.applyCommand(cmd)
+            self.applied += 1
+        return self.applied
+
+    def resultMeshes(self):
+        """resultMeshes() ... returns the outer and inner mesh of the remaining stock."""
+        return self.sim.GetResultMesh()
+
+    def resultMesh(self):
+        """resultMesh() ... returns a single mesh of the remaining stock."""
+        outer, inner = self.resultMeshes()
+        mesh = Mesh.Mesh()
+        mesh.addMesh(outer)
+        mesh.addMesh(inner)
+        return mesh
+
+    def volume(self):
+        """volume() ... returns the volume of the remaining stock."""
+        return self.resultMesh().Volume
+
+
+def simulateJob(job, operations=None, accuracy=0.1):
+    """simulateJob(job, operations=None, accuracy=0.1) ... simulate operations of job, all active
+    operations if none are given.
+    Returns the mesh of the final stock and a list of (operation, removed volume) tuples."""
+    if operations is None:
+        operations = [op for op in job.Operations.Group if PathUtil.opProperty(op, "Active")]
+
+    simulation = VoxelSimulation()
+    simulation.begin(job.Stock.Shape, accuracy)
+    start = Vector(0, 0, job.Stock.Shape.BoundBox.ZMax)
+    volume = simulation.volume()
+    report = []
+    for op in operations:
+        try:
+            tool = PathDressup.toolController(op).Tool
+        except Exception:
+            tool = None
+        if tool is None:
+            Path.Log.warning("%s: no tool, skipping simulation" % op.Label)
+            report.append((op, 0.0))
+            continue
+
+        simulation.setTool(tool.Shape, accuracy)
+        simulation.reset(start)
+        simulation.applyCommands(PathUtils.getPathWithPlacement(op).Commands)
+        remaining = simulation.volume()
+        Path.Log.debug("%s: removed %.2f" % (op.Label, volume - remaining))
+        report.append((op, volume - remaining))
+        volume = remaining
+    return (simulation.resultMesh(), report)
@@ -235,27 +235,20 @@ class ObjectOp(PathOp.ObjectOp):
                 bbox = section.getShape().BoundBox
                 z = bbox.ZMin
                 sectionClearedAreas = []
-                for op in self.job.Operations.Group:
-                    if self in [x.Proxy for x in [op] + op.OutListRecursive if hasattr(x, "Proxy")]:
-                        break
-                    if hasattr(op, "Active") and op.Active and op.Path:
-                        tool = (
-                            op.Proxy.tool
-                            if hasattr(op.Proxy, "tool")
-                            else op.ToolController.Proxy.getTool(op.ToolController)
-                        )
-                        diameter = tool.Diameter.getValueAs("mm")
-                        dz = (
-                            0 if not hasattr(tool, "TipAngle") else -PathUtils.drillTipLength(tool)
-                        )  # for drills, dz translates to the full width part of the tool
-                        sectionClearedAreas.append(
-                            section.getClearedArea(
-                                op.Path,
-                                diameter,
-                                z + dz + self.job.GeometryTolerance.getValueAs("mm"),
-                                bbox,
-                            )
+                for op in self.restMachiningOps():
+                    tool = self.restMachiningTool(op)
+                    diameter = tool.Diameter.getValueAs("mm")
+                    dz = (
+                        0 if not hasattr(tool, "TipAngle") else -PathUtils.drillTipLength(tool)
+                    )  # for drills, dz translates to the full width part of the tool
+                    sectionClearedAreas.append(
+                        section.getClearedArea(
+                            op.Path,
+                            diameter,
+                            z + dz + self.job.GeometryTolerance.getValueAs("mm"),
+                            bbox,
                         )
+                    )
                 restSection = section.getRestArea(
                     sectionClearedAreas, self.tool.Diameter.getValueAs("mm")
                 )
@@ -314,6 +307,40 @@ class ObjectOp(PathOp.ObjectOp):
 
         return pp, simobj
 
+    def restMachiningOps(self):
+        """restMachiningOps() ... returns the active operations of the job before the receiver,
+        the rest machining area is what their paths did not clear."""
+        ops = []
+        for op in self.job.Operations.Group:
+            if self in [x.Proxy for x in [op] + op.OutListRecursive if hasattr(x, "Proxy")]:
+                break
+            if hasattr(op, "Active") and op.Active and op.Path:
+                ops.append(op)
+        return ops
+
+    def restMachiningTool(self, op):
+        """restMachiningTool(op) ... returns the tool op, one of the restMachiningOps(), cleared with."""
+        if hasattr(op.Proxy, "tool"):
+            return op.Proxy.tool
+        return op.ToolController.Proxy.getTool(op.ToolController)
+
+    def fingerprint(self, obj):
+        """fingerprint(obj) ... adds the paths and tools of the preceding operations if rest
+        machining is used, they determine the area which is left to clear."""
+        fingerprint = super().fingerprint(obj)
+        if getattr(obj, "UseRestMachining", False):
+            for op in self.restMachiningOps():
+                tool = self.restMachiningTool(op)
+                fingerprint += (
+                    (
+                        op.Name,
+                        hash(op.Path.toGCode()),
+                        tool.Diameter.Value,
+                        str(getattr(tool, "TipAngle", None)),
+                    ),
+                )
+        return fingerprint
+
     def _buildProfileOpenEdges(self, obj, edgeList, isHole, start, getsim):
         """_buildPathArea(obj, edgeList, isHole, start, getsim) ... internal function."""
         Path.Log.track()
@@ -24,10 +24,11 @@ import FreeCAD
 from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
+import Path.Base.CycleTime as PathCycleTime
 import Path.Base.Util as PathUtil
+import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
-import time
 
 
 # lazily loaded modules
@@ -66,6 +67,47 @@ FeatureDiameters = 0x4000  # Turning Diameters
 
 FeatureBaseGeometry = FeatureBaseVertexes | FeatureBaseFaces | FeatureBaseEdges
 
+# Properties which are the result of an operation rather than an input to it
+FingerprintIgnore = ["Path", "CycleTime", "Proxy", "Label2", "Visibility"]
+
+
+def _geometryFingerprint(shape):
+    # shape.hashCode() identifies the TShape in memory, which a recomputed shape can reuse
+    if shape.isNull():
+        return None
+    return (PathSurfaceSupport.shapeFingerprint(shape), str(shape.Placement))
+
+
+def _shapeFingerprint(obj):
+    shape = getattr(obj, "Shape", None)
+    if shape is None:
+        return None
+    return _geometryFingerprint(shape)
+
+
+def _valueFingerprint(value, depth):
+    if isinstance(value, FreeCAD.DocumentObject):
+        if depth > 0:
+            return _objectFingerprint(value, depth - 1)
+        return (value.Name, _shapeFingerprint(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_valueFingerprint(v, depth) for v in value)
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return (value.Value, str(value.Unit))
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Part.Shape):
+        return _geometryFingerprint(value)
+    return repr(value)
+
+
+def _objectFingerprint(obj, depth):
+    values = [obj.Name, _shapeFingerprint(obj)]
+    for prop in obj.PropertiesList:
+        if prop not in FingerprintIgnore:
+            values.append((prop, _valueFingerprint(obj.getPropertyByName(prop), depth)))
+    return tuple(values)
+
 
 class PathNoTCException(Exception):
     """PathNoTCException is raised when no TC was selected or matches the input
@@ -739,6 +781,7 @@ class ObjectOp(object):
         if not obj.Active:
             path = Path.Path("(inactive operation)")
             obj.Path = path
+            self.executedFingerprint = None
             return
 
         if not self._setBaseAndStock(obj):
@@ -780,6 +823,12 @@ class ObjectOp(object):
         # in case they still have an expression referencing any op values
         obj.recompute()
 
+        fingerprint = self.fingerprint(obj)
+        if fingerprint == getattr(self, "executedFingerprint", None) and obj.Path.Size:
+            Path.Log.debug("%s is up to date" % obj.Label)
+            return None
+        self.executedFingerprint = None
+
         self.commandlist = []
         self.commandlist.append(Path.Command("(%s)" % obj.Label))
         if obj.Comment:
@@ -795,10 +844,34 @@ class ObjectOp(object):
         obj.Path = path
         obj.CycleTime = self.getCycleTimeEstimate(obj)
         self.job.Proxy.getCycleTime()
+        # opExecute might have updated some of the receiver's properties
+        self.executedFingerprint = self.fingerprint(obj)
         return result
 
+    def fingerprint(self, obj):
+        """fingerprint(obj) ... returns a value representing all inputs of the operation.
+        It covers the receiver's properties, the objects they link to, the tool controller and its
+        tool, the job's model and stock shapes, the setup sheet and the preferences used while
+        generating the path. execute() reuses the current Path if the fingerprint has not changed
+        since the last time it was generated.
+        Can safely be overwritten by subclasses with additional inputs."""
+        job = self.job
+        return (
+            _objectFingerprint(obj, 2),
+            _objectFingerprint(job.SetupSheet, 0),
+            tuple(_shapeFingerprint(model) for model in job.Model.Group),
+            _shapeFingerprint(job.Stock),
+            _valueFingerprint(getattr(job, "GeometryTolerance", None), 0),
+            Path.Preferences.defaultGeometryTolerance(),
+            Path.Preferences.locationOptimizationTime(),
+            Path.Preferences.machineAcceleration(),
+            _valueFingerprint(sorted(Path.Area.getDefaultParams().items()), 0),
+        )
+
     def getCycleTimeEstimate(self, obj):
 
+        # the seconds of the estimate, which the job adds up
+        self.cycleTime = None
         tc = obj.ToolController
 
         if tc is None or tc.ToolNumber == 0:
@@ -830,15 +903,15 @@ class ObjectOp(object):
             )
 
         # Get the cycle time in seconds
-        seconds = obj.Path.getCycleTime(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+        limits = PathCycleTime.limitsForToolController(tc)
+        seconds = PathCycleTime.estimate(obj.Path.Commands, limits)
 
         if not seconds or math.isnan(seconds):
             return translate("CAM", "Cycletime Error")
 
+        self.cycleTime = seconds
         # Convert the cycle time to a HH:MM:SS format
-        cycleTime = time.strftime("%H:%M:%S", time.gmtime(seconds))
-
-        return cycleTime
+        return PathCycleTime.formatCycleTime(seconds)
 
     def addBase(self, obj, base, sub):
         Path.Log.track(obj, base, sub)
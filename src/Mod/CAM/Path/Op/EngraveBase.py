@@ -24,6 +24,7 @@ from lazy_loader.lazy_loader import LazyLoader
 import Path
 import Path.Op.Base as PathOp
 import Path.Op.Util as PathOpUtil
+import PathScripts.PathUtils as PathUtils
 import copy
 
 __doc__ = "Base class for all ops in the engrave family."
@@ -65,7 +66,18 @@ class ObjectOp(PathOp.ObjectOp):
         for wire in wires:
             decomposewires.extend(PathOpUtil.makeWires(wire.Edges))
 
-        wires = decomposewires
+        # engrave the wires in the order of the shortest rapid moves, keeping their direction
+        if hasattr(obj, "StartVertex"):
+            start_idx = obj.StartVertex
+        begins = []
+        ends = []
+        for wire in decomposewires:
+            edge = wire.Edges[min(start_idx, len(wire.Edges) - 1)]
+            begins.append(edge.Vertexes[0].Point)
+            ends.append(begins[-1] if wire.isClosed() else wire.Vertexes[-1].Point)
+        order = PathUtils.sort_wires(begins, ends, reversible=False)
+
+        wires = [decomposewires[i] for i, _ in order]
         for wire in wires:
             # offset = wire
 
@@ -399,6 +399,15 @@ class ObjectSurface(PathOp.ObjectOp):
                     "Feedback: three smallest gaps identified in the path geometry.",
                 ),
             ),
+            (
+                "App::PropertyInteger",
+                "ScanWorkers",
+                "Optimization",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Number of worker processes for the drop cutter scans. The default 1 scans in a single process, set to 0 to use all CPU cores.",
+                ),
+            ),
             (
                 "App::PropertyVectorDistance",
                 "StartPoint",
@@ -523,6 +532,7 @@ class ObjectSurface(PathOp.ObjectOp):
             "AvoidLastX_Faces": 0,
             "PatternCenterCustom": FreeCAD.Vector(0.0, 0.0, 0.0),
             "GapThreshold": 0.005,
+            "ScanWorkers": 1,
             "AngularDeflection": 0.25,  # AngularDeflection is unused
             # Reasonable compromise between speed & precision
             "LinearDeflection": 0.001,
@@ -1222,6 +1232,9 @@ class ObjectSurface(PathOp.ObjectOp):
 
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
+            # D format is ((p1, p2), (p3, p4))
+            scanItems = [("Line", I[0], I[1]) for D in PNTSET for I in D if I != "BRK"]
+            CLPS = iter(self._planarDropCutScans(obj, pdc, scanItems))
             for D in PNTSET:
                 stpOvr = []
                 ofst = []
@@ -1231,9 +1244,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         stpOvr.append(I)
                         ofst = []
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.extend(next(CLPS))
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1248,14 +1259,15 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == "Spiral":
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
+            # LN format is ((p1, p2), (p3, p4))
+            scanItems = [("Line", LN[0], LN[1]) for STEP in PNTSET for LN in STEP if LN != "BRK"]
+            CLPS = iter(self._planarDropCutScans(obj, pdc, scanItems))
             for STEP in PNTSET:
                 for LN in STEP:
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(next(CLPS))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1264,22 +1276,23 @@ class ObjectSurface(PathOp.ObjectOp):
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
+            scanItems = []
+            for aTyp, dirFlg, ARCS in PNTSET:
+                cMode = dirFlg == 1
+                scanItems.extend(("Arc", Arc, cMode) for Arc in ARCS if Arc != "BRK")
+            CLPS = iter(self._planarDropCutScans(obj, pdc, scanItems))
+
             for so in range(0, len(PNTSET)):
                 stpOvr = []
                 erFlg = False
                 (aTyp, dirFlg, ARCS) = PNTSET[so]
 
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
-
                 for a in range(0, len(ARCS)):
                     Arc = ARCS[a]
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
+                        scan = next(CLPS)
                         if scan is False:
                             erFlg = True
                         else:
@@ -1292,6 +1305,45 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return SCANS
 
+    def _planarDropCutScans(self, obj, pdc, scanItems):
+        """_planarDropCutScans(obj, pdc, scanItems) ... Return the drop cutter points of all
+        scan items, ("Line", A, B) or ("Arc", Arc, cMode), in the order of scanItems.
+        With more than one scan worker, consecutive tiles of the scan items are scanned on
+        a process pool. Every item is scanned on its own, so the points are the same as
+        with a scan in this process."""
+        workers = PathSurfaceSupport.getScanWorkerCount(obj)
+        if workers == 1 or len(scanItems) < 2:
+            return [self._planarDropCutItemScan(pdc, item) for item in scanItems]
+
+        tiles = PathSurfaceSupport.makeScanTiles(len(scanItems), workers)
+        results = PathSurfaceSupport.runScanTiles(
+            self._planarDropCutTileScan,
+            (pdc, scanItems),
+            tiles,
+            workers,
+            initFunc=self._scanWorkerInit,
+        )
+        if results is None:
+            return [self._planarDropCutItemScan(pdc, item) for item in scanItems]
+        return [[FreeCAD.Vector(*p) for p in scan] for tile in results for scan in tile]
+
+    def _planarDropCutTileScan(self, shared, tile):
+        (pdc, scanItems) = shared
+        (start, stop) = tile
+        return [
+            [(p.x, p.y, p.z) for p in self._planarDropCutItemScan(pdc, item)]
+            for item in scanItems[start:stop]
+        ]
+
+    def _planarDropCutItemScan(self, pdc, item):
+        if item[0] == "Line":
+            return self._planarDropCutScan(pdc, item[1], item[2])
+        return self._planarCircularDropCutScan(pdc, item[1], item[2])
+
+    def _scanWorkerInit(self, shared):
+        # the first item of the shared scan data is the drop cutter of the scan
+        PathSurfaceSupport.setOclSingleThread(shared[0])
+
     def _planarDropCutScan(self, pdc, A, B):
         (x1, y1) = A
         (x2, y2) = B
@@ -1959,7 +2011,8 @@ class ObjectSurface(PathOp.ObjectOp):
 
         base = JOB.Model.Group[mdlIdx]
         bb = self.boundBoxes[mdlIdx]
-        stl = self.modelSTLs[mdlIdx]
+        # the scans rotate the STL object, do not change the one of the STL cache
+        stl = PathSurfaceSupport.copySTL(self.modelSTLs[mdlIdx], ocl)
 
         # Rotate model to initial index
         initIdx = obj.CutterTilt + obj.StartIndex
@@ -2212,9 +2265,6 @@ class ObjectSurface(PathOp.ObjectOp):
 
     def _indexedDropCutScan(self, obj, stl, advances, xmin, ymin, xmax, ymax, layDep, sample):
         cutterOfst = 0.0
-        iCnt = 0
-        Lines = []
-        result = None
 
         pdc = ocl.PathDropCutter()  # create a pdc
         pdc.setCutter(self.cutter)
@@ -2226,45 +2276,80 @@ class ObjectSurface(PathOp.ObjectOp):
             cutterOfst = layDep * math.sin(math.radians(obj.CutterTilt))
             Path.Log.debug("CutterTilt: cutterOfst is " + str(cutterOfst))
 
+        # start and end point of the scan lines
+        if obj.RotationAxis == "X":
+            p1 = (xmin, cutterOfst)  # start-point of line
+            p2 = (xmax, cutterOfst)  # end-point of line
+        else:
+            p1 = (cutterOfst, ymin)  # start-point of line
+            p2 = (cutterOfst, ymax)  # end-point of line
+
+        # direction of the scan lines, True if a line runs from p2 to p1
+        reverse = [False] * len(advances)
+        if obj.RotationAxis == obj.DropCutterDir:  # parallel cut
+            if obj.CutPattern == "ZigZag":
+                reverse = [iCnt % 2 != 0 for iCnt in range(len(advances))]  # odd
+            elif obj.CutPattern == "Line":
+                reverse = [self.CutClimb is True] * len(advances)
+
+        scan = (pdc, obj.RotationAxis, stl, advances, p1, p2, reverse, obj.DepthOffset.Value)
+
+        results = None
+        workers = PathSurfaceSupport.getScanWorkerCount(obj)
+        if workers > 1 and len(advances) > 1:
+            # every worker process rotates its own copy of the STL object
+            tiles = PathSurfaceSupport.makeScanTiles(len(advances), workers)
+            results = PathSurfaceSupport.runScanTiles(
+                self._indexedDropCutTileScan,
+                scan,
+                tiles,
+                workers,
+                initFunc=self._scanWorkerInit,
+            )
+        if results is not None:
+            Lines = [[FreeCAD.Vector(*p) for p in line] for tile in results for line in tile]
+            # Rotate STL object of this process as the scans did
+            self._indexedRotateSTL(obj.RotationAxis, stl, advances)
+        else:
+            Lines = self._indexedDropCutLines(scan, 0, len(advances))
+
+        # Rotate STL object back to original position using OCL method
         sumAdv = 0.0
         for adv in advances:
             sumAdv += adv
-            if adv > 0.0:
-                # Rotate STL object using OCL method
-                radsRot = math.radians(adv)
-                if obj.RotationAxis == "X":
-                    stl.rotate(radsRot, 0.0, 0.0)
-                else:
-                    stl.rotate(0.0, radsRot, 0.0)
+        reset = -1 * math.radians(sumAdv - self.resetTolerance)
+        if obj.RotationAxis == "X":
+            stl.rotate(reset, 0.0, 0.0)
+        else:
+            stl.rotate(0.0, reset, 0.0)
+        self.resetTolerance = 0.0
+
+        return Lines
+
+    def _indexedDropCutLines(self, scan, start, stop):
+        """_indexedDropCutLines(scan, start, stop) ... Scan the lines of the advances
+        from start to stop. The STL object is rotated by all advances up to stop,
+        the advances before start are only used to rotate the STL object."""
+        (pdc, axis, stl, advances, p1, p2, reverse, depthOffset) = scan
+        Lines = []
+
+        # Rotate STL object to the first line of the tile
+        self._indexedRotateSTL(axis, stl, advances[:start])
+
+        for iCnt in range(start, stop):
+            # Rotate STL object using OCL method
+            self._indexedRotateSTL(axis, stl, advances[iCnt : iCnt + 1])
 
             # Set STL after rotation is made
             pdc.setSTL(stl)
 
-            # add Line objects to the path in this loop
-            if obj.RotationAxis == "X":
-                p1 = ocl.Point(xmin, cutterOfst, 0.0)  # start-point of line
-                p2 = ocl.Point(xmax, cutterOfst, 0.0)  # end-point of line
-            else:
-                p1 = ocl.Point(cutterOfst, ymin, 0.0)  # start-point of line
-                p2 = ocl.Point(cutterOfst, ymax, 0.0)  # end-point of line
-
             # Create line object
-            if obj.RotationAxis == obj.DropCutterDir:  # parallel cut
-                if obj.CutPattern == "ZigZag":
-                    if iCnt % 2 == 0.0:  # even
-                        lo = ocl.Line(p1, p2)
-                    else:  # odd
-                        lo = ocl.Line(p2, p1)
-                elif obj.CutPattern == "Line":
-                    if self.CutClimb is True:
-                        lo = ocl.Line(p2, p1)
-                    else:
-                        lo = ocl.Line(p1, p2)
-                else:
-                    # default to line-object
-                    lo = ocl.Line(p1, p2)
+            P1 = ocl.Point(p1[0], p1[1], 0.0)  # start-point of line
+            P2 = ocl.Point(p2[0], p2[1], 0.0)  # end-point of line
+            if reverse[iCnt]:
+                lo = ocl.Line(P2, P1)
             else:
-                lo = ocl.Line(p1, p2)  # line-object
+                lo = ocl.Line(P1, P2)  # line-object
 
             path = ocl.Path()  # create an empty path object
             path.append(lo)  # add the line to the path
@@ -2273,26 +2358,30 @@ class ObjectSurface(PathOp.ObjectOp):
             result = pdc.getCLPoints()  # request the list of points
 
             # Convert list of OCL objects to list of Vectors for faster access and Apply depth offset
-            if obj.DepthOffset.Value != 0.0:
-                Lines.append(
-                    [FreeCAD.Vector(p.x, p.y, p.z + obj.DepthOffset.Value) for p in result]
-                )
+            if depthOffset != 0.0:
+                Lines.append([FreeCAD.Vector(p.x, p.y, p.z + depthOffset) for p in result])
             else:
                 Lines.append([FreeCAD.Vector(p.x, p.y, p.z) for p in result])
-
-            iCnt += 1
         # End loop
 
-        # Rotate STL object back to original position using OCL method
-        reset = -1 * math.radians(sumAdv - self.resetTolerance)
-        if obj.RotationAxis == "X":
-            stl.rotate(reset, 0.0, 0.0)
-        else:
-            stl.rotate(0.0, reset, 0.0)
-        self.resetTolerance = 0.0
-
         return Lines
 
+    def _indexedDropCutTileScan(self, scan, tile):
+        (start, stop) = tile
+        return [
+            [(v.x, v.y, v.z) for v in line] for line in self._indexedDropCutLines(scan, start, stop)
+        ]
+
+    def _indexedRotateSTL(self, axis, stl, advances):
+        for adv in advances:
+            if adv > 0.0:
+                # Rotate STL object using OCL method
+                radsRot = math.radians(adv)
+                if axis == "X":
+                    stl.rotate(radsRot, 0.0, 0.0)
+                else:
+                    stl.rotate(0.0, radsRot, 0.0)
+
     def _indexedScanToGcode(self, obj, li, CLP, idxAng, prvDep, layerDepth, numDeps):
         # generate the path commands
         output = []
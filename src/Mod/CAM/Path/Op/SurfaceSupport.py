@@ -31,7 +31,13 @@ import FreeCAD
 import Path
 import Path.Op.Util as PathOpUtil
 import PathScripts.PathUtils as PathUtils
+import array
+import collections
+import concurrent.futures
+import hashlib
 import math
+import multiprocessing
+import os
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -1158,10 +1164,15 @@ def getSliceFromEnvelope(env):
 
 def _prepareModelSTLs(self, JOB, obj, m, ocl):
     """Tessellate model shapes or copy existing meshes into ocl.STLSurf
-    objects"""
+    objects. The STL objects are taken from the STL cache of the Job if
+    the model and the tessellation tolerance did not change."""
     if self.modelSTLs[m] is True:
         model = JOB.Model.Group[m]
-        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m])
+        modelType = self.modelTypes[m]
+        key = ("model", modelFingerprint(model, modelType), obj.LinearDeflection.Value)
+        self.modelSTLs[m] = getSTLCache(JOB).getSTL(
+            key, lambda: _getFacets(model, obj, modelType), ocl
+        )
 
 
 def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
@@ -1171,88 +1182,121 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
     STL object to determine minimum travel height to clear stock and model."""
     Path.Log.debug("_makeSafeSTL()")
 
-    fuseShapes = []
     Mdl = JOB.Model.Group[mdlIdx]
-    mBB = Mdl.Shape.BoundBox
-    sBB = JOB.Stock.Shape.BoundBox
-
-    # add Model shape to safeSTL shape
-    fuseShapes.append(Mdl.Shape)
-
+    toolDiam = self.cutter.getDiameter()
     if obj.BoundBox == "BaseBoundBox":
-        cont = False
-        extFwd = sBB.ZLength
-        zmin = mBB.ZMin
-        zmax = mBB.ZMin + extFwd
-        stpDwn = (zmax - zmin) / 4.0
-        dep_par = PathUtils.depth_params(zmax + 5.0, zmax + 3.0, zmax, stpDwn, 0.0, zmin)
+        if obj.BoundaryAdjustment > 0.0:
+            faceKey = shapeFingerprint(Part.makeCompound(faceShapes))
+        else:
+            faceKey = None
+        # the tool diameter is only used for the base plate under the stock
+        toolDiamKey = None
+    else:
+        faceKey = None
+        toolDiamKey = toolDiam
+    key = (
+        "safe",
+        modelFingerprint(Mdl, "S"),
+        shapeFingerprint(JOB.Stock.Shape),
+        obj.BoundBox,
+        obj.BoundaryAdjustment.Value,
+        faceKey,
+        shapeFingerprint(Part.makeCompound(voidShapes)) if voidShapes else None,
+        self.depthParams.safe_height,
+        self.depthParams.final_depth,
+        toolDiamKey,
+        obj.LinearDeflection.Value,
+    )
+
+    def makeFacets():
+        fuseShapes = []
+        mBB = Mdl.Shape.BoundBox
+        sBB = JOB.Stock.Shape.BoundBox
+
+        # add Model shape to safeSTL shape
+        fuseShapes.append(Mdl.Shape)
+
+        if obj.BoundBox == "BaseBoundBox":
+            cont = False
+            extFwd = sBB.ZLength
+            zmin = mBB.ZMin
+            zmax = mBB.ZMin + extFwd
+            stpDwn = (zmax - zmin) / 4.0
+            dep_par = PathUtils.depth_params(zmax + 5.0, zmax + 3.0, zmax, stpDwn, 0.0, zmin)
 
-        try:
-            envBB = PathUtils.getEnvelope(
-                partshape=Mdl.Shape, depthparams=dep_par
-            )  # Produces .Shape
-            cont = True
-        except Exception as ee:
-            Path.Log.error(str(ee))
-            shell = Mdl.Shape.Shells[0]
-            solid = Part.makeSolid(shell)
             try:
                 envBB = PathUtils.getEnvelope(
-                    partshape=solid, depthparams=dep_par
+                    partshape=Mdl.Shape, depthparams=dep_par
                 )  # Produces .Shape
                 cont = True
-            except Exception as eee:
-                Path.Log.error(str(eee))
+            except Exception as ee:
+                Path.Log.error(str(ee))
+                shell = Mdl.Shape.Shells[0]
+                solid = Part.makeSolid(shell)
+                try:
+                    envBB = PathUtils.getEnvelope(
+                        partshape=solid, depthparams=dep_par
+                    )  # Produces .Shape
+                    cont = True
+                except Exception as eee:
+                    Path.Log.error(str(eee))
 
-        if cont:
-            stckWst = JOB.Stock.Shape.cut(envBB)
-            if obj.BoundaryAdjustment > 0.0:
-                cmpndFS = Part.makeCompound(faceShapes)
-                baBB = PathUtils.getEnvelope(
-                    partshape=cmpndFS, depthparams=self.depthParams
-                )  # Produces .Shape
-                adjStckWst = stckWst.cut(baBB)
+            if cont:
+                stckWst = JOB.Stock.Shape.cut(envBB)
+                if obj.BoundaryAdjustment > 0.0:
+                    cmpndFS = Part.makeCompound(faceShapes)
+                    baBB = PathUtils.getEnvelope(
+                        partshape=cmpndFS, depthparams=self.depthParams
+                    )  # Produces .Shape
+                    adjStckWst = stckWst.cut(baBB)
+                else:
+                    adjStckWst = stckWst
+                fuseShapes.append(adjStckWst)
             else:
-                adjStckWst = stckWst
-            fuseShapes.append(adjStckWst)
+                msg = "Path transitions might not avoid the model. Verify paths.\n"
+                FreeCAD.Console.PrintWarning(msg)
         else:
-            msg = "Path transitions might not avoid the model. Verify paths.\n"
-            FreeCAD.Console.PrintWarning(msg)
-    else:
-        # If boundbox is Job.Stock, add hidden pad under stock as base plate
-        toolDiam = self.cutter.getDiameter()
-        zMin = JOB.Stock.Shape.BoundBox.ZMin
-        xMin = JOB.Stock.Shape.BoundBox.XMin - toolDiam
-        yMin = JOB.Stock.Shape.BoundBox.YMin - toolDiam
-        bL = JOB.Stock.Shape.BoundBox.XLength + (2 * toolDiam)
-        bW = JOB.Stock.Shape.BoundBox.YLength + (2 * toolDiam)
-        bH = 1.0
-        crnr = FreeCAD.Vector(xMin, yMin, zMin - 1.0)
-        B = Part.makeBox(bL, bW, bH, crnr, FreeCAD.Vector(0, 0, 1))
-        fuseShapes.append(B)
-
-    if voidShapes:
-        voidComp = Part.makeCompound(voidShapes)
-        voidEnv = PathUtils.getEnvelope(
-            partshape=voidComp, depthparams=self.depthParams
-        )  # Produces .Shape
-        fuseShapes.append(voidEnv)
-
-    fused = Part.makeCompound(fuseShapes)
-
-    if self.showDebugObjects:
-        T = FreeCAD.ActiveDocument.addObject("Part::Feature", "safeSTLShape")
-        T.Shape = fused
-        T.purgeTouched()
-        self.tempGroup.addObject(T)
-
-    self.safeSTLs[mdlIdx] = _makeSTL(fused, obj, ocl)
+            # If boundbox is Job.Stock, add hidden pad under stock as base plate
+            zMin = JOB.Stock.Shape.BoundBox.ZMin
+            xMin = JOB.Stock.Shape.BoundBox.XMin - toolDiam
+            yMin = JOB.Stock.Shape.BoundBox.YMin - toolDiam
+            bL = JOB.Stock.Shape.BoundBox.XLength + (2 * toolDiam)
+            bW = JOB.Stock.Shape.BoundBox.YLength + (2 * toolDiam)
+            bH = 1.0
+            crnr = FreeCAD.Vector(xMin, yMin, zMin - 1.0)
+            B = Part.makeBox(bL, bW, bH, crnr, FreeCAD.Vector(0, 0, 1))
+            fuseShapes.append(B)
+
+        if voidShapes:
+            voidComp = Part.makeCompound(voidShapes)
+            voidEnv = PathUtils.getEnvelope(
+                partshape=voidComp, depthparams=self.depthParams
+            )  # Produces .Shape
+            fuseShapes.append(voidEnv)
+
+        fused = Part.makeCompound(fuseShapes)
+
+        if self.showDebugObjects:
+            T = FreeCAD.ActiveDocument.addObject("Part::Feature", "safeSTLShape")
+            T.Shape = fused
+            T.purgeTouched()
+            self.tempGroup.addObject(T)
+
+        return _getFacets(fused, obj)
+
+    self.safeSTLs[mdlIdx] = getSTLCache(JOB).getSTL(key, makeFacets, ocl)
 
 
 def _makeSTL(model, obj, ocl, model_type=None):
     """Convert a mesh or shape into an OCL STL, using the tessellation
     tolerance specified in obj.LinearDeflection.
     Returns an ocl.STLSurf()."""
+    return _facetsToSTL(_getFacets(model, obj, model_type), ocl)
+
+
+def _getFacets(model, obj, model_type=None):
+    """Return the triangles of a mesh or tessellated shape as flat array of
+    the coordinates, nine per triangle."""
     if model_type == "M":
         facets = model.Mesh.Facets.Points
     else:
@@ -1262,18 +1306,164 @@ def _makeSTL(model, obj, ocl, model_type=None):
             shape = model
         vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value)
         facets = ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
-    stl = ocl.STLSurf()
+    coords = array.array("d")
     for tri in facets:
-        v1, v2, v3 = tri
+        for v in tri:
+            coords.extend((v[0], v[1], v[2]))
+    return coords
+
+
+def _facetsToSTL(coords, ocl):
+    stl = ocl.STLSurf()
+    for i in range(0, len(coords), 9):
         t = ocl.Triangle(
-            ocl.Point(v1[0], v1[1], v1[2]),
-            ocl.Point(v2[0], v2[1], v2[2]),
-            ocl.Point(v3[0], v3[1], v3[2]),
+            ocl.Point(coords[i], coords[i + 1], coords[i + 2]),
+            ocl.Point(coords[i + 3], coords[i + 4], coords[i + 5]),
+            ocl.Point(coords[i + 6], coords[i + 7], coords[i + 8]),
         )
         stl.addTriangle(t)
     return stl
 
 
+def copySTL(stl, ocl):
+    """copySTL(stl, ocl) ... Return a copy of an ocl.STLSurf object.
+    STL objects from the STL cache are shared, operations which transform
+    the STL object have to work on a copy."""
+    stlCopy = ocl.STLSurf()
+    for t in stl.getTriangles():
+        stlCopy.addTriangle(t)
+    return stlCopy
+
+
+# Cache of the OCL STL objects of a Job
+def shapeFingerprint(shape):
+    """shapeFingerprint(shape) ... Return a string identifying the geometry of shape.
+    The fingerprint is made of the vertex coordinates, the number of sub shapes, the
+    area and the volume of the shape. It is the same for equal shapes, also in
+    another session, and changes with the geometry or the placement of the shape."""
+    if shape.isNull():
+        return None
+    data = array.array("d", (shape.Area, shape.Volume, len(shape.Faces), len(shape.Edges)))
+    for v in shape.Vertexes:
+        data.extend((v.X, v.Y, v.Z))
+    return shape.ShapeType + ":" + hashlib.sha1(data.tobytes()).hexdigest()
+
+
+def modelFingerprint(model, model_type=None):
+    """modelFingerprint(model, model_type=None) ... Return a string identifying the
+    geometry of a model shape or mesh, see shapeFingerprint()."""
+    if model_type == "M":
+        mesh = model.Mesh
+        bb = mesh.BoundBox
+        data = array.array(
+            "d",
+            (mesh.CountPoints, mesh.CountFacets, mesh.Area, mesh.Volume)
+            + (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax),
+        )
+        return "Mesh:" + hashlib.sha1(data.tobytes()).hexdigest()
+    if hasattr(model, "Shape"):
+        return shapeFingerprint(model.Shape)
+    return shapeFingerprint(model)
+
+
+class STLCache:
+    """Least recently used cache of OCL STL objects.
+    STLCache(size, directory="")
+    The STL objects are identified by a key, see getSTL(). At most size STL objects
+    are kept in memory, a size of 0 disables the cache. If directory is set, the
+    triangles are also stored in files in this directory and read from there, if
+    an STL object is not in memory."""
+
+    def __init__(self, size, directory=""):
+        self.size = size
+        self.directory = directory
+        self.stls = collections.OrderedDict()
+
+    def setLimits(self, size, directory=""):
+        self.size = size
+        self.directory = directory
+        self._evict()
+
+    def clear(self):
+        self.stls.clear()
+
+    def getSTL(self, key, makeFacets, ocl):
+        """getSTL(key, makeFacets, ocl) ... Return the ocl.STLSurf object of key.
+        key is a tuple of strings and numbers, which identifies the model geometry and all
+        parameters of the tessellation. If the STL object is not cached, makeFacets() is
+        called to get the triangle coordinates, see _getFacets()."""
+        if self.size < 1:
+            return _facetsToSTL(makeFacets(), ocl)
+
+        stl = self.stls.get(key)
+        if stl is not None:
+            Path.Log.debug("STL cache hit: {}".format(key[0]))
+            self.stls.move_to_end(key)
+            return stl
+
+        coords = self._readFacets(key)
+        if coords is None:
+            coords = makeFacets()
+            self._writeFacets(key, coords)
+        stl = _facetsToSTL(coords, ocl)
+        self.stls[key] = stl
+        self._evict()
+        return stl
+
+    def _evict(self):
+        while len(self.stls) > max(self.size, 0):
+            self.stls.popitem(last=False)
+
+    def _fileName(self, key):
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".stlcache")
+
+    def _readFacets(self, key):
+        if not self.directory:
+            return None
+        fileName = self._fileName(key)
+        if not os.path.isfile(fileName):
+            return None
+        coords = array.array("d")
+        try:
+            with open(fileName, "rb") as fp:
+                coords.frombytes(fp.read())
+        except (OSError, ValueError) as ee:
+            Path.Log.warning("Unable to read STL cache file {}: {}".format(fileName, ee))
+            return None
+        return coords
+
+    def _writeFacets(self, key, coords):
+        if not self.directory:
+            return
+        fileName = self._fileName(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so other sessions never read partial data
+            tmpName = "{}.{}.tmp".format(fileName, os.getpid())
+            with open(tmpName, "wb") as fp:
+                fp.write(coords.tobytes())
+            os.replace(tmpName, fileName)
+        except OSError as ee:
+            Path.Log.warning("Unable to write STL cache file {}: {}".format(fileName, ee))
+
+
+def getSTLCache(JOB):
+    """getSTLCache(JOB) ... Return the STL cache shared by all operations of the Job.
+    Size and directory of the cache are taken from the CAM preferences."""
+    size = Path.Preferences.stlCacheSize()
+    directory = Path.Preferences.stlCacheDirectory()
+    proxy = getattr(JOB, "Proxy", None)
+    cache = getattr(proxy, "stlCache", None)
+    if cache is None:
+        cache = STLCache(size, directory)
+        if proxy is not None:
+            proxy.stlCache = cache
+    else:
+        cache.setLimits(size, directory)
+    return cache
+
+
 # Functions to convert path geometry into line/arc segments for OCL input or directly to g-code
 def pathGeomToLinesPointSet(self, obj, compGeoShp):
     """pathGeomToLinesPointSet(self, obj, compGeoShp)...
@@ -2718,3 +2908,90 @@ def makeExtendedBoundBox(wBB, bbBfr, zDep):
     L4 = Part.makeLine(p4, p1)
 
     return Part.Face(Part.Wire([L1, L2, L3, L4]))
+
+
+# Support functions for running OCL scans on a process pool
+# The worker processes are forked, so they inherit the OCL STL, cutter and
+# drop cutter objects of the operation instead of receiving pickled copies.
+# Only the tile descriptions and the resulting point coordinates are passed
+# between the processes.
+_scanTask = None
+
+
+def getScanWorkerCount(obj):
+    """getScanWorkerCount(obj) ... Return the number of worker processes to use for
+    the OCL scans of the operation, based on the ScanWorkers property.
+    Values below one use all available CPU cores. The scans run in this process
+    if forked worker processes are not available on the platform."""
+    workers = getattr(obj, "ScanWorkers", 1)
+    if workers < 1:
+        workers = os.cpu_count() or 1
+    if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        Path.Log.debug("Forked worker processes are not available, scanning in one process.")
+        workers = 1
+    return workers
+
+
+def makeScanTiles(count, workers, tilesPerWorker=4):
+    """makeScanTiles(count, workers, tilesPerWorker=4) ... Split the indexes of count scan
+    items into consecutive (start, stop) tiles, a few per worker to balance the load."""
+    if count == 0:
+        return []
+    tileCount = max(1, min(count, workers * tilesPerWorker))
+    size, rest = divmod(count, tileCount)
+    tiles = []
+    start = 0
+    for t in range(tileCount):
+        stop = start + size + (1 if t < rest else 0)
+        tiles.append((start, stop))
+        start = stop
+    return tiles
+
+
+def _initScanWorker():
+    func, shared, initFunc = _scanTask
+    if initFunc is not None:
+        initFunc(shared)
+
+
+def _runScanTile(tile):
+    func, shared, initFunc = _scanTask
+    return func(shared, tile)
+
+
+def runScanTiles(func, shared, tiles, workers, initFunc=None):
+    """runScanTiles(func, shared, tiles, workers, initFunc=None) ... Call func(shared, tile)
+    for every tile and return the results in the order of tiles.
+    With more than one worker the tiles are processed on a pool of forked processes,
+    initFunc(shared) is called once in every worker process before its first tile.
+    func and shared are inherited by the workers, the tiles and the results are pickled.
+    Returns None if the worker processes can not be started or fail, the caller
+    then falls back to its scan in this process."""
+    global _scanTask
+
+    if workers > 1 and len(tiles) > 1:
+        _scanTask = (func, shared, initFunc)
+        try:
+            context = multiprocessing.get_context("fork")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(workers, len(tiles)),
+                mp_context=context,
+                initializer=_initScanWorker,
+            ) as executor:
+                return list(executor.map(_runScanTile, tiles))
+        except (OSError, concurrent.futures.BrokenExecutor) as ee:
+            Path.Log.warning("Scan worker processes failed, scanning in one process: " + str(ee))
+        finally:
+            _scanTask = None
+        return None
+
+    return [func(shared, tile) for tile in tiles]
+
+
+def setOclSingleThread(op):
+    """setOclSingleThread(op) ... Limit an OCL operation to one OpenMP thread.
+    Used as initFunc of runScanTiles, the process pool provides the parallelism and
+    the OpenMP runtime is not usable in forked processes after it has been used
+    by the parent process."""
+    if hasattr(op, "setThreads"):
+        op.setThreads(1)
@@ -113,36 +113,15 @@ def _collectVoronoiWires(vd):
 
 
 def _sortVoronoiWires(wires, start=FreeCAD.Vector(0, 0, 0)):
-    def closestTo(start, point):
-        p = None
-        l = None
-        for i in point:
-            if l is None or l > start.distanceToPoint(point[i]):
-                l = start.distanceToPoint(point[i])
-                p = i
-        return (p, l)
-
-    begin = {}
-    end = {}
-
-    for i, w in enumerate(wires):
-        begin[i] = w[0].Vertices[0].toPoint()
-        end[i] = w[-1].Vertices[1].toPoint()
+    begin = [w[0].Vertices[0].toPoint() for w in wires]
+    end = [w[-1].Vertices[1].toPoint() for w in wires]
 
     result = []
-    while begin:
-        (bIdx, bLen) = closestTo(start, begin)
-        (eIdx, eLen) = closestTo(start, end)
-        if bLen < eLen:
-            result.append(wires[bIdx])
-            start = end[bIdx]
-            del begin[bIdx]
-            del end[bIdx]
+    for i, flip in PathUtils.sort_wires(begin, end, start):
+        if flip:
+            result.append([e.Twin for e in reversed(wires[i])])
         else:
-            result.append([e.Twin for e in reversed(wires[eIdx])])
-            start = begin[eIdx]
-            del begin[eIdx]
-            del end[eIdx]
+            result.append(wires[i])
 
     return result
 
@@ -47,6 +47,7 @@ import Path.Op.Base as PathOp
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
+import numpy
 import time
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -436,6 +437,15 @@ class ObjectWaterline(PathOp.ObjectOp):
                     "Feedback: three smallest gaps identified in the path geometry.",
                 ),
             ),
+            (
+                "App::PropertyInteger",
+                "ScanWorkers",
+                "Optimization",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Number of worker processes for the waterline layers. The default 1 computes the layers in a single process, set to 0 to use all CPU cores.",
+                ),
+            ),
             (
                 "App::PropertyVectorDistance",
                 "StartPoint",
@@ -483,6 +493,7 @@ class ObjectWaterline(PathOp.ObjectOp):
             "AvoidLastX_Faces": 0,
             "PatternCenterCustom": FreeCAD.Vector(0.0, 0.0, 0.0),
             "GapThreshold": 0.005,
+            "ScanWorkers": 1,
             "AngularDeflection": 0.25,
             "LinearDeflection": 0.0001,
             # For debugging
@@ -1238,32 +1249,28 @@ class ObjectWaterline(PathOp.ObjectOp):
         oclScan = self._waterlineDropCutScan(
             stl, smplInt, xmin, xmax, ymin, depthparams[lenDP - 1], numScanLines
         )
-        oclScan = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in oclScan]
         lenOS = len(oclScan)
         ptPrLn = int(lenOS / numScanLines)
 
-        # Convert oclScan list of points to multi-dimensional list
-        scanLines = []
-        for L in range(0, numScanLines):
-            scanLines.append([])
-            for P in range(0, ptPrLn):
-                pi = L * ptPrLn + P
-                scanLines[L].append(oclScan[pi])
-        lenSL = len(scanLines)
-        pntsPerLine = len(scanLines[0])
-        msg = "--OCL scan: " + str(lenSL * pntsPerLine) + " points, with "
-        msg += str(numScanLines) + " lines and " + str(pntsPerLine) + " pts/line"
+        # Convert oclScan list of points to grid of points, one row per scan line
+        scanGrid = numpy.array(
+            [(P.x, P.y, P.z + depOfst) for P in oclScan[: numScanLines * ptPrLn]],
+            dtype=float,
+        ).reshape(numScanLines, ptPrLn, 3)
+        msg = "--OCL scan: " + str(numScanLines * ptPrLn) + " points, with "
+        msg += str(numScanLines) + " lines and " + str(ptPrLn) + " pts/line"
         Path.Log.debug(msg)
 
         # Extract Wl layers per depthparams
-        lyr = 0
-        cmds = []
         layTime = time.time()
         self.topoMap = []
-        for layDep in depthparams:
-            cmds = self._getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine)
-            commands.extend(cmds)
-            lyr += 1
+        layerLoops = self._getWaterlineLayers(obj, scanGrid[:, :, 2], depthparams)
+        for lyr in range(0, lenDP):
+            for loop in layerLoops[lyr]:
+                idx = numpy.array(loop, dtype=int)
+                pnts = scanGrid[idx[:, 0], idx[:, 1]].tolist()
+                loop = [FreeCAD.Vector(x, y, z) for (x, y, z) in pnts]
+                commands.extend(self._loopToGcode(obj, depthparams[lyr], loop))
         Path.Log.debug("--All layer scans combined took " + str(time.time() - layTime) + " s")
         return commands
 
@@ -1290,130 +1297,129 @@ class ObjectWaterline(PathOp.ObjectOp):
         # return the list of points
         return pdc.getCLPoints()
 
-    def _getWaterline(self, obj, scanLines, layDep, lyr, lenSL, pntsPerLine):
-        """_getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine) ... Get waterline."""
-        commands = []
-        cmds = []
-        loopList = []
-        self.topoMap = []
-        # Create topo map from scanLines (highs and lows)
-        self.topoMap = self._createTopoMap(scanLines, layDep, lenSL, pntsPerLine)
-        # Add buffer lines and columns to topo map
-        self._bufferTopoMap(lenSL, pntsPerLine)
+    def _getWaterlineLayers(self, obj, zGrid, depthparams):
+        """_getWaterlineLayers(obj, zGrid, depthparams) ... Get the waterline loops of all layers.
+        The layers are independent of each other and are computed on a process pool
+        when more than one worker is available. Returns one list of loops per layer,
+        in the order of depthparams."""
+        lenDP = len(depthparams)
+        workers = PathSurfaceSupport.getScanWorkerCount(obj)
+        results = None
+        if workers > 1 and lenDP > 1:
+            tiles = PathSurfaceSupport.makeScanTiles(lenDP, workers, tilesPerWorker=1)
+            results = PathSurfaceSupport.runScanTiles(
+                self._waterlineTileLayers, (zGrid, depthparams), tiles, workers
+            )
+        if results is None:
+            return self._waterlineTileLayers((zGrid, depthparams), (0, lenDP))
+        return [loops for tile in results for loops in tile]
+
+    def _waterlineTileLayers(self, shared, tile):
+        (zGrid, depthparams) = shared
+        (start, stop) = tile
+        return [self._getWaterline(zGrid, depthparams[lyr], lyr) for lyr in range(start, stop)]
+
+    def _getWaterline(self, zGrid, layDep, lyr):
+        """_getWaterline(zGrid, layDep, lyr) ... Get waterline loops of one layer.
+        Each loop is a list of (line, point) indexes into the OCL scan grid."""
+        # Create topo map from scan heights (highs and lows)
+        self.topoMap = self._createTopoMap(zGrid, layDep)
         # Identify layer waterline from OCL scan
         self._highlightWaterline(4, 9)
-        # Extract waterline and convert to gcode
-        loopList = self._extractWaterlines(obj, scanLines, lyr, layDep)
-        # save commands
-        for loop in loopList:
-            cmds = self._loopToGcode(obj, layDep, loop)
-            commands.extend(cmds)
-        return commands
-
-    def _createTopoMap(self, scanLines, layDep, lenSL, pntsPerLine):
-        """_createTopoMap(scanLines, layDep, lenSL, pntsPerLine) ... Create topo map version of OCL scan data."""
-        topoMap = []
-        for L in range(0, lenSL):
-            topoMap.append([])
-            for P in range(0, pntsPerLine):
-                if scanLines[L][P].z > layDep:
-                    topoMap[L].append(2)
-                else:
-                    topoMap[L].append(0)
+        # Extract waterline loops
+        return self._extractWaterlines(lyr)
+
+    def _createTopoMap(self, zGrid, layDep):
+        """_createTopoMap(zGrid, layDep) ... Create topo map version of OCL scan data,
+        with a buffer border of zeros on all sides."""
+        topoMap = numpy.zeros((zGrid.shape[0] + 2, zGrid.shape[1] + 2), dtype=numpy.int8)
+        topoMap[1:-1, 1:-1][zGrid > layDep] = 2
         return topoMap
 
-    def _bufferTopoMap(self, lenSL, pntsPerLine):
-        """_bufferTopoMap(lenSL, pntsPerLine) ... Add buffer boarder of zeros to all sides to topoMap data."""
-        pre = [0, 0]
-        post = [0, 0]
-        for p in range(0, pntsPerLine):
-            pre.append(0)
-            post.append(0)
-        for i in range(0, lenSL):
-            self.topoMap[i].insert(0, 0)
-            self.topoMap[i].append(0)
-        self.topoMap.insert(0, pre)
-        self.topoMap.append(post)
-        return True
-
     def _highlightWaterline(self, extraMaterial, insCorn):
         """_highlightWaterline(extraMaterial, insCorn) ... Highlight the waterline data, separating from extra material."""
         TM = self.topoMap
-        lastPnt = len(TM[1]) - 1
-        lastLn = len(TM) - 1
-        highFlag = 0
+        lastPnt = TM.shape[1] - 1
+        lastLn = TM.shape[0] - 1
+        inner = TM[1:lastLn, 1:lastPnt]
 
         # ("--Convert parallel data to ridges")
-        for lin in range(1, lastLn):
-            for pt in range(1, lastPnt):  # Ignore first and last points
-                if TM[lin][pt] == 0:
-                    if TM[lin][pt + 1] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin][pt - 1] == 2:  # step down
-                        TM[lin][pt] = 1
+        high = TM == 2
+        inner[(inner == 0) & (high[1:lastLn, 2:] | high[1:lastLn, :-2])] = 1
 
         # ("--Convert perpendicular data to ridges and highlight ridges")
-        for pt in range(1, lastPnt):  # Ignore first and last points
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 0:
-                    highFlag = 0
-                    if TM[lin + 1][pt] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin - 1][pt] == 2:  # step down
-                        TM[lin][pt] = 1
-                elif TM[lin][pt] == 2:
-                    highFlag += 1
-                    if highFlag == 3:
-                        if TM[lin - 1][pt - 1] < 2 or TM[lin - 1][pt + 1] < 2:
-                            highFlag = 2
-                        else:
-                            TM[lin - 1][pt] = extraMaterial
-                            highFlag = 2
+        # The points are visited column by column. A high point is extra material
+        # once three high points follow the last low point, ridge points are skipped.
+        low = inner == 0
+        seq = inner.T.ravel()
+        highCnt = numpy.cumsum(seq == 2)
+        lastLow = numpy.where(seq == 0, numpy.arange(len(seq)), -1)
+        numpy.maximum.accumulate(lastLow, out=lastLow)
+        highRun = highCnt - numpy.where(lastLow < 0, 0, highCnt[lastLow])
+        extra = ((seq == 2) & (highRun >= 3)).reshape(lastPnt - 1, lastLn - 1).T
+        # The point before an extra material point is marked, if the points left
+        # and right of it are high. The left column has already been marked then.
+        high = TM >= 2
+        rightHigh = high[0 : lastLn - 1, 2:].copy()
+        mark = extra & rightHigh & high[0 : lastLn - 1, :-2]
+        while True:
+            high[0 : lastLn - 1, 1:lastPnt] |= mark
+            nextMark = extra & rightHigh & high[0 : lastLn - 1, :-2]
+            if numpy.array_equal(nextMark, mark):
+                break
+            mark = nextMark
+        inner[low & (high[2:, 1:lastPnt] | high[:-2, 1:lastPnt])] = 1
+        TM[0 : lastLn - 1, 1:lastPnt][mark] = extraMaterial
 
         # ("--Square corners")
         for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
+            lines = (numpy.flatnonzero(TM[1:lastLn, pt] == 1) + 1).tolist()
+            i = 0
+            while i < len(lines):
+                lin = lines[i]
+                i += 1
+                cont = True
+                if TM[lin + 1, pt] == 0:  # forward == 0
+                    if TM[lin + 1, pt - 1] == 1:  # forward left == 1
+                        if TM[lin, pt - 1] == 2:  # left == 2
+                            TM[lin + 1, pt] = 1  # square the corner
+                            cont = False
+
+                    if cont is True and TM[lin + 1, pt + 1] == 1:  # forward right == 1
+                        if TM[lin, pt + 1] == 2:  # right == 2
+                            TM[lin + 1, pt] = 1  # square the corner
                     cont = True
-                    if TM[lin + 1][pt] == 0:  # forward == 0
-                        if TM[lin + 1][pt - 1] == 1:  # forward left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin + 1][pt + 1] == 1:  # forward right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                        cont = True
-
-                    if TM[lin - 1][pt] == 0:  # back == 0
-                        if TM[lin - 1][pt - 1] == 1:  # back left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin - 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin - 1][pt + 1] == 1:  # back right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin - 1][pt] = 1  # square the corner
+
+                    if TM[lin + 1, pt] == 1 and lin + 1 < lastLn:
+                        lines.insert(i, lin + 1)  # visit the new corner point next
+
+                if TM[lin - 1, pt] == 0:  # back == 0
+                    if TM[lin - 1, pt - 1] == 1:  # back left == 1
+                        if TM[lin, pt - 1] == 2:  # left == 2
+                            TM[lin - 1, pt] = 1  # square the corner
+                            cont = False
+
+                    if cont is True and TM[lin - 1, pt + 1] == 1:  # back right == 1
+                        if TM[lin, pt + 1] == 2:  # right == 2
+                            TM[lin - 1, pt] = 1  # square the corner
 
         # remove inside corners
         for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
-                    if TM[lin][pt + 1] == 1:
-                        if TM[lin - 1][pt + 1] == 1 or TM[lin + 1][pt + 1] == 1:
-                            TM[lin][pt + 1] = insCorn
-                    elif TM[lin][pt - 1] == 1:
-                        if TM[lin - 1][pt - 1] == 1 or TM[lin + 1][pt - 1] == 1:
-                            TM[lin][pt - 1] = insCorn
+            for lin in (numpy.flatnonzero(TM[1:lastLn, pt] == 1) + 1).tolist():
+                if TM[lin, pt + 1] == 1:
+                    if TM[lin - 1, pt + 1] == 1 or TM[lin + 1, pt + 1] == 1:
+                        TM[lin, pt + 1] = insCorn
+                elif TM[lin, pt - 1] == 1:
+                    if TM[lin - 1, pt - 1] == 1 or TM[lin + 1, pt - 1] == 1:
+                        TM[lin, pt - 1] = insCorn
 
         return True
 
-    def _extractWaterlines(self, obj, oclScan, lyr, layDep):
-        """_extractWaterlines(obj, oclScan, lyr, layDep) ... Extract water lines from OCL scan data."""
+    def _extractWaterlines(self, lyr):
+        """_extractWaterlines(lyr) ... Extract water lines from OCL scan data."""
         srch = True
-        lastPnt = len(self.topoMap[0]) - 1
-        lastLn = len(self.topoMap) - 1
+        lastPnt = self.topoMap.shape[1] - 1
+        lastLn = self.topoMap.shape[0] - 1
         maxSrchs = 5
         srchCnt = 1
         loopList = []
@@ -1536,15 +1542,16 @@ class ObjectWaterline(PathOp.ObjectOp):
                     + " reached\nPossible incomplete waterline result!"
                 )
                 break
-            for L in range(1, lastLn):
-                for P in range(1, lastPnt):
-                    if self.topoMap[L][P] == 1:
-                        # start loop follow
-                        srch = True
-                        loopNum += 1
-                        loop = self._trackLoop(oclScan, lC, pC, L, P, loopNum)
-                        self.topoMap[L][P] = 0  # Mute the starting point
-                        loopList.append(loop)
+            # Tracking loops only mutes points, so start points are among the current ones
+            starts = numpy.argwhere(self.topoMap[1:lastLn, 1:lastPnt] == 1) + 1
+            for L, P in starts.tolist():
+                if self.topoMap[L, P] == 1:
+                    # start loop follow
+                    srch = True
+                    loopNum += 1
+                    loop = self._trackLoop(lC, pC, L, P, loopNum)
+                    self.topoMap[L, P] = 0  # Mute the starting point
+                    loopList.append(loop)
             srchCnt += 1
         Path.Log.debug(
             "Search count for layer "
@@ -1557,9 +1564,10 @@ class ObjectWaterline(PathOp.ObjectOp):
         )
         return loopList
 
-    def _trackLoop(self, oclScan, lC, pC, L, P, loopNum):
-        """_trackLoop(oclScan, lC, pC, L, P, loopNum) ... Track the loop direction."""
-        loop = [oclScan[L - 1][P - 1]]  # Start loop point list
+    def _trackLoop(self, lC, pC, L, P, loopNum):
+        """_trackLoop(lC, pC, L, P, loopNum) ... Track the loop direction.
+        Returns the loop as list of (line, point) indexes into the OCL scan grid."""
+        loop = [(L - 1, P - 1)]  # Start loop point list
         cur = [L, P, 1]
         prv = [L, P - 1, 1]
         nxt = [L, P + 1, 1]
@@ -1582,8 +1590,8 @@ class ObjectWaterline(PathOp.ObjectOp):
                 )
                 break
             nxt = self._findNextWlPoint(lC, pC, cur[0], cur[1], prv[0], prv[1])  # get next point
-            loop.append(oclScan[nxt[0] - 1][nxt[1] - 1])  # add it to loop point list
-            self.topoMap[nxt[0]][nxt[1]] = nxt[2]  # Mute the point, if not Y stem
+            loop.append((nxt[0] - 1, nxt[1] - 1))  # add it to loop point list
+            self.topoMap[nxt[0], nxt[1]] = nxt[2]  # Mute the point, if not Y stem
             if nxt[0] == L and nxt[1] == P:  # check if loop complete
                 follow = False
             elif nxt[0] == cur[0] and nxt[1] == cur[1]:  # check if line cannot be detected
@@ -1623,7 +1631,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         for r in range(0, 8):
             l = cl + lC[s + r]
             p = cp + pC[s + r]
-            if self.topoMap[l][p] == 1:
+            if self.topoMap[l, p] == 1:
                 return [l, p, num]
 
         # ("_findNext: No next pnt found")
@@ -1710,7 +1718,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         self.showDebugObject(trimFace, "TrimFace")
 
         # Cycle through layer depths
-        CUTAREAS = self._getCutAreas(base.Shape, depthparams, bbFace, trimFace, borderFace)
+        CUTAREAS = self._getCutAreas(obj, base.Shape, depthparams, bbFace, trimFace, borderFace)
         if not CUTAREAS:
             Path.Log.error("No cross-section cut areas identified.")
             return commands
@@ -1798,8 +1806,8 @@ class ObjectWaterline(PathOp.ObjectOp):
 
         return commands
 
-    def _getCutAreas(self, shape, depthparams, bbFace, trimFace, borderFace):
-        """_getCutAreas(JOB, shape, depthparams, bbFace, borderFace) ...
+    def _getCutAreas(self, obj, shape, depthparams, bbFace, trimFace, borderFace):
+        """_getCutAreas(obj, shape, depthparams, bbFace, trimFace, borderFace) ...
         Takes shape, depthparams and base-envelope-cross-section, and
         returns a list of cut areas - one for each depth."""
         Path.Log.debug("_getCutAreas()")
@@ -1807,20 +1815,16 @@ class ObjectWaterline(PathOp.ObjectOp):
         CUTAREAS = list()
         isFirst = True
         lenDP = len(depthparams)
+        layerFaces = self._getLayerSolidAreas(obj, shape, depthparams)
 
         # Cycle through layer depths
         for dp in range(0, lenDP):
             csHght = depthparams[dp]
             # Path.Log.debug('Depth {} is {}'.format(dp + 1, csHght))
 
-            # Get slice at depth of shape
-            csFaces = self._getModelCrossSection(shape, csHght)  # returned at Z=0.0
+            # Get solid areas of slice at depth of shape
+            (csFaces, useFaces) = layerFaces[dp]
             if csFaces:
-                if len(csFaces) > 0:
-                    useFaces = self._getSolidAreasFromPlanarFaces(csFaces)
-                else:
-                    useFaces = False
-
                 if useFaces:
                     compAdjFaces = Part.makeCompound(useFaces)
                     self.showDebugObject(compAdjFaces, "Solids_{}".format(dp + 1))
@@ -1845,6 +1849,57 @@ class ObjectWaterline(PathOp.ObjectOp):
 
         return False
 
+    def _getLayerSolidAreas(self, obj, shape, depthparams):
+        """_getLayerSolidAreas(obj, shape, depthparams) ...
+        Returns a (csFaces, useFaces) tuple for the slice of shape at every depth.
+        The slices are independent of each other and are computed on a process pool
+        when more than one worker is available."""
+        lenDP = len(depthparams)
+        workers = PathSurfaceSupport.getScanWorkerCount(obj)
+        results = None
+        if workers > 1 and lenDP > 1:
+            tiles = PathSurfaceSupport.makeScanTiles(lenDP, workers, tilesPerWorker=1)
+            results = PathSurfaceSupport.runScanTiles(
+                self._solidAreasTile, (shape, depthparams), tiles, workers
+            )
+        if results is None:
+            return [self._getLayerSolidArea(shape, csHght) for csHght in depthparams]
+
+        # Shapes are returned by the worker processes as BREP strings
+        layerFaces = list()
+        for tile in results:
+            for csFaces, breps in tile:
+                useFaces = False
+                if breps:
+                    useFaces = list()
+                    for brep in breps:
+                        face = Part.Shape()
+                        face.importBrepFromString(brep, False)
+                        useFaces.append(face)
+                layerFaces.append((csFaces, useFaces))
+        return layerFaces
+
+    def _solidAreasTile(self, shared, tile):
+        (shape, depthparams) = shared
+        (start, stop) = tile
+        result = list()
+        for dp in range(start, stop):
+            (csFaces, useFaces) = self._getLayerSolidArea(shape, depthparams[dp])
+            breps = False
+            if useFaces:
+                breps = [face.exportBrepToString() for face in useFaces]
+            result.append((csFaces, breps))
+        return result
+
+    def _getLayerSolidArea(self, shape, csHght):
+        """_getLayerSolidArea(shape, csHght) ... Returns (csFaces, useFaces) tuple,
+        csFaces is True if shape has a cross-section at csHght,
+        useFaces are the solid areas of that cross-section, returned at Z=0.0."""
+        csFaces = self._getModelCrossSection(shape, csHght)  # returned at Z=0.0
+        if csFaces:
+            return (True, self._getSolidAreasFromPlanarFaces(csFaces))
+        return (False, False)
+
     def _wiresToWaterlinePath(self, obj, ofstPlnrShp, csHght):
         Path.Log.debug("_wiresToWaterlinePath()")
         commands = list()
@@ -121,7 +121,9 @@ class CommandPathPost:
 
         return self.candidate is not None
 
-    def _write_file(self, filename, gcode, policy):
+    def _resolve_filename(self, filename, policy):
+        """Apply the output policy to filename, returns the name of the file
+        to write or None if the user cancelled."""
         if policy == "Open File Dialog":
             dlg = QtGui.QFileDialog()
             dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
@@ -131,17 +133,13 @@ class CommandPathPost:
             if dlg.exec_():
                 filename = dlg.selectedFiles()[0]
                 Path.Log.debug(filename)
-                with open(filename, "w") as f:
-                    f.write(gcode)
             else:
-                return
+                return None
 
         elif policy == "Append Unique ID on conflict":
             while os.path.isfile(filename):
                 base, ext = os.path.splitext(filename)
                 filename = f"{base}-1{ext}"
-            with open(filename, "w") as f:
-                f.write(gcode)
 
         elif policy == "Open File Dialog on conflict":
             if os.path.isfile(filename):
@@ -153,20 +151,54 @@ class CommandPathPost:
                 if dlg.exec_():
                     filename = dlg.selectedFiles()[0]
                     Path.Log.debug(filename)
-                    with open(filename, "w") as f:
-                        f.write(gcode)
                 else:
-                    return
-            else:
-                with open(filename, "w") as f:
-                    f.write(gcode)
+                    return None
+
+        # else Overwrite
+        return filename
+
+    def _write_file(self, filename, gcode, policy):
+        filename = self._resolve_filename(filename, policy)
+        if filename is None:
+            return
 
-        else:  # Overwrite
-            with open(filename, "w") as f:
-                f.write(gcode)
+        with open(filename, "w") as f:
+            f.write(gcode)
 
         FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
 
+    def _export_to_files(self, postprocessor, policy):
+        """Let the postprocessor write the sections directly to the files, the
+        G-code of a section is written while it is produced.
+        Returns False if there was an error during argument processing."""
+        generator = FilenameGenerator(job=self.candidate)
+        generated_filename = generator.generate_filenames()
+
+        def get_filename(subpart):
+            # get a name for the file
+            subpart = "" if subpart == "allitems" else subpart
+            Path.Log.debug(subpart)
+            generator.set_subpartname(subpart)
+            return self._resolve_filename(next(generated_filename), policy)
+
+        progress_bar = FreeCAD.Base.ProgressIndicator()
+        progress_bar.start(translate("CAM_Post", "Post processing the Job ..."), 0)
+
+        def progress(done, count, label):
+            Path.Log.debug(f"Post processed {label} ({done}/{count})")
+            progress_bar.next()
+
+        try:
+            written = postprocessor.export_to_files(get_filename, progress)
+        finally:
+            progress_bar.stop()
+        if written is None:
+            return False
+
+        for filename in written:
+            FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
+        return True
+
     def Activated(self):
         """
         Handles the activation of post processing, initiating the process based
@@ -184,6 +216,15 @@ class CommandPathPost:
 
         # get a postprocessor
         postprocessor = PostProcessorFactory.get_post_processor(self.candidate, postprocessor_name)
+        policy = Path.Preferences.defaultOutputPolicy()
+
+        if getattr(postprocessor, "streaming_export", False):
+            if self._export_to_files(postprocessor, policy):
+                FreeCAD.ActiveDocument.commitTransaction()
+                FreeCAD.ActiveDocument.recompute()
+            else:
+                FreeCAD.ActiveDocument.abortTransaction()
+            return
 
         post_data = postprocessor.export()
         # None is returned if there was an error during argument processing
@@ -192,7 +233,6 @@ class CommandPathPost:
             FreeCAD.ActiveDocument.abortTransaction()
             return
 
-        policy = Path.Preferences.defaultOutputPolicy()
         generator = FilenameGenerator(job=self.candidate)
         generated_filename = generator.generate_filenames()
 
@@ -33,7 +33,7 @@ import os
 from PySide import QtCore, QtGui
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import Path.Base.Util as PathUtil
 import Path.Post.UtilsArguments as PostUtilsArguments
@@ -65,12 +65,14 @@ class _TempObject:
 # Define some types that are used throughout this file.
 #
 Defaults = Dict[str, bool]
+FilenameFunction = Callable[[str], Optional[str]]
 FormatHelp = str
 GCodeOrNone = Optional[str]
 GCodeSections = List[Tuple[str, GCodeOrNone]]
 Parser = argparse.ArgumentParser
 ParserArgs = Union[None, str, argparse.Namespace]
 Postables = Union[List, List[Tuple[str, List]]]
+Progress = Optional[Callable[[int, int, str], None]]
 Section = Tuple[str, List]
 Sublist = List
 Units = str
@@ -147,6 +149,19 @@ class PostProcessor:
         """Get the units used by the post processor."""
         return self._units
 
+    @property
+    def streaming_export(self) -> bool:
+        """True if export_to_files produces the same output as export.
+
+        Postprocessors that override export or process_postables have to be
+        exported with export and their sections written by the caller.
+        """
+        cls = type(self)
+        return (
+            cls.export is PostProcessor.export
+            and cls.process_postables is PostProcessor.process_postables
+        )
+
     def _buildPostList(self):
         """
         determines the specific objects and order to postprocess
@@ -329,6 +344,41 @@ class PostProcessor:
         #
         return [("allitems", args)]  # type: ignore
 
+    def export_to_files(
+        self, get_filename: FilenameFunction, progress: Progress = None
+    ) -> Union[None, List[str]]:
+        """Process the parser arguments, then postprocess the 'postables' directly to files.
+
+        Every section is written to the file named by get_filename(partname) while it
+        is produced, so the whole program is never held in memory.  A section is skipped
+        if get_filename returns None.  progress is called as progress(done, count, label)
+        after each object of a section.  Returns the list of files written, or None if
+        there was an error during argument processing.
+        """
+        args: ParserArgs
+        filename: Optional[str]
+        flag: bool
+
+        Path.Log.debug("Exporting the job to files")
+
+        (flag, args) = self.process_arguments()
+        if flag:
+            return self.process_postables_to_files(get_filename, progress)
+        if args is None:
+            return None
+        #
+        # Otherwise args will contain the argument list formatted for output
+        # instead of the "usual" gcode.
+        #
+        filename = get_filename("allitems")
+        if filename is None:
+            return []
+        with open(
+            filename, "w", encoding="utf-8", newline=self.values["END_OF_LINE_CHARACTERS"]
+        ) as f:
+            f.write(args)  # type: ignore
+        return [filename]
+
     def init_arguments(
         self,
         values: Values,
@@ -433,6 +483,32 @@ class PostProcessor:
 
         return g_code_sections
 
+    def process_postables_to_files(
+        self, get_filename: FilenameFunction, progress: Progress = None
+    ) -> List[str]:
+        """Postprocess the 'postables' in the job and write each section to its own file."""
+        #
+        # This function is separated out to make it easier to inherit from this class.
+        #
+        filename: Optional[str]
+        partname: str
+        postables: Postables
+        sublist: Sublist
+        written: List[str] = []
+
+        postables = self._buildPostList()
+
+        Path.Log.debug(f"postables count: {len(postables)}")
+
+        for partname, sublist in postables:
+            filename = get_filename(partname)
+            if filename is None:
+                continue
+            if PostUtilsExport.export_common_to_file(self.values, sublist, filename, progress):
+                written.append(filename)
+
+        return written
+
     def reinitialize(self) -> None:
         """Initialize or reinitialize the 'core' data structures for the postprocessor."""
         #
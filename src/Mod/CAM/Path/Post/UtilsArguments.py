@@ -417,6 +417,13 @@ def init_shared_values(values: Values) -> None:
     #
     values["END_OF_LINE_CHARACTERS"] = os.linesep
     #
+    # If this is set to True, then the parameter functions are compiled
+    # for the current values before a path is parsed and the commands
+    # of the path are converted in batches.  The output is the same.
+    # Set it to False to parse every command with the generic code.
+    #
+    values["FAST_PARSE"] = True
+    #
     # The starting precision for feed is also set to 3 digits after the decimal point.
     #
     values["FEED_PRECISION"] = 3
@@ -29,7 +29,7 @@
 
 import datetime
 import os
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import FreeCAD
 import Path.Base.Util as PathUtil
@@ -39,8 +39,12 @@ import Path.Tool.Controller as PathToolController
 
 # Define some types that are used throughout this file
 Gcode = List[str]
+Progress = Optional[Callable[[int, int, str], None]]
 Values = Dict[str, Any]
 
+# The G-code editor is not shown for larger programs
+EDITOR_SIZE_LIMIT = 100000
+
 
 def check_canned_cycles(values: Values) -> None:
     """Check canned cycles for drilling."""
@@ -285,10 +289,8 @@ def output_units(values: Values, gcode: Gcode) -> None:
 
 def export_common(values: Values, objectslist, filename: str) -> str:
     """Do the common parts of postprocessing the objects in objectslist to filename."""
-    coolant_mode: str
     dia: PostUtils.GCodeEditorDialog
     final: str
-    gcode: Gcode = []
     result: bool
 
     for obj in objectslist:
@@ -299,6 +301,90 @@ def export_common(values: Values, objectslist, filename: str) -> str:
 
     print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
 
+    final = "".join(iter_export_common(values, objectslist))
+
+    if FreeCAD.GuiUp and values["SHOW_EDITOR"]:
+        if len(final) > EDITOR_SIZE_LIMIT:
+            print("Skipping editor since output is greater than 100kb")
+        else:
+            dia = PostUtils.GCodeEditorDialog()
+            dia.editor.setText(final)
+            result = dia.exec_()
+            if result:
+                final = dia.editor.toPlainText()
+
+    print("done postprocessing.")
+
+    if not filename == "-":
+        with open(
+            filename, "w", encoding="utf-8", newline=values["END_OF_LINE_CHARACTERS"]
+        ) as gfile:
+            gfile.write(final)
+
+    return final
+
+
+def export_common_to_file(
+    values: Values, objectslist, filename: str, progress: Progress = None
+) -> bool:
+    """Postprocess the objects in objectslist and write the G-code to filename as it is produced.
+
+    Unlike export_common the program is never held in memory as a whole.  If the
+    editor has to be shown and the file is not larger than the editor allows, the
+    file is read back into the editor afterwards and rewritten with the edited text.
+    The partial file is removed if postprocessing fails.
+    progress is called as progress(done, count, label) after each object.
+    Returns False if nothing was written.
+    """
+    chunk: str
+    dia: PostUtils.GCodeEditorDialog
+    final: str
+
+    for obj in objectslist:
+        if not hasattr(obj, "Path"):
+            print(f"The object {obj.Name} is not a path.")
+            print("Please select only path and Compounds.")
+            return False
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+
+    with open(filename, "w", encoding="utf-8", newline=values["END_OF_LINE_CHARACTERS"]) as gfile:
+        try:
+            for chunk in iter_export_common(values, objectslist, progress):
+                gfile.write(chunk)
+        except Exception:
+            gfile.close()
+            os.remove(filename)
+            raise
+
+    if FreeCAD.GuiUp and values["SHOW_EDITOR"]:
+        if os.path.getsize(filename) > EDITOR_SIZE_LIMIT:
+            print("Skipping editor since output is greater than 100kb")
+        else:
+            with open(filename, encoding="utf-8") as gfile:
+                final = gfile.read()
+            dia = PostUtils.GCodeEditorDialog()
+            dia.editor.setText(final)
+            if dia.exec_():
+                with open(
+                    filename, "w", encoding="utf-8", newline=values["END_OF_LINE_CHARACTERS"]
+                ) as gfile:
+                    gfile.write(dia.editor.toPlainText())
+
+    print("done postprocessing.")
+    return True
+
+
+def iter_export_common(values: Values, objectslist, progress: Progress = None) -> Iterator[str]:
+    """Do the common parts of postprocessing the objects in objectslist.
+
+    The G-code is yielded in chunks as it is produced.
+    progress is called as progress(done, count, label) after each object.
+    """
+    coolant_mode: str
+    count: int = len(objectslist)
+    gcode: Gcode = []
+
     check_canned_cycles(values)
     output_header(values, gcode)
     output_safetyblock(values, gcode)
@@ -306,20 +392,27 @@ def export_common(values: Values, objectslist, filename: str) -> str:
     output_preamble(values, gcode)
     output_motion_mode(values, gcode)
     output_units(values, gcode)
+    yield "".join(gcode)
 
-    for obj in objectslist:
+    for done, obj in enumerate(objectslist, 1):
         # Skip inactive operations
-        if not PathUtil.activeForOp(obj):
-            continue
-        coolant_mode = PathUtil.coolantModeForOp(obj)
-        output_start_bcnc(values, gcode, obj)
-        output_preop(values, gcode, obj)
-        output_coolant_on(values, gcode, coolant_mode)
-        # output the G-code for the group (compound) or simple path
-        PostUtilsParse.parse_a_group(values, gcode, obj)
-        output_postop(values, gcode, obj)
-        output_coolant_off(values, gcode, coolant_mode)
-
+        if PathUtil.activeForOp(obj):
+            gcode = []
+            coolant_mode = PathUtil.coolantModeForOp(obj)
+            output_start_bcnc(values, gcode, obj)
+            output_preop(values, gcode, obj)
+            output_coolant_on(values, gcode, coolant_mode)
+            yield "".join(gcode)
+            # output the G-code for the group (compound) or simple path
+            yield from PostUtilsParse.iter_a_group(values, obj)
+            gcode = []
+            output_postop(values, gcode, obj)
+            output_coolant_off(values, gcode, coolant_mode)
+            yield "".join(gcode)
+        if progress is not None:
+            progress(done, count, obj.Label)
+
+    gcode = []
     output_return_to(values, gcode)
     #
     # This doesn't make sense to me.  It seems that both output_start_bcnc and
@@ -332,25 +425,4 @@ def export_common(values: Values, objectslist, filename: str) -> str:
     output_tool_return(values, gcode)
     output_safetyblock(values, gcode)
     output_postamble(values, gcode)
-
-    final = "".join(gcode)
-
-    if FreeCAD.GuiUp and values["SHOW_EDITOR"]:
-        if len(final) > 100000:
-            print("Skipping editor since output is greater than 100kb")
-        else:
-            dia = PostUtils.GCodeEditorDialog()
-            dia.editor.setText(final)
-            result = dia.exec_()
-            if result:
-                final = dia.editor.toPlainText()
-
-    print("done postprocessing.")
-
-    if not filename == "-":
-        with open(
-            filename, "w", encoding="utf-8", newline=values["END_OF_LINE_CHARACTERS"]
-        ) as gfile:
-            gfile.write(final)
-
-    return final
+    yield "".join(gcode)
@@ -30,7 +30,7 @@
 
 import math
 import re
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 import FreeCAD
 from FreeCAD import Units
@@ -45,6 +45,11 @@ PathParameters = Dict[str, PathParameter]
 Values = Dict[str, Any]
 
 ParameterFunction = Callable[[Values, str, str, PathParameter, PathParameters], str]
+CompiledParameterFunction = Callable[[str, PathParameter, PathParameters, PathParameters], str]
+CompiledParameters = List[Tuple[str, CompiledParameterFunction]]
+
+# The number of commands that are converted before a batch of lines is returned
+PARSE_BATCH_SIZE: int = 1000
 
 
 def check_for_an_adaptive_op(
@@ -183,6 +188,109 @@ def check_for_tool_change(
     return False
 
 
+def compile_parameter_functions(values: Values) -> CompiledParameters:
+    """Compile the parameter functions for the current values.
+
+    Returns a list of (parameter, function) tuples in the order of values["PARAMETER_ORDER"].
+    The default parameter functions are replaced by functions with the formats and unit
+    conversions of the current values already resolved, they return the same strings.
+    Other parameter functions are called as they are.  A compiled function is called as
+    function(command, param_value, parameters, current_location).
+    """
+    axis_divisor: float = Units.Quantity(values["UNIT_FORMAT"]).Value
+    axis_format: str = f'.{str(values["AXIS_PRECISION"])}f'
+    compiled: CompiledParameters = []
+    epsilon: float = 0.00001
+    feed_divisor: float = Units.Quantity(values["UNIT_SPEED_FORMAT"]).Value
+    feed_format: str = f'.{str(values["FEED_PRECISION"])}f'
+    output_doubles: bool = values["OUTPUT_DOUBLES"]
+    parameter: str
+    parameter_functions: Dict[str, ParameterFunction] = values["PARAMETER_FUNCTIONS"]
+    rapid_moves = frozenset(values["RAPID_MOVES"])
+    spindle_format: str = f'.{str(values["SPINDLE_DECIMALS"])}f'
+
+    def make_axis_function(param: str) -> CompiledParameterFunction:
+        def axis_parameter(command, param_value, parameters, current_location):
+            if (
+                not output_doubles
+                and param in current_location
+                and math.fabs(current_location[param] - param_value) < epsilon
+            ):
+                return ""
+            return format(param_value / axis_divisor, axis_format)
+
+        return axis_parameter
+
+    def make_rotary_function(param: str) -> CompiledParameterFunction:
+        def rotary_parameter(command, param_value, parameters, current_location):
+            if (
+                not output_doubles
+                and param in current_location
+                and math.fabs(current_location[param] - param_value) < epsilon
+            ):
+                return ""
+            return format(float(param_value), axis_format)
+
+        return rotary_parameter
+
+    def make_generic_function(param: str) -> CompiledParameterFunction:
+        def generic_parameter(command, param_value, parameters, current_location):
+            return values["PARAMETER_FUNCTIONS"][param](
+                values, command, param, param_value, parameters, current_location
+            )
+
+        return generic_parameter
+
+    def length_parameter(command, param_value, parameters, current_location):
+        return format(param_value / axis_divisor, axis_format)
+
+    def int_parameter(command, param_value, parameters, current_location):
+        return str(int(param_value))
+
+    def S_parameter(command, param_value, parameters, current_location):
+        return format(float(param_value), spindle_format)
+
+    def F_parameter(command, param_value, parameters, current_location):
+        if (
+            not output_doubles
+            and "F" in current_location
+            and math.fabs(current_location["F"] - param_value) < epsilon
+        ):
+            return ""
+        if command in rapid_moves:
+            return ""
+        feed = param_value / feed_divisor
+        if feed <= 0.0:
+            return ""
+        for key in ("X", "Y", "Z", "U", "V", "W"):
+            if key in parameters and math.fabs(current_location[key] - parameters[key]) > epsilon:
+                return format(feed, feed_format)
+        if "A" in parameters or "B" in parameters or "C" in parameters:
+            # the feed is in degrees, leave that to the default function
+            return default_F_parameter(
+                values, command, "F", param_value, parameters, current_location
+            )
+        return format(feed, feed_format)
+
+    for parameter in values["PARAMETER_ORDER"]:
+        function = parameter_functions.get(parameter)
+        if function is default_axis_parameter:
+            compiled.append((parameter, make_axis_function(parameter)))
+        elif function is default_rotary_parameter:
+            compiled.append((parameter, make_rotary_function(parameter)))
+        elif function is default_length_parameter:
+            compiled.append((parameter, length_parameter))
+        elif function is default_int_parameter:
+            compiled.append((parameter, int_parameter))
+        elif function is default_S_parameter:
+            compiled.append((parameter, S_parameter))
+        elif function is default_F_parameter:
+            compiled.append((parameter, F_parameter))
+        else:
+            compiled.append((parameter, make_generic_function(parameter)))
+    return compiled
+
+
 def create_comment(values: Values, comment_string: str) -> str:
     """Create a comment from a string using the correct comment symbol."""
     if values["COMMENT_SYMBOL"] == "(":
@@ -557,6 +665,215 @@ def init_parameter_functions(parameter_functions: Dict[str, ParameterFunction])
         parameter_functions[parameter] = default_parameter_functions[parameter]
 
 
+def iter_a_group(values: Values, pathobj) -> Iterator[str]:
+    """Parse a Group (compound, project, or simple path) and yield the G-code.
+
+    The G-code is yielded in chunks of one or more lines, the chunks may be
+    written to a file as they are produced instead of collecting all of them.
+    """
+    for lines in _iter_group_lines(values, pathobj):
+        yield "".join(lines)
+
+
+def _iter_group_lines(values: Values, pathobj) -> Iterator[Gcode]:
+    """Parse a Group and yield lists of G-code lines, one line per list element."""
+    comment: str
+    gcode: Gcode
+    nl: str = "\n"
+
+    if hasattr(pathobj, "Group"):  # We have a compound or project.
+        if values["OUTPUT_COMMENTS"]:
+            comment = create_comment(values, f"Compound: {pathobj.Label}")
+            yield [f"{linenumber(values)}{comment}{nl}"]
+        for p in pathobj.Group:
+            yield from _iter_group_lines(values, p)
+    else:  # parsing simple path
+        # groups might contain non-path things like stock.
+        if not hasattr(pathobj, "Path"):
+            return
+        if values["OUTPUT_PATH_LABELS"] and values["OUTPUT_COMMENTS"]:
+            comment = create_comment(values, f"Path: {pathobj.Label}")
+            yield [f"{linenumber(values)}{comment}{nl}"]
+        if values.get("FAST_PARSE", False):
+            yield from _iter_path_lines(values, pathobj)
+        else:
+            gcode = []
+            parse_a_path(values, gcode, pathobj)
+            yield gcode
+
+
+def iter_a_path(values: Values, pathobj) -> Iterator[str]:
+    """Parse a simple Path and yield the G-code in batches of lines."""
+    for lines in _iter_path_lines(values, pathobj):
+        yield "".join(lines)
+
+
+def _iter_path_lines(values: Values, pathobj) -> Iterator[Gcode]:
+    """Parse a simple Path and yield lists of up to PARSE_BATCH_SIZE commands.
+
+    This produces the same G-code as parse_a_path.  The parameter functions are
+    compiled once for the path and the commands that need no special handling
+    (such as tool changes, drill translation or suppression) take a short route.
+    """
+    adaptive_op_variables: Tuple[bool, float, float]
+    batch: Gcode = []
+    cmd: str
+    command: str
+    command_line: CommandLine
+    compiled: CompiledParameters
+    current_location: PathParameters = {}  # keep track for no doubles
+    drill_retract_mode: str = "G98"
+    lastcommand: str = ""
+    motion_location: PathParameters = {}  # keep track of last motion location
+    nl: str = "\n"
+    parameter: str
+    parameter_value: str
+    special_commands = {"G90", "G91", "G98", "G99", "M6", "M06"}
+
+    # Check to see if values["TOOL_BEFORE_CHANGE"] is set and value is true
+    # doing it here to reduce the number of times it is checked
+    swap_tool_change_order = False
+    if "TOOL_BEFORE_CHANGE" in values and values["TOOL_BEFORE_CHANGE"]:
+        swap_tool_change_order = True
+    current_location.update(
+        # the goal is to have initial values that aren't likely to match
+        # any "real" first parameter values
+        Path.Command(
+            "G0",
+            {
+                "X": 123456789.0,
+                "Y": 123456789.0,
+                "Z": 123456789.0,
+                "U": 123456789.0,
+                "V": 123456789.0,
+                "W": 123456789.0,
+                "A": 123456789.0,
+                "B": 123456789.0,
+                "C": 123456789.0,
+                "F": 123456789.0,
+            },
+        ).Parameters
+    )
+    adaptive_op_variables = determine_adaptive_op(values, pathobj)
+    compiled = compile_parameter_functions(values)
+
+    # Commands that any of the check_for_* functions might act upon
+    # are converted the same way as in parse_a_path
+    special_commands.update(values["SUPPRESS_COMMANDS"])
+    if values["TRANSLATE_DRILL_CYCLES"]:
+        special_commands.update(values["DRILL_CYCLES_TO_TRANSLATE"])
+    if values["SPINDLE_WAIT"] > 0:
+        special_commands.update(("M3", "M03", "M4", "M04"))
+    if values["OUTPUT_ADAPTIVE"] and adaptive_op_variables[0]:
+        special_commands.update(values["RAPID_MOVES"])
+    modal: bool = values["MODAL"]
+    motion_commands = frozenset(values["MOTION_COMMANDS"])
+    number_lines: bool = values["OUTPUT_LINE_NUMBERS"]
+    space: str = values["COMMAND_SPACE"]
+    translate_drill: bool = values["TRANSLATE_DRILL_CYCLES"]
+
+    for count, c in enumerate(pathobj.Path.Commands, 1):
+        command = c.Name
+        params = c.Parameters
+
+        if command[0] != "(" and command not in special_commands:
+            if modal and command == lastcommand:
+                command_line = []
+            else:
+                command_line = [command]
+            for parameter, function in compiled:
+                if parameter in params:
+                    parameter_value = function(command, params[parameter], params, current_location)
+                    if parameter_value:
+                        command_line.append(f"{parameter}{parameter_value}")
+            lastcommand = command
+            current_location.update(params)
+            if translate_drill and command in motion_commands:
+                # Remember the current location for drill_translate
+                motion_location.update(params)
+            if command_line:
+                if number_lines:
+                    batch.append(f"{linenumber(values)}{space.join(command_line)}{nl}")
+                else:
+                    batch.append(f"{space.join(command_line)}{nl}")
+        else:
+            command_line = []
+
+            # Modify the command name if necessary
+            if command[0] == "(":
+                if not values["OUTPUT_COMMENTS"]:
+                    continue
+                if values["COMMENT_SYMBOL"] != "(" and len(command) > 2:
+                    command = create_comment(values, command[1:-1])
+            cmd = check_for_an_adaptive_op(values, command, command_line, adaptive_op_variables)
+            if cmd:
+                command = cmd
+            # Add the command name to the command line
+            command_line.append(command)
+            # if modal: suppress the command if it is the same as the last one
+            if modal and command == lastcommand:
+                command_line.pop(0)
+
+            # Now add the remaining parameters in order
+            for parameter, function in compiled:
+                if parameter in params:
+                    parameter_value = function(command, params[parameter], params, current_location)
+                    if parameter_value:
+                        command_line.append(f"{parameter}{parameter_value}")
+
+            set_adaptive_op_speed(values, command, command_line, params, adaptive_op_variables)
+            # Remember the current command
+            lastcommand = command
+            # Remember the current location
+            current_location.update(params)
+            if command in ("G90", "G91"):
+                # Remember the motion mode
+                values["MOTION_MODE"] = command
+            elif command in ("G98", "G99"):
+                # Remember the drill retract mode for drill_translate
+                drill_retract_mode = command
+            if command in motion_commands:
+                # Remember the current location for drill_translate
+                motion_location.update(params)
+            if check_for_drill_translate(
+                values,
+                batch,
+                command,
+                command_line,
+                params,
+                motion_location,
+                drill_retract_mode,
+            ):
+                command_line = []
+            check_for_spindle_wait(values, batch, command, command_line)
+            if check_for_tool_change(values, batch, command, command_line):
+                command_line = []
+            if check_for_suppressed_commands(values, batch, command, command_line):
+                command_line = []
+
+            if command_line:
+                if command in ("M6", "M06") and swap_tool_change_order:
+                    swapped_command_line = [
+                        command_line[1],
+                        command_line[0],
+                    ]  # swap the order of the commands
+                    cmd = format_command_line(values, swapped_command_line)
+                else:
+                    cmd = format_command_line(values, command_line)
+                # Add a line number to the front and a newline to the end of the command line
+                batch.append(f"{linenumber(values)}{cmd}{nl}")
+
+            check_for_tlo(values, batch, command, params)
+            check_for_machine_specific_commands(values, batch, command)
+
+        if count % PARSE_BATCH_SIZE == 0 and batch:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
 def linenumber(values: Values, space: Union[str, None] = None) -> str:
     """Output the next line number if appropriate."""
     line_num: str
@@ -656,23 +973,8 @@ def output_G81_G82_drill_moves(
 
 def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
     """Parse a Group (compound, project, or simple path)."""
-    comment: str
-    nl: str = "\n"
-
-    if hasattr(pathobj, "Group"):  # We have a compound or project.
-        if values["OUTPUT_COMMENTS"]:
-            comment = create_comment(values, f"Compound: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}{nl}")
-        for p in pathobj.Group:
-            parse_a_group(values, gcode, p)
-    else:  # parsing simple path
-        # groups might contain non-path things like stock.
-        if not hasattr(pathobj, "Path"):
-            return
-        if values["OUTPUT_PATH_LABELS"] and values["OUTPUT_COMMENTS"]:
-            comment = create_comment(values, f"Path: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}{nl}")
-        parse_a_path(values, gcode, pathobj)
+    for lines in _iter_group_lines(values, pathobj):
+        gcode.extend(lines)
 
 
 def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
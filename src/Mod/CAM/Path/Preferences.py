@@ -60,6 +60,21 @@ UseAbsoluteToolPaths = "UseAbsoluteToolPaths"
 GeometryTolerance = "GeometryTolerance"
 LibAreaCurveAccuracy = "LibAreaCurveAccuracy"
 
+# Cache of tessellated models for OCL based operations
+STLCacheSize = "STLCacheSize"
+STLCacheDirectory = "STLCacheDirectory"
+
+# Axis acceleration limits in mm/s^2 used for cycle time estimation, 0 ignores acceleration
+MachineAccelerationX = "MachineAccelerationX"
+MachineAccelerationY = "MachineAccelerationY"
+MachineAccelerationZ = "MachineAccelerationZ"
+
+# Seconds spent improving the order of locations and wires, 0 disables the improvement
+LocationOptimizationTime = "LocationOptimizationTime"
+
+# Display refreshes per second while the simulator fast forwards through a job
+SimulationFrameRate = "SimulationFrameRate"
+
 WarningSuppressRapidSpeeds = "WarningSuppressRapidSpeeds"
 WarningSuppressAllSpeeds = "WarningSuppressAllSpeeds"
 WarningSuppressSelectionMode = "WarningSuppressSelectionMode"
@@ -125,6 +140,31 @@ def defaultLibAreaCurveAccuracy():
     return preferences().GetFloat(LibAreaCurveAccuracy, 0.01)
 
 
+def stlCacheSize():
+    return preferences().GetInt(STLCacheSize, 8)
+
+
+def stlCacheDirectory():
+    return preferences().GetString(STLCacheDirectory, "")
+
+
+def machineAcceleration():
+    pref = preferences()
+    return (
+        pref.GetFloat(MachineAccelerationX, 0.0),
+        pref.GetFloat(MachineAccelerationY, 0.0),
+        pref.GetFloat(MachineAccelerationZ, 0.0),
+    )
+
+
+def locationOptimizationTime():
+    return preferences().GetFloat(LocationOptimizationTime, 0.0)
+
+
+def simulationFrameRate():
+    return preferences().GetFloat(SimulationFrameRate, 2.0)
+
+
 def defaultFilePath():
     return preferences().GetString(DefaultFilePath)
 
@@ -51,6 +51,86 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+class _ToolFileIndex(object):
+    """Index of all files found below a tool directory.
+    The index is built once and only rebuilt if a lookup fails and the modification time of one
+    of the indexed directories has changed."""
+
+    def __init__(self, root):
+        self.root = root
+        self.mtimes = None
+        self.files = {}
+
+    def build(self):
+        Path.Log.track(self.root)
+        _ToolFileIndexStats["builds"] += 1
+        self.mtimes = {}
+        self.files = {}
+        for root, ds, fs in os.walk(self.root):
+            ds.sort()
+            try:
+                self.mtimes[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            for f in sorted(fs):
+                self.files.setdefault(f, []).append(os.path.join(root, f))
+
+    def isStale(self):
+        if not self.mtimes:
+            return os.path.isdir(self.root)
+        for d, mtime in self.mtimes.items():
+            try:
+                if os.stat(d).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def lookup(self, name):
+        suffix = os.sep + os.path.normpath(name)
+        for path in self.files.get(os.path.basename(name), []):
+            if path.endswith(suffix):
+                return path
+        return None
+
+    def find(self, name):
+        if self.mtimes is None:
+            self.build()
+        path = self.lookup(name)
+        if path is None or not os.path.exists(path):
+            if self.isStale():
+                self.build()
+                path = self.lookup(name)
+        return path
+
+
+_ToolFileIndexes = {}
+_ToolFileIndexStats = {"lookups": 0, "hits": 0, "misses": 0, "builds": 0}
+
+
+def _toolFileIndex(path):
+    path = os.path.abspath(path)
+    index = _ToolFileIndexes.get(path)
+    if index is None:
+        index = _ToolFileIndex(path)
+        _ToolFileIndexes[path] = index
+    return index
+
+
+def toolFileIndexStats():
+    """toolFileIndexStats() ... returns a dictionary with the number of tool file lookups,
+    how many of them were found in the index, how many weren't and how often directories were
+    indexed. The number of currently indexed directories is reported as "directories"."""
+    stats = dict(_ToolFileIndexStats)
+    stats["directories"] = sum(len(i.mtimes or {}) for i in _ToolFileIndexes.values())
+    return stats
+
+
+def clearToolFileIndex():
+    """clearToolFileIndex() ... forget all indexed tool directories."""
+    _ToolFileIndexes.clear()
+
+
 def _findToolFile(name, containerFile, typ):
     Path.Log.track(name)
     if os.path.exists(name):  # absolute reference
@@ -63,22 +143,16 @@ def _findToolFile(name, containerFile, typ):
         paths = []
     paths.extend(Path.Preferences.searchPathsTool(typ))
 
-    def _findFile(path, name):
-        Path.Log.track(path, name)
-        fullPath = os.path.join(path, name)
-        if os.path.exists(fullPath):
-            return (True, fullPath)
-        for root, ds, fs in os.walk(path):
-            for d in ds:
-                found, fullPath = _findFile(d, name)
-                if found:
-                    return (True, fullPath)
-        return (False, None)
-
     for p in paths:
-        found, path = _findFile(p, name)
-        if found:
-            return path
+        fullPath = os.path.join(p, name)
+        if os.path.exists(fullPath):
+            return fullPath
+        _ToolFileIndexStats["lookups"] += 1
+        fullPath = _toolFileIndex(p).find(name)
+        if fullPath:
+            _ToolFileIndexStats["hits"] += 1
+            return fullPath
+        _ToolFileIndexStats["misses"] += 1
     return None
 
 
@@ -27,6 +27,7 @@ from PySide import QtCore
 import Path
 import Path.Main.Job as PathJob
 import math
+import time
 from numpy import linspace
 
 # lazily loaded modules
@@ -442,27 +443,20 @@ def addToJob(obj, jobname=None):
     return job
 
 
-def sort_locations(locations, keys, attractors=None):
+def sort_locations(locations, keys, attractors=None, timeBudget=None):
     """sort holes by the nearest neighbor method
     keys: two-element list of keys for X and Y coordinates. for example ['x','y']
     originally written by m0n5t3r for PathHelix
-    """
-    from queue import PriorityQueue
-    from collections import defaultdict
 
+    The nearest neighbor is looked up in a grid of the locations. Afterwards the order is
+    refined with 2-opt and Or-opt moves for up to timeBudget seconds, which defaults to the
+    LocationOptimizationTime preference. The first location is kept to honour the attractors.
+    """
     if attractors is None:
         attractors = []
 
     attractors = attractors or [keys[0]]
 
-    def sqdist(a, b):
-        """square Euclidean distance"""
-        d = 0
-        for k in keys:
-            d += (a[k] - b[k]) ** 2
-
-        return d
-
     def weight(location):
         w = 0
 
@@ -471,29 +465,419 @@ def sort_locations(locations, keys, attractors=None):
 
         return w
 
-    def find_closest(location_list, location, dist):
-        q = PriorityQueue()
+    weights = [weight(location) for location in locations]
+    if len(keys) == 2:
+        points = [(location[keys[0]], location[keys[1]]) for location in locations]
+        order = _LocationGrid(points).nearestNeighborOrder(weights)
+    else:
+        order = _nearestNeighborOrder(locations, keys, weights)
+
+    if timeBudget is None:
+        timeBudget = Path.Preferences.locationOptimizationTime()
+    if timeBudget > 0 and len(keys) == 2 and len(order) > 3:
+        before = _tourLength(points, order)
+        order = _optimizeTour(points, order, time.perf_counter() + timeBudget)
+        after = _tourLength(points, order)
+        Path.Log.info(
+            "Sorted %d locations, rapid distance %.2f (saved %.2f)"
+            % (len(order), after, before - after)
+        )
+
+    out = [locations[i] for i in order]
+    # the locations have always been consumed by the sort
+    del locations[:]
+    return out
+
+
+def _nearestNeighborOrder(locations, keys, weights):
+    """Nearest neighbor order of the locations for any number of keys."""
+
+    def sqdist(a, b):
+        """square Euclidean distance"""
+        d = 0
+        for k in keys:
+            d += (a[k] - b[k]) ** 2
+
+        return d
 
-        for i, j in enumerate(location_list):
-            # prevent dictionary comparison by inserting the index
-            q.put((dist(j, location) + weight(j), i, j))
+    zero = {k: 0 for k in keys}
+    remaining = list(range(len(locations)))
+    order = []
+    last = zero
+    while remaining:
+        best = min(remaining, key=lambda i: (sqdist(locations[i], last) + weights[i], i))
+        order.append(best)
+        remaining.remove(best)
+        last = locations[best]
+    return order
+
+
+class _LocationGrid:
+    """Uniform grid of 2D points, used to find nearest neighbors without visiting all points."""
+
+    def __init__(self, points):
+        self.points = points
+        count = max(len(points), 1)
+        xs = [p[0] for p in points] or [0]
+        ys = [p[1] for p in points] or [0]
+        self.xMin, self.yMin = min(xs), min(ys)
+        width = max(xs) - self.xMin
+        height = max(ys) - self.yMin
+        # about two points per cell, also for points on a line
+        self.size = max(math.sqrt(2 * width * height / count), width / count, height / count, 1e-6)
+        self.cols = int(width / self.size) + 1
+        self.rows = int(height / self.size) + 1
+        self.cells = {}
+        for i, p in enumerate(points):
+            self.cells.setdefault(self.cell(p[0], p[1]), []).append(i)
+        self.alive = set(range(len(points)))
+
+    def cell(self, x, y):
+        c = min(max(int(math.floor((x - self.xMin) / self.size)), 0), self.cols - 1)
+        r = min(max(int(math.floor((y - self.yMin) / self.size)), 0), self.rows - 1)
+        return (c, r)
+
+    def ring(self, c0, r0, radius):
+        """Returns all cells at Chebyshev distance radius from the cell (c0, r0)."""
+        if radius == 0:
+            return [(c0, r0)]
+        cells = []
+        for c in range(c0 - radius, c0 + radius + 1):
+            cells.append((c, r0 - radius))
+            cells.append((c, r0 + radius))
+        for r in range(r0 - radius + 1, r0 + radius):
+            cells.append((c0 - radius, r))
+            cells.append((c0 + radius, r))
+        return cells
+
+    def remove(self, i):
+        """Removes point i from the grid, it's no longer returned by nearest()."""
+        self.cells[self.cell(self.points[i][0], self.points[i][1])].remove(i)
+        self.alive.remove(i)
+
+    def nearest(self, x, y, score, bound):
+        """Returns (score, index) of the point with the lowest score(i), ties are resolved by
+        the lower index. bound(d) has to return a lower limit of the score of any point at
+        distance d or further away from x, y."""
+        best = None
+        c0, r0 = self.cell(x, y)
+        radius = 0
+        visited = 0
+        while self.alive:
+            # no point in this ring is closer than this, also if x, y is outside the grid
+            if best is not None and bound(max(radius - 1, 0) * self.size) > best[0]:
+                break
+            if radius > max(self.cols, self.rows):
+                break
+            if visited > len(self.alive):
+                # sparse grid, faster to check all remaining points
+                for i in self.alive:
+                    s = score(i)
+                    if best is None or (s, i) < best:
+                        best = (s, i)
+                break
+            for cell in self.ring(c0, r0, radius):
+                visited += 1
+                for i in self.cells.get(cell, ()):
+                    s = score(i)
+                    if best is None or (s, i) < best:
+                        best = (s, i)
+            radius += 1
+        return best
+
+    def nearestNeighborOrder(self, weights):
+        """Returns the order of repeatedly picking the point with the lowest square distance plus
+        weight, starting at the origin. The weights must not be negative."""
+        points = self.points
+        order = []
+        x, y = 0, 0
+
+        def score(i):
+            return (points[i][0] - x) ** 2 + (points[i][1] - y) ** 2 + weights[i]
+
+        def bound(d):
+            # allow for rounding, an equal score might still win by its index
+            return d * d * (1 - 1e-9) - 1e-12
+
+        while self.alive:
+            i = self.nearest(x, y, score, bound)[1]
+            order.append(i)
+            self.remove(i)
+            x, y = points[i]
+        return order
+
+    def neighbors(self, i, k):
+        """Returns up to k nearest points of point i, closest first."""
+        c0, r0 = self.cell(self.points[i][0], self.points[i][1])
+        candidates = []
+        radius = 1
+        while len(candidates) <= k and radius <= max(self.cols, self.rows):
+            candidates = [
+                j
+                for c in range(c0 - radius, c0 + radius + 1)
+                for r in range(r0 - radius, r0 + radius + 1)
+                for j in self.cells.get((c, r), ())
+                if j != i
+            ]
+            radius += 1
+        candidates.sort(key=lambda j: _distance(self.points[i], self.points[j]))
+        return candidates[:k]
+
+
+def _distance(p, q):
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+
+def _tourLength(points, order):
+    """Rapid distance from the origin along all points in order."""
+    length = _distance((0, 0), points[order[0]]) if order else 0
+    for a, b in zip(order, order[1:]):
+        length += _distance(points[a], points[b])
+    return length
 
-        prio, i, result = q.get()
 
-        return result
+def _optimizeTour(points, order, deadline):
+    """Refines the open tour with 2-opt and Or-opt moves until no move improves it or the
+    deadline passes. The first point of the tour is kept."""
+    grid = _LocationGrid(points)
+    neighbors = [grid.neighbors(i, 8) for i in range(len(points))]
+    tour = list(order)
+    n = len(tour)
+
+    def dist(a, b):
+        return _distance(points[a], points[b])
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        position = {p: i for i, p in enumerate(tour)}
+
+        # 2-opt, replace edges a-b and c-d by a-c and b-d by reversing b..c
+        for i in range(1, n):
+            a, b = tour[i - 1], tour[i]
+            ab = dist(a, b)
+            for c in neighbors[a]:
+                ac = dist(a, c)
+                if ac >= ab:
+                    break
+                j = position[c]
+                if j <= i:
+                    continue
+                gain = ab - ac
+                if j + 1 < n:
+                    d = tour[j + 1]
+                    gain += dist(c, d) - dist(b, d)
+                if gain > 1e-9:
+                    tour[i : j + 1] = tour[i : j + 1][::-1]
+                    for k in range(i, j + 1):
+                        position[tour[k]] = k
+                    improved = True
+                    break
+            if time.perf_counter() > deadline:
+                return tour
+
+        # Or-opt, move a segment of up to 3 points between one of its neighbors and the next
+        # or previous point of the tour, possibly reversed
+        for length in (1, 2, 3):
+            i = 1
+            while i + length <= n:
+                j = i + length - 1
+                prev = tour[i - 1]
+                nxt = tour[j + 1] if j + 1 < n else None
+                removed = dist(prev, tour[i])
+                if nxt is not None:
+                    removed += dist(tour[j], nxt) - dist(prev, nxt)
+
+                def after(k):
+                    # next point of k once the segment is removed
+                    k = j + 1 if k + 1 == i else k + 1
+                    return tour[k] if k < n else None
+
+                best = None
+                for c in neighbors[tour[i]] + neighbors[tour[j]]:
+                    k = position[c]
+                    if i <= k <= j:
+                        continue
+                    # the edges c-after(c) and before(c)-c
+                    edges = [(c, after(k))]
+                    if k > 0:
+                        before = tour[i - 1] if k - 1 == j else tour[k - 1]
+                        edges.append((before, c))
+                    for p, q in edges:
+                        for s, e in ((tour[i], tour[j]), (tour[j], tour[i])):
+                            added = dist(p, s)
+                            if q is not None:
+                                added += dist(e, q) - dist(p, q)
+                            if removed - added > 1e-9 and (best is None or added < best[0]):
+                                best = (added, p, s != tour[i])
+                if best is not None:
+                    seg = tour[i : j + 1]
+                    if best[2]:
+                        seg.reverse()
+                    rest = tour[:i] + tour[j + 1 :]
+                    k = rest.index(best[1]) + 1
+                    tour = rest[:k] + seg + rest[k:]
+                    position = {p: k for k, p in enumerate(tour)}
+                    improved = True
+                i += 1
+                if time.perf_counter() > deadline:
+                    return tour
+    return tour
+
+
+def sort_wires(begins, ends, start=Vector(0, 0, 0), reversible=True, timeBudget=None):
+    """sort_wires(begins, ends, start=Vector(0, 0, 0), reversible=True, timeBudget=None)
+    Orders wires, given by their begin and end points, by the nearest neighbor method.
+    Returns a list of (index, reversed) tuples. Starting at start, the next wire is the one
+    closest to the end of the previous wire. If reversible, a wire can also be entered at its
+    end, in which case it's reversed. Equal distances are resolved by the lower index, and by an
+    end over a begin.
+    The order is refined for up to timeBudget seconds, like in sort_locations()."""
+
+    begins = [(p.x, p.y, p.z) for p in begins]
+    ends = [(p.x, p.y, p.z) for p in ends]
+    entries = [_LocationGrid(begins)]
+    if reversible:
+        entries.append(_LocationGrid(ends))
+    x, y, z = start.x, start.y, start.z
+
+    def bound(d):
+        return d * (1 - 1e-9)
+
+    order = []
+    while entries[0].alive:
+        best = None
+        for flip, grid in enumerate(entries):
+
+            def score(i):
+                p = grid.points[i]
+                dx, dy, dz = x - p[0], y - p[1], z - p[2]
+                return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+            found = grid.nearest(x, y, score, bound)
+            # a begin is only taken if it's closer than any end
+            if best is None or found[0] <= best[0]:
+                best = (found[0], found[1], flip)
+        (_, i, flip) = best
+        order.append((i, bool(flip)))
+        for grid in entries:
+            grid.remove(i)
+        x, y, z = begins[i] if flip else ends[i]
+
+    if timeBudget is None:
+        timeBudget = Path.Preferences.locationOptimizationTime()
+    if timeBudget > 0 and len(order) > 3:
+        points = [p for i in range(len(begins)) for p in (begins[i], ends[i])]
+        before = _wireTourLength(points, order, start)
+        order = _optimizeWireTour(points, order, start, reversible, timeBudget)
+        after = _wireTourLength(points, order, start)
+        Path.Log.info(
+            "Sorted %d wires, rapid distance %.2f (saved %.2f)"
+            % (len(order), after, before - after)
+        )
+    return order
 
-    out = []
-    zero = defaultdict(lambda: 0)
 
-    out.append(find_closest(locations, zero, sqdist))
-    locations.remove(out[-1])
+def _wireTourLength(points, order, start):
+    """Rapid distance from start along all wires, points holds begin and end of all wires."""
+    length = 0
+    last = (start.x, start.y, start.z)
+    for i, flip in order:
+        length += math.dist(last, points[2 * i + flip])
+        last = points[2 * i + 1 - flip]
+    return length
 
-    while locations:
-        closest = find_closest(locations, out[-1], sqdist)
-        out.append(closest)
-        locations.remove(closest)
 
-    return out
+def _optimizeWireTour(points, order, start, reversible, timeBudget):
+    """Refines the order of wires with 2-opt moves, if they are reversible, and by moving single
+    wires next to their neighbors, until no move improves it or the time is up."""
+    deadline = time.perf_counter() + timeBudget
+    grid = _LocationGrid(points)
+    neighbors = [grid.neighbors(e, 8) for e in range(len(points))]
+    tour = [2 * i + flip for i, flip in order]  # entry point of each wire
+    n = len(tour)
+    origin = len(points)
+    points = points + [(start.x, start.y, start.z)]
+
+    def dist(a, b):
+        return math.dist(points[a], points[b])
+
+    def other(e):
+        # the opposite end of a wire
+        return e ^ 1
+
+    def exitBefore(k):
+        return other(tour[k - 1]) if k > 0 else origin
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        position = {e // 2: k for k, e in enumerate(tour)}
+
+        # 2-opt, reverse wires i..j so that the exit of j follows the exit of i - 1
+        if reversible:
+            for i in range(1, n):
+                a = exitBefore(i)
+                ab = dist(a, tour[i])
+                for c in neighbors[a]:
+                    ac = dist(a, c)
+                    if ac >= ab:
+                        break
+                    j = position[c // 2]
+                    if j <= i or other(tour[j]) != c:
+                        continue
+                    gain = ab - ac
+                    if j + 1 < n:
+                        gain += dist(c, tour[j + 1]) - dist(tour[i], tour[j + 1])
+                    if gain > 1e-9:
+                        tour[i : j + 1] = [other(e) for e in reversed(tour[i : j + 1])]
+                        for k in range(i, j + 1):
+                            position[tour[k] // 2] = k
+                        improved = True
+                        break
+                if time.perf_counter() > deadline:
+                    break
+
+        # move a single wire between a neighbor and the wire before or after it
+        i = 0
+        while i < n and time.perf_counter() < deadline:
+            e = tour[i]
+            a = exitBefore(i)
+            nxt = tour[i + 1] if i + 1 < n else None
+            removed = dist(a, e)
+            if nxt is not None:
+                removed += dist(other(e), nxt) - dist(a, nxt)
+            best = None
+            for f in neighbors[e] + neighbors[other(e)]:
+                k = position[f // 2]
+                if k == i:
+                    continue
+                # the entry of the wire to insert, next to f
+                for w in (e, other(e)) if reversible else (e,):
+                    if tour[k] == f:
+                        # insert before the wire entered at f
+                        p = exitBefore(k) if k - 1 != i else exitBefore(i)
+                        slot = k
+                        added = dist(p, w) + dist(other(w), f) - dist(p, f)
+                    else:
+                        # insert after the wire left at f
+                        q = k + 2 if k + 1 == i else k + 1
+                        slot = k + 1
+                        added = dist(f, w)
+                        if q < n:
+                            added += dist(other(w), tour[q]) - dist(f, tour[q])
+                    if removed - added > 1e-9 and (best is None or added < best[0]):
+                        best = (added, slot, w)
+            if best is not None:
+                (_, slot, w) = best
+                tour[i] = None
+                tour.insert(slot, w)
+                tour.remove(None)
+                position = {e // 2: k for k, e in enumerate(tour)}
+                improved = True
+            i += 1
+
+    return [(e // 2, e % 2 == 1) for e in tour]
 
 
 def guessDepths(objshape, subs=None):
@@ -27,7 +27,9 @@ from CAMTests.TestPathProfile import TestPathProfile
 
 from CAMTests.TestPathAdaptive import TestPathAdaptive
 from CAMTests.TestPathCore import TestPathCore
+from CAMTests.TestPathCycleTime import TestPathCycleTime
 from CAMTests.TestPathDepthParams import depthTestCases
+from CAMTests.TestPathDressupBoundary import TestPathDressupBoundary
 from CAMTests.TestPathDressupDogbone import TestDressupDogbone
 from CAMTests.TestPathDressupDogboneII import TestDressupDogboneII
 from CAMTests.TestPathDressupHoldingTags import TestHoldingTags
@@ -57,7 +59,9 @@ from CAMTests.TestPathProfile import TestPathProfile
 from CAMTests.TestPathPropertyBag import TestPathPropertyBag
 from CAMTests.TestPathRotationGenerator import TestPathRotationGenerator
 from CAMTests.TestPathSetupSheet import TestPathSetupSheet
+from CAMTests.TestPathSimulator import TestPathSimulator
 from CAMTests.TestPathStock import TestPathStock
+from CAMTests.TestPathSurfaceSupport import TestPathSurfaceSupport
 from CAMTests.TestPathTapGenerator import TestPathTapGenerator
 from CAMTests.TestPathThreadMilling import TestPathThreadMilling
 from CAMTests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
@@ -88,6 +92,7 @@ False if TestCAMSanity.__name__ else True
 False if depthTestCases.__name__ else True
 False if TestApp.__name__ else True
 False if TestBuildPostList.__name__ else True
+False if TestPathDressupBoundary.__name__ else True
 False if TestDressupDogbone.__name__ else True
 False if TestDressupDogboneII.__name__ else True
 False if TestFileNameGenerator.__name__ else True
@@ -97,6 +102,7 @@ False if TestPathLanguage.__name__ else True
 # False if TestOutputNameSubstitution.__name__ else True
 False if TestPathAdaptive.__name__ else True
 False if TestPathCore.__name__ else True
+False if TestPathCycleTime.__name__ else True
 False if TestPathOpDeburr.__name__ else True
 False if TestPathDrillable.__name__ else True
 False if TestPathGeom.__name__ else True
@@ -113,7 +119,9 @@ False if TestPathProfile.__name__ else True
 False if TestPathPropertyBag.__name__ else True
 False if TestPathRotationGenerator.__name__ else True
 False if TestPathSetupSheet.__name__ else True
+False if TestPathSimulator.__name__ else True
 False if TestPathStock.__name__ else True
+False if TestPathSurfaceSupport.__name__ else True
 False if TestPathTapGenerator.__name__ else True
 False if TestPathThreadMilling.__name__ else True
 False if TestPathThreadMillingGenerator.__name__ else True
@@ -30,6 +30,7 @@
 #include <SMESHDS_Mesh.hxx>
 #include <SMESH_Group.hxx>
 #include <SMESH_Mesh.hxx>
+#include <SMESH_MeshEditor.hxx>
 #include <TopoDS.hxx>
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
@@ -38,6 +39,7 @@
 #endif
 
 #include "Mod/Fem/App/FemMesh.h"
+#include <Base/Interpreter.h>
 #include <Base/PlacementPy.h>
 #include <Base/PyWrapParseTupleAndKeywords.h>
 #include <Base/QuantityPy.h>
@@ -1088,6 +1090,125 @@ PyObject* FemMeshPy::copy(PyObject* args) const
     return new FemMeshPy(new FemMesh(mesh));
 }
 
+PyObject* FemMeshPy::addNodes(PyObject* args)
+{
+    PyObject* coordsObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "O|O", &coordsObj, &idsObj)) {
+        return nullptr;
+    }
+
+    try {
+        Py::Sequence coords(coordsObj);
+        Py::Sequence::size_type count = coords.size() / 3;
+        if (coords.size() != count * 3) {
+            throw std::runtime_error("Number of coordinates is not a multiple of three");
+        }
+        std::vector<int> ids;
+        if (idsObj && idsObj != Py_None) {
+            Py::Sequence idList(idsObj);
+            if (idList.size() != count) {
+                throw std::runtime_error("Number of node ids and coordinates do not match");
+            }
+            ids.reserve(count);
+            for (Py::Sequence::iterator it = idList.begin(); it != idList.end(); ++it) {
+                ids.push_back(static_cast<int>(Py::Long(*it)));
+            }
+        }
+
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        Py::Sequence::size_type i = 0;
+        for (Py::Sequence::iterator it = coords.begin(); it != coords.end(); ++i) {
+            double x = static_cast<double>(Py::Float(*it++));
+            double y = static_cast<double>(Py::Float(*it++));
+            double z = static_cast<double>(Py::Float(*it++));
+            SMDS_MeshNode* node =
+                ids.empty() ? meshDS->AddNode(x, y, z) : meshDS->AddNodeWithID(x, y, z, ids[i]);
+            if (!node) {
+                throw std::runtime_error("Failed to add node");
+            }
+        }
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject* args)
+{
+    const char* typeName = nullptr;
+    int nodeCount = 0;
+    PyObject* nodesObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "siO|O", &typeName, &nodeCount, &nodesObj, &idsObj)) {
+        return nullptr;
+    }
+
+    try {
+        SMDSAbs_ElementType type;
+        if (strcmp(typeName, "Edge") == 0) {
+            type = SMDSAbs_Edge;
+        }
+        else if (strcmp(typeName, "Face") == 0) {
+            type = SMDSAbs_Face;
+        }
+        else if (strcmp(typeName, "Volume") == 0) {
+            type = SMDSAbs_Volume;
+        }
+        else {
+            throw std::runtime_error("Unknown element type, [Edge|Face|Volume] are allowed");
+        }
+
+        Py::Sequence nodeList(nodesObj);
+        if (nodeCount <= 0 || nodeList.size() % nodeCount != 0) {
+            throw std::runtime_error("Number of node ids is not a multiple of the node count");
+        }
+        Py::Sequence::size_type count = nodeList.size() / nodeCount;
+        std::vector<int> ids;
+        if (idsObj && idsObj != Py_None) {
+            Py::Sequence idList(idsObj);
+            if (idList.size() != count) {
+                throw std::runtime_error("Number of element ids and elements do not match");
+            }
+            ids.reserve(count);
+            for (Py::Sequence::iterator it = idList.begin(); it != idList.end(); ++it) {
+                ids.push_back(static_cast<int>(Py::Long(*it)));
+            }
+        }
+
+        SMESH_MeshEditor editor(getFemMeshPtr()->getSMesh());
+        SMESHDS_Mesh* meshDS = editor.GetMeshDS();
+        SMESH_MeshEditor::ElemFeatures features(type);
+        std::vector<const SMDS_MeshNode*> nodes(nodeCount);
+        Py::Sequence::iterator it = nodeList.begin();
+        for (Py::Sequence::size_type i = 0; i < count; ++i) {
+            for (int j = 0; j < nodeCount; ++j, ++it) {
+                nodes[j] = meshDS->FindNode(static_cast<int>(Py::Long(*it)));
+                if (!nodes[j]) {
+                    throw std::runtime_error("Failed to get node of the given indices");
+                }
+            }
+            features.SetID(ids.empty() ? -1 : ids[i]);
+            if (!editor.AddElement(nodes, features)) {
+                throw std::runtime_error("Failed to add element, unknown node count?");
+            }
+        }
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::read(PyObject* args)
 {
     char* Name;
@@ -1347,7 +1468,11 @@ PyObject* FemMeshPy::getccxVolumesByFace(PyObject* args) const
         const TopoDS_Face& fc = TopoDS::Face(sh);
 
         Py::List ret;
-        std::map<int, int> resultSet = getFemMeshPtr()->getccxVolumesByFace(fc);
+        std::map<int, int> resultSet;
+        {
+            Base::PyGILStateRelease releaser;
+            resultSet = getFemMeshPtr()->getccxVolumesByFace(fc);
+        }
         for (std::map<int, int>::const_iterator it = resultSet.begin(); it != resultSet.end();
              ++it) {
             Py::Tuple vol_face(2);
@@ -1401,7 +1526,11 @@ PyObject* FemMeshPy::getNodesBySolid(PyObject* args) const
             return nullptr;
         }
         Py::List ret;
-        std::set<int> resultSet = getFemMeshPtr()->getNodesBySolid(fc);
+        std::set<int> resultSet;
+        {
+            Base::PyGILStateRelease releaser;
+            resultSet = getFemMeshPtr()->getNodesBySolid(fc);
+        }
         for (int it : resultSet) {
             ret.append(Py::Long(it));
         }
@@ -1430,7 +1559,11 @@ PyObject* FemMeshPy::getNodesByFace(PyObject* args) const
             return nullptr;
         }
         Py::List ret;
-        std::set<int> resultSet = getFemMeshPtr()->getNodesByFace(fc);
+        std::set<int> resultSet;
+        {
+            Base::PyGILStateRelease releaser;
+            resultSet = getFemMeshPtr()->getNodesByFace(fc);
+        }
         for (int it : resultSet) {
             ret.append(Py::Long(it));
         }
@@ -1459,7 +1592,11 @@ PyObject* FemMeshPy::getNodesByEdge(PyObject* args) const
             return nullptr;
         }
         Py::List ret;
-        std::set<int> resultSet = getFemMeshPtr()->getNodesByEdge(fc);
+        std::set<int> resultSet;
+        {
+            Base::PyGILStateRelease releaser;
+            resultSet = getFemMeshPtr()->getNodesByEdge(fc);
+        }
         for (int it : resultSet) {
             ret.append(Py::Long(it));
         }
@@ -1488,7 +1625,11 @@ PyObject* FemMeshPy::getNodesByVertex(PyObject* args) const
             return nullptr;
         }
         Py::List ret;
-        std::set<int> resultSet = getFemMeshPtr()->getNodesByVertex(fc);
+        std::set<int> resultSet;
+        {
+            Base::PyGILStateRelease releaser;
+            resultSet = getFemMeshPtr()->getNodesByVertex(fc);
+        }
         for (int it : resultSet) {
             ret.append(Py::Long(it));
         }
@@ -0,0 +1,82 @@
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM example meshes"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# The example meshes are stored as numpy npz archives. Every archive holds
+# the arrays Nodes_ids and Nodes_coords and for every element type of
+# importToolsFem.FEM_ELEMENT_TYPES in the mesh the arrays <type>_ids and
+# <type>_nodes, e.g. Tetra10Elem_ids and Tetra10Elem_nodes.
+
+import os
+
+
+def load_mesh(name):
+    """load the example mesh name (file name without extension) into a new FemMesh"""
+    import numpy as np
+    from feminout.importToolsFem import FEM_ELEMENT_TYPES
+    from feminout.importToolsFem import make_femmesh_from_arrays
+
+    with np.load(os.path.join(os.path.dirname(__file__), name + ".npz")) as data:
+        elements = {
+            key: (data[key + "_ids"], data[key + "_nodes"])
+            for key in FEM_ELEMENT_TYPES
+            if key + "_ids" in data.files
+        }
+        return make_femmesh_from_arrays((data["Nodes_ids"], data["Nodes_coords"]), elements)
+
+
+def save_mesh(femmesh, filename):
+    """save a FemMesh in the example mesh format, filename should end with .npz"""
+    import numpy as np
+    from feminout.importToolsFem import FEM_ELEMENT_TYPES
+
+    keys = {value: key for key, value in FEM_ELEMENT_TYPES.items()}
+    nodes = femmesh.Nodes
+    arrays = {
+        "Nodes_ids": np.array(list(nodes), dtype=np.int32),
+        "Nodes_coords": np.array([tuple(v) for v in nodes.values()], dtype=float),
+    }
+    elements = {}
+    for elem_type, ids in (
+        ("Volume", femmesh.Volumes),
+        ("Face", femmesh.Faces),
+        ("Edge", femmesh.Edges),
+    ):
+        for elem_id in ids:
+            elem_nodes = femmesh.getElementNodes(elem_id)
+            key = keys[(elem_type, len(elem_nodes))]
+            elements.setdefault(key, ([], []))
+            elements[key][0].append(elem_id)
+            elements[key][1].append(elem_nodes)
+    for key, (ids, elem_nodes) in elements.items():
+        arrays[key + "_ids"] = np.array(ids, dtype=np.int32)
+        arrays[key + "_nodes"] = np.array(elem_nodes, dtype=np.int32)
+    np.savez_compressed(filename, **arrays)
+
+
+##  @}
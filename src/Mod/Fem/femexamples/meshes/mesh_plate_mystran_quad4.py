@@ -1,69 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(0.0, 0.0, 0.0, 1)
-    femmesh.addNode(2.0, 0.0, 0.0, 2)
-    femmesh.addNode(4.0, 0.0, 0.0, 3)
-    femmesh.addNode(6.0, 0.0, 0.0, 4)
-    femmesh.addNode(8.0, 0.0, 0.0, 5)
-    femmesh.addNode(10.0, 0.0, 0.0, 6)
-    femmesh.addNode(0.0, 2.0, 0.0, 7)
-    femmesh.addNode(2.0, 2.0, 0.0, 8)
-    femmesh.addNode(4.0, 2.0, 0.0, 9)
-    femmesh.addNode(6.0, 2.0, 0.0, 10)
-    femmesh.addNode(8.0, 2.0, 0.0, 11)
-    femmesh.addNode(10.0, 2.0, 0.0, 12)
-    femmesh.addNode(0.0, 4.0, 0.0, 13)
-    femmesh.addNode(2.0, 4.0, 0.0, 14)
-    femmesh.addNode(4.0, 4.0, 0.0, 15)
-    femmesh.addNode(6.0, 4.0, 0.0, 16)
-    femmesh.addNode(8.0, 4.0, 0.0, 17)
-    femmesh.addNode(10.0, 4.0, 0.0, 18)
-    femmesh.addNode(0.0, 6.0, 0.0, 19)
-    femmesh.addNode(2.0, 6.0, 0.0, 20)
-    femmesh.addNode(4.0, 6.0, 0.0, 21)
-    femmesh.addNode(6.0, 6.0, 0.0, 22)
-    femmesh.addNode(8.0, 6.0, 0.0, 23)
-    femmesh.addNode(10.0, 6.0, 0.0, 24)
-    femmesh.addNode(0.0, 8.0, 0.0, 25)
-    femmesh.addNode(2.0, 8.0, 0.0, 26)
-    femmesh.addNode(4.0, 8.0, 0.0, 27)
-    femmesh.addNode(6.0, 8.0, 0.0, 28)
-    femmesh.addNode(8.0, 8.0, 0.0, 29)
-    femmesh.addNode(10.0, 8.0, 0.0, 30)
-    femmesh.addNode(0.0, 10.0, 0.0, 31)
-    femmesh.addNode(2.0, 10.0, 0.0, 32)
-    femmesh.addNode(4.0, 10.0, 0.0, 33)
-    femmesh.addNode(6.0, 10.0, 0.0, 34)
-    femmesh.addNode(8.0, 10.0, 0.0, 35)
-    femmesh.addNode(10.0, 10.0, 0.0, 36)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addFace([1, 2, 8, 7], 1)
-    femmesh.addFace([2, 3, 9, 8], 2)
-    femmesh.addFace([3, 4, 10, 9], 3)
-    femmesh.addFace([4, 5, 11, 10], 4)
-    femmesh.addFace([5, 6, 12, 11], 5)
-    femmesh.addFace([7, 8, 14, 13], 6)
-    femmesh.addFace([8, 9, 15, 14], 7)
-    femmesh.addFace([9, 10, 16, 15], 8)
-    femmesh.addFace([10, 11, 17, 16], 9)
-    femmesh.addFace([11, 12, 18, 17], 10)
-    femmesh.addFace([13, 14, 20, 19], 11)
-    femmesh.addFace([14, 15, 21, 20], 12)
-    femmesh.addFace([15, 16, 22, 21], 13)
-    femmesh.addFace([16, 17, 23, 22], 14)
-    femmesh.addFace([17, 18, 24, 23], 15)
-    femmesh.addFace([19, 20, 26, 25], 16)
-    femmesh.addFace([20, 21, 27, 26], 17)
-    femmesh.addFace([21, 22, 28, 27], 18)
-    femmesh.addFace([22, 23, 29, 28], 19)
-    femmesh.addFace([23, 24, 30, 29], 20)
-    femmesh.addFace([25, 26, 32, 31], 21)
-    femmesh.addFace([26, 27, 33, 32], 22)
-    femmesh.addFace([27, 28, 34, 33], 23)
-    femmesh.addFace([28, 29, 35, 34], 24)
-    femmesh.addFace([29, 30, 36, 35], 25)
-    return True
@@ -131,151 +131,102 @@ def get_MaxDimElementFromList(elem_list):
     return elem_list[-1]
 
 
+# mesh data key --> (FemMesh element type, number of nodes)
+FEM_ELEMENT_TYPES = {
+    "Seg2Elem": ("Edge", 2),
+    "Seg3Elem": ("Edge", 3),
+    "Tria3Elem": ("Face", 3),
+    "Tria6Elem": ("Face", 6),
+    "Quad4Elem": ("Face", 4),
+    "Quad8Elem": ("Face", 8),
+    "Tetra4Elem": ("Volume", 4),
+    "Tetra10Elem": ("Volume", 10),
+    "Penta6Elem": ("Volume", 6),
+    "Penta15Elem": ("Volume", 15),
+    "Hexa8Elem": ("Volume", 8),
+    "Hexa20Elem": ("Volume", 20),
+}
+
+
 def make_femmesh(mesh_data):
     """makes an FreeCAD FEM Mesh object from FEM Mesh data"""
     import Fem
 
-    mesh = Fem.FemMesh()
     m = mesh_data
-    if ("Nodes" in m) and (len(m["Nodes"]) > 0):
-        FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
-
-            nds = m["Nodes"]
-            FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                    ],
-                    i,
-                )
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                        e[15],
-                        e[16],
-                        e[17],
-                        e[18],
-                        e[19],
-                    ],
-                    i,
-                )
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
-            Console.PrintLog(
-                "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n".format(
-                    len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15),
-                )
-            )
-            Console.PrintLog(
-                "imported mesh: {} "
-                "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n".format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3),
-                )
-            )
-        else:
-            Console.PrintError("No Elements found!\n")
-    else:
+    nds = m.get("Nodes", {})
+    if len(nds) == 0:
         Console.PrintError("No Nodes found!\n")
+        return Fem.FemMesh()
+    FreeCAD.Console.PrintLog("Found: nodes\n")
+    if not any(key in m for key in FEM_ELEMENT_TYPES):
+        Console.PrintError("No Elements found!\n")
+        return Fem.FemMesh()
+    FreeCAD.Console.PrintLog("Found: elements\n")
+
+    coordinates = [c for n in nds.values() for c in (n[0], n[1], n[2])]
+    elements = {}
+    for key, (elem_type, count) in FEM_ELEMENT_TYPES.items():
+        elms = m.get(key, {})
+        elements[key] = (list(elms), [n for e in elms.values() for n in e[:count]])
+    return make_femmesh_from_arrays((list(nds), coordinates), elements)
+
+
+def make_femmesh_from_arrays(nodes, elements):
+    """makes an FreeCAD FEM Mesh object from FEM Mesh arrays
+
+    nodes: tuple (numbers, coordinates), coordinates either flat or with
+    one row of x, y, z per node
+    elements: dictionary mesh data key (see FEM_ELEMENT_TYPES) -->
+    tuple (numbers, nodes), nodes either flat or with one row per element
+
+    All nodes and all elements of one type are added by one call each,
+    which is much faster than adding them one by one on large meshes.
+    Numpy arrays and plain lists are accepted.
+    """
+    import numpy as np
+    import Fem
+
+    mesh = Fem.FemMesh()
+    numbers, coordinates = nodes
+    numbers = np.asarray(numbers, dtype=np.int64).ravel()
+    coordinates = np.asarray(coordinates, dtype=float).ravel()
+    mesh.addNodes(coordinates.tolist(), numbers.tolist())
+
+    counts = {}
+    for key, (elem_type, count) in FEM_ELEMENT_TYPES.items():
+        if key not in elements:
+            counts[key] = 0
+            continue
+        numbers, elem_nodes = elements[key]
+        numbers = np.asarray(numbers, dtype=np.int64).ravel()
+        counts[key] = len(numbers)
+        if counts[key] == 0:
+            continue
+        elem_nodes = np.asarray(elem_nodes, dtype=np.int64).ravel()
+        mesh.addElements(elem_type, count, elem_nodes.tolist(), numbers.tolist())
+
+    Console.PrintLog(
+        "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n".format(
+            len(coordinates) // 3,
+            counts["Hexa8Elem"],
+            counts["Penta6Elem"],
+            counts["Tetra4Elem"],
+            counts["Tetra10Elem"],
+            counts["Penta15Elem"],
+        )
+    )
+    Console.PrintLog(
+        "imported mesh: {} "
+        "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n".format(
+            counts["Hexa20Elem"],
+            counts["Tria3Elem"],
+            counts["Tria6Elem"],
+            counts["Quad4Elem"],
+            counts["Quad8Elem"],
+            counts["Seg2Elem"],
+            counts["Seg3Elem"],
+        )
+    )
     return mesh
 
 
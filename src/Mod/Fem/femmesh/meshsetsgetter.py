@@ -29,6 +29,7 @@ __url__ = "https://www.freecad.org"
 #  @{
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import FreeCAD
 
@@ -100,6 +101,13 @@ class MeshSetsGetter:
         self.femelement_edges_table = {}
         self.femelement_count_test = True
         self.mat_geo_sets = []
+        # worker threads for the reference lookups of the constraints, 1 means serial lookup
+        # the pool is opt-in, the lookups read the constraint objects of the document and
+        # the OCC node searches may use all cores already
+        self.num_threads = FreeCAD.ParamGet(
+            "User parameter:BaseApp/Preferences/Mod/Fem/General"
+        ).GetInt("MeshSetsNumThreads", 1)
+        self.prefetched_sets = {}
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -125,6 +133,20 @@ class MeshSetsGetter:
 
         time_start = time.process_time()
 
+        # start the reference lookups of the constraints on a worker pool
+        # the getters below collect the results in their serial order
+        executor = self.prefetch_constraint_sets()
+        try:
+            self.get_all_sets()
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self.prefetched_sets = {}
+
+        setstime = round((time.process_time() - time_start), 3)
+        FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
+
+    def get_all_sets(self):
         # materials and element geometry element sets getter
         self.get_element_sets_material_and_femelement_geometry()
 
@@ -153,8 +175,128 @@ class MeshSetsGetter:
         self.get_constraints_electrostatic_faces()
         self.get_constraints_electricchargedensity_faces()
 
-        setstime = round((time.process_time() - time_start), 3)
-        FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # parallel reference lookup
+    def prefetch_constraint_sets(self):
+        """Submit the reference lookups of the constraints to a worker pool.
+
+        The lookups of different constraints are independent of each other. Every getter takes
+        its results with get_prefetched() in the same order as the serial lookup, thus the sets
+        and the solver input do not change. Only the order of the log messages may differ.
+        Returns the executor or None if the lookups are done serial.
+        """
+        if self.num_threads < 2 or not self.mesh_object:
+            return None
+        jobs = []
+        for femobjs in (
+            self.member.cons_fixed,
+            self.member.cons_displacement,
+            self.member.cons_rigidbody,
+            self.member.cons_planerotation,
+            self.member.cons_transform,
+            self.member.cons_temperature,
+        ):
+            for femobj in femobjs:
+                jobs.append(
+                    (
+                        femobj,
+                        meshtools.get_femnodes_by_femobj_with_references,
+                        (self.femmesh, femobj),
+                    )
+                )
+        for femobj in self.member.cons_electrostatic:
+            if femobj["Object"].BoundaryCondition == "Dirichlet":
+                jobs.append(
+                    (
+                        femobj,
+                        meshtools.get_femnodes_by_femobj_with_references,
+                        (self.femmesh, femobj),
+                    )
+                )
+
+        # the shared tables have to exist before the workers start
+        if self.member.cons_pressure or self.member.cons_contact or self.member.cons_tie:
+            self.get_face_search_tables()
+            tables = (self.femmesh, self.femelement_table, self.femnodes_ele_table)
+            for femobj in self.member.cons_pressure:
+                jobs.append((femobj, meshtools.get_pressure_obj_faces, (*tables, femobj)))
+            for femobj in self.member.cons_contact:
+                jobs.append((femobj, meshtools.get_contact_obj_faces, (*tables, femobj)))
+            for femobj in self.member.cons_tie:
+                jobs.append((femobj, meshtools.get_tie_obj_faces, (*tables, femobj)))
+
+        if self.member.cons_force:
+            self.get_force_nodeload_tables(log=False)
+            tables = (self.femmesh, self.femelement_table, self.femnodes_mesh)
+        for femobj in self.member.cons_force:
+            frc_obj = femobj["Object"]
+            if femobj["RefShapeType"] == "Vertex":
+                lookup = meshtools.get_force_obj_vertex_nodeload_table
+                jobs.append((femobj, lookup, (self.femmesh, frc_obj)))
+            elif femobj["RefShapeType"] == "Edge":
+                lookup = meshtools.get_force_obj_edge_nodeload_table
+                jobs.append((femobj, lookup, (*tables, frc_obj)))
+            elif femobj["RefShapeType"] == "Face":
+                lookup = meshtools.get_force_obj_face_nodeload_table
+                jobs.append((femobj, lookup, (*tables, frc_obj)))
+
+        if len(jobs) < 2:
+            return None
+        executor = ThreadPoolExecutor(max_workers=min(self.num_threads, len(jobs)))
+        for femobj, lookup, args in jobs:
+            self.prefetched_sets[(id(femobj), lookup)] = executor.submit(lookup, *args)
+        return executor
+
+    def get_prefetched(self, femobj, lookup, *args):
+        """Return the result of lookup(*args) for femobj, computed on the pool if available."""
+        future = self.prefetched_sets.pop((id(femobj), lookup), None)
+        if future is not None:
+            return future.result()
+        return lookup(*args)
+
+    def get_face_search_tables(self):
+        if not self.femnodes_mesh:
+            self.femnodes_mesh = self.femmesh.Nodes
+        if not self.femelement_table:
+            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        if not self.femnodes_ele_table:
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_index(
+                self.femmesh, self.femelement_table, self.mesh_object
+            )
+
+    def get_force_nodeload_tables(self, log=True):
+        # check shape type of reference shape
+        for femobj in self.member.cons_force:
+            # femobj --> dict, FreeCAD document object is femobj["Object"]
+            if femobj["RefShapeType"] == "Vertex":
+                msg = (
+                    "    load on vertices --> The femelement_table "
+                    "and femnodes_mesh are not needed for node load calculation.\n"
+                )
+            elif (
+                femobj["RefShapeType"] == "Face"
+                and meshtools.is_solid_femmesh(self.femmesh)
+                and not meshtools.has_no_face_data(self.femmesh)
+            ):
+                msg = (
+                    "    solid_mesh with face data --> The femelement_table is not "
+                    "needed but the femnodes_mesh is needed for node load calculation.\n"
+                )
+                if not self.femnodes_mesh:
+                    self.femnodes_mesh = self.femmesh.Nodes
+            else:
+                msg = (
+                    "    mesh without needed data --> The femelement_table "
+                    "and femnodes_mesh are not needed for node load calculation.\n"
+                )
+                if not self.femnodes_mesh:
+                    self.femnodes_mesh = self.femmesh.Nodes
+                if not self.femelement_table:
+                    self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+            if log:
+                print_obj_info(femobj["Object"], log=True)
+                FreeCAD.Console.PrintLog(msg)
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -166,7 +308,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_fixed:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -201,7 +345,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_rigidbody:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -213,7 +359,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_displacement:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -225,7 +373,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_planerotation:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
 
     def get_constraints_transform_nodes(self):
         if not self.member.cons_transform:
@@ -234,7 +384,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_transform:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
 
     def get_constraints_temperature_nodes(self):
         if not self.member.cons_temperature:
@@ -243,7 +395,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_temperature:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
 
     def get_constraints_fluidsection_nodes(self):
         if not self.member.geos_fluidsection:
@@ -252,7 +406,9 @@ class MeshSetsGetter:
         for femobj in self.member.geos_fluidsection:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_prefetched(
+                femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
+            )
 
     def get_constraints_electrostatic_nodes(self):
         if not self.member.cons_electrostatic:
@@ -262,42 +418,14 @@ class MeshSetsGetter:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             if femobj["Object"].BoundaryCondition == "Dirichlet":
                 print_obj_info(femobj["Object"])
-                femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                    self.femmesh, femobj
+                femobj["Nodes"] = self.get_prefetched(
+                    femobj, meshtools.get_femnodes_by_femobj_with_references, self.femmesh, femobj
                 )
 
     def get_constraints_force_nodeloads(self):
         if not self.member.cons_force:
             return
-        # check shape type of reference shape
-        for femobj in self.member.cons_force:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"], log=True)
-            if femobj["RefShapeType"] == "Vertex":
-                FreeCAD.Console.PrintLog(
-                    "    load on vertices --> The femelement_table "
-                    "and femnodes_mesh are not needed for node load calculation.\n"
-                )
-            elif (
-                femobj["RefShapeType"] == "Face"
-                and meshtools.is_solid_femmesh(self.femmesh)
-                and not meshtools.has_no_face_data(self.femmesh)
-            ):
-                FreeCAD.Console.PrintLog(
-                    "    solid_mesh with face data --> The femelement_table is not "
-                    "needed but the femnodes_mesh is needed for node load calculation.\n"
-                )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-            else:
-                FreeCAD.Console.PrintLog(
-                    "    mesh without needed data --> The femelement_table "
-                    "and femnodes_mesh are not needed for node load calculation.\n"
-                )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-                if not self.femelement_table:
-                    self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        self.get_force_nodeload_tables()
         # get node loads
         FreeCAD.Console.PrintLog(
             "    Finite element mesh nodes will be retrieved by searching "
@@ -314,16 +442,26 @@ class MeshSetsGetter:
             if frc_obj.Force == 0:
                 FreeCAD.Console.PrintMessage("  Warning --> Force = 0\n")
             if femobj["RefShapeType"] == "Vertex":  # point load on vertices
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
-                    self.femmesh, frc_obj
+                femobj["NodeLoadTable"] = self.get_prefetched(
+                    femobj, meshtools.get_force_obj_vertex_nodeload_table, self.femmesh, frc_obj
                 )
             elif femobj["RefShapeType"] == "Edge":  # line load on edges
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                femobj["NodeLoadTable"] = self.get_prefetched(
+                    femobj,
+                    meshtools.get_force_obj_edge_nodeload_table,
+                    self.femmesh,
+                    self.femelement_table,
+                    self.femnodes_mesh,
+                    frc_obj,
                 )
             elif femobj["RefShapeType"] == "Face":  # area load on faces
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                femobj["NodeLoadTable"] = self.get_prefetched(
+                    femobj,
+                    meshtools.get_force_obj_face_nodeload_table,
+                    self.femmesh,
+                    self.femelement_table,
+                    self.femnodes_mesh,
+                    frc_obj,
                 )
 
     # ********************************************************************************************
@@ -347,20 +485,18 @@ class MeshSetsGetter:
             # print(femobj["PressureFaces"])
         """
 
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
+        self.get_face_search_tables()
 
         for femobj in self.member.cons_pressure:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            pressure_faces = meshtools.get_pressure_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            pressure_faces = self.get_prefetched(
+                femobj,
+                meshtools.get_pressure_obj_faces,
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
             )
             # the data model is for compatibility reason with deprecated version
             # get_pressure_obj_faces_depreciated returns the face ids in a tuple per ref_shape
@@ -373,14 +509,7 @@ class MeshSetsGetter:
     def get_constraints_electrostatic_faces(self):
         if not self.member.cons_electrostatic:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
+        self.get_face_search_tables()
 
         for femobj in self.member.cons_electrostatic:
             if femobj["Object"].BoundaryCondition == "Neumann":
@@ -396,14 +525,7 @@ class MeshSetsGetter:
     def get_constraints_electricchargedensity_faces(self):
         if not self.member.cons_electricchargedensity:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
+        self.get_face_search_tables()
 
         for femobj in self.member.cons_electricchargedensity:
             if femobj["Object"].Mode in ["Interface", "Total Interface"]:
@@ -431,20 +553,18 @@ class MeshSetsGetter:
     def get_constraints_contact_faces(self):
         if not self.member.cons_contact:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
+        self.get_face_search_tables()
 
         for femobj in self.member.cons_contact:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            contact_slave_faces, contact_master_faces = meshtools.get_contact_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            contact_slave_faces, contact_master_faces = self.get_prefetched(
+                femobj,
+                meshtools.get_contact_obj_faces,
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -463,20 +583,18 @@ class MeshSetsGetter:
     def get_constraints_tie_faces(self):
         if not self.member.cons_tie:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
+        self.get_face_search_tables()
 
         for femobj in self.member.cons_tie:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            slave_faces, master_faces = meshtools.get_tie_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            slave_faces, master_faces = self.get_prefetched(
+                femobj,
+                meshtools.get_tie_obj_faces,
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -600,8 +718,8 @@ class MeshSetsGetter:
             if not self.femnodes_mesh:
                 self.femnodes_mesh = self.femmesh.Nodes
             if not self.femnodes_ele_table:
-                self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                    self.femnodes_mesh, self.femelement_table
+                self.femnodes_ele_table = meshtools.get_femnodes_ele_index(
+                    self.femmesh, self.femelement_table, self.mesh_object
                 )
             control = meshtools.get_femelement_sets(
                 self.femmesh, self.femelement_table, femobjs, self.femnodes_ele_table
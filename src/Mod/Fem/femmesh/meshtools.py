@@ -202,6 +202,121 @@ def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     return femnodes_ele_table
 
 
+# ************************************************************************************************
+class FemNodesElementIndex:
+    """compact node to element incidence index of a femelement_table
+
+    The information is the same as in the femnodes_ele_table of get_femnodes_ele_table,
+    but it is stored in CSR like NumPy arrays. The incidences of the node
+    node_ids[i] are incidence_elements[node_ptr[i]:node_ptr[i + 1]] (index of the
+    element in element_ids) and incidence_bits[node_ptr[i]:node_ptr[i + 1]] (position
+    of the node in the element as a set bit). Thus the bit patterns of get_bit_pattern_dict
+    are computed for all elements at once.
+    The index is built once per mesh, see get_femnodes_ele_index.
+    """
+
+    def __init__(self, femelement_table):
+        # the order of the elements is the order of the femelement_table
+        element_nodes = list(femelement_table.values())
+        self.element_ids = np.fromiter(femelement_table, dtype=np.int64, count=len(element_nodes))
+        self.element_node_counts = np.fromiter(
+            (len(nodes) for nodes in element_nodes), dtype=np.int64, count=len(element_nodes)
+        )
+        incidence_count = int(self.element_node_counts.sum())
+        incidence_nodes = np.fromiter(
+            (node for nodes in element_nodes for node in nodes),
+            dtype=np.int64,
+            count=incidence_count,
+        )
+        incidence_elements = np.repeat(
+            np.arange(len(element_nodes), dtype=np.int64), self.element_node_counts
+        )
+        element_starts = np.cumsum(self.element_node_counts) - self.element_node_counts
+        positions = np.arange(incidence_count, dtype=np.int64) - np.repeat(
+            element_starts, self.element_node_counts
+        )
+        # sort the incidences by node, stable to keep the element order per node
+        order = np.argsort(incidence_nodes, kind="stable")
+        self.node_ids, node_starts = np.unique(incidence_nodes[order], return_index=True)
+        self.node_ptr = np.append(node_starts, incidence_count)
+        self.incidence_elements = incidence_elements[order]
+        self.incidence_bits = np.left_shift(1, positions[order])
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def get_bit_patterns(self, node_set):
+        """bit pattern of every element, the bit of a node is set if it is in node_set
+        returns an array in the order of element_ids, see get_bit_pattern_dict
+        """
+        nodes = np.unique(np.asarray(list(node_set), dtype=np.int64))
+        indices = np.searchsorted(self.node_ids, nodes)
+        # nodes which are not in any element are skipped
+        valid = indices < len(self.node_ids)
+        valid[valid] = self.node_ids[indices[valid]] == nodes[valid]
+        indices = indices[valid]
+        starts = self.node_ptr[indices]
+        lengths = self.node_ptr[indices + 1] - starts
+        # the incidences of all nodes of the node_set
+        offsets = np.cumsum(lengths) - lengths
+        incidences = np.arange(int(lengths.sum()), dtype=np.int64) + np.repeat(
+            starts - offsets, lengths
+        )
+        # every bit of an element is set once at most, thus the sum is the bit pattern
+        patterns = np.bincount(
+            self.incidence_elements[incidences],
+            weights=self.incidence_bits[incidences],
+            minlength=len(self.element_ids),
+        )
+        return patterns.astype(np.int64)
+
+    def binary_search(self, node_set, masks, with_face_numbers=True):
+        """vectorized version of get_elements_from_binary_search
+        the found elements are returned in the same order
+        """
+        patterns = self.get_bit_patterns(node_set)
+        found_elements = []
+        found_masks = []
+        found_faces = []
+        mask_position = 0
+        for node_count, mask_dict in masks.items():
+            candidates = np.flatnonzero((self.element_node_counts == node_count) & (patterns != 0))
+            candidate_patterns = patterns[candidates]
+            for mask, face in mask_dict.items():
+                elements = candidates[(candidate_patterns & mask) == mask]
+                found_elements.append(elements)
+                found_masks.append(np.full(len(elements), mask_position))
+                found_faces.append(np.full(len(elements), face))
+                mask_position += 1
+        if not found_elements:
+            return []
+        found_elements = np.concatenate(found_elements)
+        found_masks = np.concatenate(found_masks)
+        order = np.lexsort((found_masks, found_elements))
+        element_ids = self.element_ids[found_elements[order]].tolist()
+        if not with_face_numbers:
+            return element_ids
+        faces = np.concatenate(found_faces)[order].tolist()
+        return [[ele, face] for ele, face in zip(element_ids, faces)]
+
+
+def get_femnodes_ele_index(femmesh, femelement_table, mesh_obj=None):
+    """get the FemNodesElementIndex of the femelement_table of the femmesh
+    If a mesh_obj with a Python proxy is given, the index is kept on the proxy
+    and reused until the FemMesh of the mesh object changes, the mesh proxies
+    reset it in their onChanged.
+    """
+    proxy = getattr(mesh_obj, "Proxy", None)
+    if proxy is None:
+        return FemNodesElementIndex(femelement_table)
+    index = getattr(proxy, "femnodes_ele_index", None)
+    if index is None:
+        FreeCAD.Console.PrintLog(f"Build femnodes element index for {mesh_obj.Name}\n")
+        index = FemNodesElementIndex(femelement_table)
+        proxy.femnodes_ele_index = index
+    return index
+
+
 # ************************************************************************************************
 def get_copy_of_empty_femelement_table(femelement_table):
     """{eleID : 0, eleID : 0, ...}"""
@@ -242,27 +357,63 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
 
 
 # ************************************************************************************************
-def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
-    tet10_mask = {0b1111111111: 1}
-    tet4_mask = {0b1111: 1}
-    hex8_mask = {0b11111111: 1}
-    hex20_mask = {0b11111111111111111111: 1}
-    pent6_mask = {0b111111: 1}
-    pent15_mask = {0b111111111111111: 1}
-    vol_dict = {
-        4: tet4_mask,
-        6: pent6_mask,
-        8: hex8_mask,
-        10: tet10_mask,
-        15: pent15_mask,
-        20: hex20_mask,
-    }
-    volumes = []
+# bit masks of the nodes of a femelement (key is the number of nodes of the femelement)
+# see get_bit_pattern_dict and get_ccxelement_faces_from_binary_search for more information
+CCX_VOLUME_ELEMENT_MASKS = {
+    4: {0b1111: 1},
+    6: {0b111111: 1},
+    8: {0b11111111: 1},
+    10: {0b1111111111: 1},
+    15: {0b111111111111111: 1},
+    20: {0b11111111111111111111: 1},
+}
+CCX_FACE_ELEMENT_MASKS = {
+    3: {0b111: 1},
+    6: {0b111111: 1},
+    4: {0b1111: 1},
+    8: {0b11111111: 1},
+}
+CCX_FACE_EDGE_MASKS = {
+    3: {0b011: 1, 0b110: 2, 0b101: 3},
+    6: {0b001011: 1, 0b010110: 2, 0b100101: 3},
+    4: {0b0011: 1, 0b0110: 2, 0b1100: 3, 0b1001: 4},
+    8: {0b00010011: 1, 0b00100110: 2, 0b01001100: 3, 0b10001001: 4},
+}
+# the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318#p137171
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=60#p141484
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=50#p141108
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=40#p140371
+CCX_VOLUME_FACE_MASKS = {
+    4: {7: 1, 11: 2, 13: 3, 14: 4},
+    6: {56: 1, 7: 2, 54: 3, 45: 4, 27: 5},
+    8: {240: 1, 15: 2, 102: 3, 204: 4, 153: 5, 51: 6},
+    10: {119: 1, 411: 2, 717: 3, 814: 4},
+    15: {3640: 1, 455: 2, 25782: 3, 22829: 4, 12891: 5},
+    20: {61680: 1, 3855: 2, 402022: 3, 804044: 4, 624793: 5, 201011: 6},
+}
+
+
+def get_elements_from_binary_search(bit_pattern_dict, masks, with_face_numbers=True):
+    """search the elements of the bit_pattern_dict which have all bits set of one of the masks
+    masks: {number of element nodes: {bit mask: face number}}
+    returns [[eleID, face number], ...] or [eleID, ...] if with_face_numbers is False
+    """
+    found = []
     for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
+        mask_dict = masks[bit_pattern_dict[ele][0]]
         for key in mask_dict:
             if (key & bit_pattern_dict[ele][1]) == key:
-                volumes.append(ele)
+                if with_face_numbers:
+                    found.append([ele, mask_dict[key]])
+                else:
+                    found.append(ele)
+    return found
+
+
+# ************************************************************************************************
+def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
+    volumes = get_elements_from_binary_search(bit_pattern_dict, CCX_VOLUME_ELEMENT_MASKS, False)
     # print("VOLUMES:", volumes)
     FreeCAD.Console.PrintLog(f"found Volumes: {len(volumes)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
@@ -270,44 +421,14 @@ def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
 
 
 def get_ccxelement_faces_elements_from_binary_search(bit_pattern_dict):
-    tria3_mask = {0b111: 1}
-    tria6_mask = {0b111111: 1}
-    quad4_mask = {0b1111: 1}
-    quad8_mask = {0b11111111: 1}
-    vol_dict = {
-        3: tria3_mask,
-        6: tria6_mask,
-        4: quad4_mask,
-        8: quad8_mask,
-    }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append(ele)
+    faces = get_elements_from_binary_search(bit_pattern_dict, CCX_FACE_ELEMENT_MASKS, False)
     # print("CARAS:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
     return faces
 
 
 def get_ccxelement_edges_from_binary_search(bit_pattern_dict):
-    tria3_mask = {0b011: 1, 0b110: 2, 0b101: 3}
-    tria6_mask = {0b001011: 1, 0b010110: 2, 0b100101: 3}
-    quad4_mask = {0b0011: 1, 0b0110: 2, 0b1100: 3, 0b1001: 4}
-    quad8_mask = {0b00010011: 1, 0b00100110: 2, 0b01001100: 3, 0b10001001: 4}
-    vol_dict = {
-        3: tria3_mask,
-        6: tria6_mask,
-        4: quad4_mask,
-        8: quad8_mask,
-    }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    faces = get_elements_from_binary_search(bit_pattern_dict, CCX_FACE_EDGE_MASKS)
     # print("EDGES:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
 
@@ -316,37 +437,30 @@ def get_ccxelement_edges_from_binary_search(bit_pattern_dict):
 
 def get_ccxelement_faces_from_binary_search(bit_pattern_dict):
     """get the CalculiX element face numbers"""
-    # the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318#p137171
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=60#p141484
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=50#p141108
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=40#p140371
-    tet10_mask = {119: 1, 411: 2, 717: 3, 814: 4}
-    tet4_mask = {7: 1, 11: 2, 13: 3, 14: 4}
-    hex8_mask = {240: 1, 15: 2, 102: 3, 204: 4, 153: 5, 51: 6}
-    hex20_mask = {61680: 1, 3855: 2, 402022: 3, 804044: 4, 624793: 5, 201011: 6}
-    pent6_mask = {56: 1, 7: 2, 54: 3, 45: 4, 27: 5}
-    pent15_mask = {3640: 1, 455: 2, 25782: 3, 22829: 4, 12891: 5}
-    vol_dict = {
-        4: tet4_mask,
-        6: pent6_mask,
-        8: hex8_mask,
-        10: tet10_mask,
-        15: pent15_mask,
-        20: hex20_mask,
-    }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    faces = get_elements_from_binary_search(bit_pattern_dict, CCX_VOLUME_FACE_MASKS)
     # print("FACES:", faces)
     FreeCAD.Console.PrintLog(f"found Faces: {len(faces)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
     return faces
 
 
+def get_ccxelements_by_femnodes(
+    femelement_table, femnodes_ele_table, node_set, masks, with_face_numbers=True
+):
+    """binary search of the elements or element faces of the node_set
+    femnodes_ele_table: FemNodesElementIndex (vectorized search)
+    or the dict of get_femnodes_ele_table (search by a bit_pattern_dict)
+    see get_elements_from_binary_search for masks and the returned list
+    """
+    if isinstance(femnodes_ele_table, FemNodesElementIndex):
+        found = femnodes_ele_table.binary_search(node_set, masks, with_face_numbers)
+    else:
+        bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set)
+        found = get_elements_from_binary_search(bit_pattern_dict, masks, with_face_numbers)
+    FreeCAD.Console.PrintLog(f"found elements: {len(found)}\n")
+    return found
+
+
 # ************************************************************************************************
 def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_list):
     """for every femelement of femelement_table
@@ -355,6 +469,10 @@ def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_l
     blind fast binary search, but works for volumes only
     """
     FreeCAD.Console.PrintMessage("binary search: get_femelements_by_femnodes_bin\n")
+    if isinstance(femnodes_ele_table, FemNodesElementIndex):
+        ele_list = femnodes_ele_table.binary_search(node_list, CCX_VOLUME_ELEMENT_MASKS, False)
+        FreeCAD.Console.PrintMessage(f"found Volumes: {len(ele_list)}\n")
+        return ele_list
     vol_masks = {4: 15, 6: 63, 8: 255, 10: 1023, 15: 32767, 20: 1048575}
     # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
     FreeCAD.Console.PrintMessage(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
@@ -1525,17 +1643,22 @@ def get_charge_density_obj_elements(femmesh, femelement_table, femnodes_ele_tabl
                 node_set = get_femnodes_by_references(femmesh, [sub])
                 charged_volume_node_set = sorted(set(node_set))
 
-                bit_pattern_dict = get_bit_pattern_dict(
-                    femelement_table, femnodes_ele_table, charged_volume_node_set
-                )
                 sh = feat.getSubObject(sub_ref)
                 if sh.ShapeType == "Solid":
-                    charged_elem = get_ccxelement_volumes_elements_from_binary_search(
-                        bit_pattern_dict
+                    charged_elem = get_ccxelements_by_femnodes(
+                        femelement_table,
+                        femnodes_ele_table,
+                        charged_volume_node_set,
+                        CCX_VOLUME_ELEMENT_MASKS,
+                        False,
                     )
                 elif sh.ShapeType == "Face":
-                    charged_elem = get_ccxelement_faces_elements_from_binary_search(
-                        bit_pattern_dict
+                    charged_elem = get_ccxelements_by_femnodes(
+                        femelement_table,
+                        femnodes_ele_table,
+                        charged_volume_node_set,
+                        CCX_FACE_ELEMENT_MASKS,
+                        False,
                     )
                 res.append((sub, charged_elem))
 
@@ -1565,14 +1688,21 @@ def get_charge_density_obj_faces(femmesh, femelement_table, femnodes_ele_table,
                 node_set = get_femnodes_by_references(femmesh, [sub])
                 charged_face_node_set = sorted(set(node_set))
 
-                bit_pattern_dict = get_bit_pattern_dict(
-                    femelement_table, femnodes_ele_table, charged_face_node_set
-                )
                 sh = feat.getSubObject(sub_ref)
                 if sh.ShapeType == "Face":
-                    charged_faces = get_ccxelement_faces_from_binary_search(bit_pattern_dict)
+                    charged_faces = get_ccxelements_by_femnodes(
+                        femelement_table,
+                        femnodes_ele_table,
+                        charged_face_node_set,
+                        CCX_VOLUME_FACE_MASKS,
+                    )
                 elif sh.ShapeType == "Edge":
-                    charged_faces = get_ccxelement_edges_from_binary_search(bit_pattern_dict)
+                    charged_faces = get_ccxelements_by_femnodes(
+                        femelement_table,
+                        femnodes_ele_table,
+                        charged_face_node_set,
+                        CCX_FACE_EDGE_MASKS,
+                    )
 
                 res.append((sub, charged_faces))
 
@@ -1587,11 +1717,10 @@ def get_pressure_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj
         # sorted and duplicates removed
         prs_face_node_set = get_femnodes_by_femobj_with_references(femmesh, femobj)
         # FreeCAD.Console.PrintMessage("prs_face_node_set: {}\n".format(prs_face_node_set))
-        # fill the bit_pattern_dict and search for the faces
-        bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, prs_face_node_set
+        # fill the bit patterns and search for the faces
+        pressure_faces = get_ccxelements_by_femnodes(
+            femelement_table, femnodes_ele_table, prs_face_node_set, CCX_VOLUME_FACE_MASKS
         )
-        pressure_faces = get_ccxelement_faces_from_binary_search(bit_pattern_dict)
     elif is_face_femmesh(femmesh):
         pressure_faces = []
         # normally we should call get_femelements_by_references and
@@ -1696,18 +1825,14 @@ def get_contact_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj)
         FreeCAD.Console.PrintLog(f"    slaveface_nds: {slaveface_nds}\n")
         FreeCAD.Console.PrintLog(f"    masterface_nds: {slaveface_nds}\n")
 
-        FreeCAD.Console.PrintLog("    Fill the bit_pattern_dict and search for the faces.\n")
-        slave_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, slaveface_nds
+        FreeCAD.Console.PrintLog("    Fill the bit patterns and search for the FaceIDs.\n")
+        slave_faces = get_ccxelements_by_femnodes(
+            femelement_table, femnodes_ele_table, slaveface_nds, CCX_VOLUME_FACE_MASKS
         )
-        master_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, masterface_nds
+        master_faces = get_ccxelements_by_femnodes(
+            femelement_table, femnodes_ele_table, masterface_nds, CCX_VOLUME_FACE_MASKS
         )
 
-        FreeCAD.Console.PrintLog("    Get the FaceIDs.\n")
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
-
     elif is_face_femmesh(femmesh):
         slave_ref_shape = slave_ref[0].Shape.getElement(slave_ref[1][0])
         master_ref_shape = master_ref[0].Shape.getElement(master_ref[1][0])
@@ -1777,18 +1902,14 @@ def get_tie_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj):
     # FreeCAD.Console.PrintLog("slaveface_nds: {}\n".format(slaveface_nds))
     # FreeCAD.Console.PrintLog("masterface_nds: {}\n".format(slaveface_nds))
 
-    # fill the bit_pattern_dict and search for the faces
-    slave_bit_pattern_dict = get_bit_pattern_dict(
-        femelement_table, femnodes_ele_table, slaveface_nds
+    # fill the bit patterns and search for the faces ids
+    slave_faces = get_ccxelements_by_femnodes(
+        femelement_table, femnodes_ele_table, slaveface_nds, CCX_VOLUME_FACE_MASKS
     )
-    master_bit_pattern_dict = get_bit_pattern_dict(
-        femelement_table, femnodes_ele_table, masterface_nds
+    master_faces = get_ccxelements_by_femnodes(
+        femelement_table, femnodes_ele_table, masterface_nds, CCX_VOLUME_FACE_MASKS
     )
 
-    # get the faces ids
-    slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-    master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
-
     FreeCAD.Console.PrintLog(f"slave_faces: {slave_faces}\n")
     FreeCAD.Console.PrintLog(f"master_faces: {master_faces}\n")
     return [slave_faces, master_faces]
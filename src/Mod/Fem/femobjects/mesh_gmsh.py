@@ -271,6 +271,11 @@ class MeshGmsh(base_fempythonobject.BaseFemPythonObject):
 
         return prop
 
+    def onChanged(self, obj, prop):
+        if prop == "FemMesh":
+            # see meshtools.get_femnodes_ele_index
+            self.femnodes_ele_index = None
+
     def onDocumentRestored(self, obj):
         # update old project with new properties
         for prop in self._get_properties():
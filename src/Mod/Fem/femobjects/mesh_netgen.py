@@ -531,6 +531,9 @@ class MeshNetgen(base_fempythonobject.BaseFemPythonObject):
         return prop
 
     def onChanged(self, obj, prop):
+        if prop == "FemMesh":
+            # see meshtools.get_femnodes_ele_index
+            self.femnodes_ele_index = None
         if prop == "Fineness":
             if obj.Fineness != "UserDefined":
                 p = self.get_predef_fineness_params(obj.Fineness)
@@ -41,3 +41,8 @@ class MeshResult(base_fempythonobject.BaseFemPythonObject):
 
     def __init__(self, obj):
         super().__init__(obj)
+
+    def onChanged(self, obj, prop):
+        if prop == "FemMesh":
+            # see meshtools.get_femnodes_ele_index
+            self.femnodes_ele_index = None
@@ -283,40 +283,30 @@ def fill_femresult_stats(res_obj):
     temp_min = temp_max = 0
     mflow_min = mflow_max = npress_min = npress_max = 0
 
+    # all min and max values are computed on arrays, each result list is converted once
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = get_min_max(res_obj.DisplacementVectors)
     if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
+        a_min, a_max = get_min_max(res_obj.DisplacementLengths)
     if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
+        s_min, s_max = get_min_max(res_obj.vonMises)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_max = get_min_max(res_obj.PrincipalMax)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_max = get_min_max(res_obj.PrincipalMed)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_max = get_min_max(res_obj.PrincipalMin)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_max = get_min_max(res_obj.MaxShear)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_max = get_min_max(res_obj.Peeq)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_max = get_min_max(res_obj.Temperature)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_max = get_min_max(res_obj.MassFlowRate)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_max = get_min_max(res_obj.NetworkPressure)
 
     res_obj.Stats = [
         x_min,
@@ -382,19 +372,35 @@ def add_disp_apps(res_obj):
     return res_obj
 
 
-def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+def get_stress_tensors(res_obj):
+    """Returns the stress tensors of all nodes of a result object as one array.
+
+    Parameters
+    ----------
+    resultobj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+
+    Returns
+    -------
+    numpy.ndarray
+        array of shape (number of nodes, 6), a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    """
+
+    return np.column_stack(
+        (
+            np.asarray(res_obj.NodeStressXX, dtype=float),
+            np.asarray(res_obj.NodeStressYY, dtype=float),
+            np.asarray(res_obj.NodeStressZZ, dtype=float),
+            np.asarray(res_obj.NodeStressXY, dtype=float),
+            np.asarray(res_obj.NodeStressXZ, dtype=float),
+            np.asarray(res_obj.NodeStressYZ, dtype=float),
+        )
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+
+
+def add_von_mises(res_obj):
+    stress_tensors = get_stress_tensors(res_obj)
+    res_obj.vonMises = calculate_von_mises_array(stress_tensors).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -404,28 +410,14 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    stress_tensors = get_stress_tensors(res_obj)
+    prinstress1, prinstress2, prinstress3, shearstress = calculate_principal_stress_std_array(
+        stress_tensors
+    ).T
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -477,20 +469,20 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
             unless available from extensive research experiments
             T = pressure / von Mises stress (stress triaxiality)
     """
-    csr = []  # critical strain ratio
+    ps1 = np.asarray(ps1, dtype=float)
+    ps2 = np.asarray(ps2, dtype=float)
+    ps3 = np.asarray(ps3, dtype=float)
     nsr = len(ps1)  # number of stress results
-    for i in range(nsr):
-        p = (ps1[i] + ps2[i] + ps3[i]) / 3.0  # pressure
-        svm = np.sqrt(
-            1.5 * (ps1[i] - p) ** 2 + 1.5 * (ps2[i] - p) ** 2 + 1.5 * (ps3[i] - p) ** 2
-        )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
-        if svm != 0.0:
-            T = p / svm  # stress triaxiality
-        else:
-            T = 0.0
-        critical_strain = alpha * np.exp(-beta * T)  # critical strain
-        csr.append(abs(res_obj.Peeq[i]) / critical_strain)  # critical strain ratio
-    return csr
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(
+        1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2
+    )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = np.where(svm != 0.0, p / svm, 0.0)  # stress triaxiality
+    critical_strain = alpha * np.exp(-beta * T)  # critical strain
+    peeq = np.asarray(res_obj.Peeq[:nsr], dtype=float)
+    csr = np.abs(peeq) / critical_strain  # critical strain ratio
+    return csr.tolist()
 
 
 def get_concrete_nodes(res_obj):
@@ -513,27 +505,21 @@ def get_concrete_nodes(res_obj):
         ):
             FreeCAD.Console.PrintMessage("ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 1
+                ic[ic == 0] = 1
             else:
                 for ref in obj.References:
                     concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for cn in concrete_nodes:
-                        ic[cn - 1] = 1
+                    ic[np.asarray(concrete_nodes, dtype=int) - 1] = 1
         elif obj.isDerivedFrom("App::MaterialObjectPython") and is_of_type(
             obj, "Fem::MaterialCommon"
         ):
             FreeCAD.Console.PrintMessage("No ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 2
+                ic[ic == 0] = 2
             else:
                 for ref in obj.References:
                     non_concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for ncn in non_concrete_nodes:
-                        ic[ncn - 1] = 2
+                    ic[np.asarray(non_concrete_nodes, dtype=int) - 1] = 2
     return ic
 
 
@@ -543,29 +529,6 @@ def add_principal_stress_reinforced(res_obj):
     #
     ic = get_concrete_nodes(res_obj)
 
-    #
-    # calculate principal and max Shear and fill them in res_obj
-    #
-    # saved into PS1Vector, PS2Vector, PS3Vector
-    # TODO may be use only one container for principal stresses in result object
-    # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
-    # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
-
     # material parameter
     for obj in res_obj.getParentGroup().Group:
         if is_of_type(obj, "Fem::MaterialReinforced"):
@@ -582,65 +545,52 @@ def add_principal_stress_reinforced(res_obj):
     # print(matrix_cs)
     # print(reinforce_yield)
 
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.0
-        rhoy = 0.0
-        rhoz = 0.0
-        mc = 0.0
-
-        if ic[isv] == 1:
-            #
-            # for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(stress_tensor, reinforce_yield)
-
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(stress_tensor)
-
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
+    #
+    # calculate principal and max Shear and fill them in res_obj
+    #
+    # saved into PS1Vector, PS2Vector, PS3Vector
+    # TODO may be use only one container for principal stresses in result object
+    # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
+    # but which one is better
+    stress_tensors = get_stress_tensors(res_obj)
+    principal, psv = calculate_principal_stress_reinforced_array(stress_tensors)
+    prinstress1, prinstress2, prinstress3, shearstress = principal.T
 
+    #
+    # reinforcement ratios and mohr coulomb criterion
+    # additional arrays to hold reinforcement ratios
+    # and mohr coulomb stress, they are only calculated for concrete nodes
+    #
+    concrete = np.asarray(ic) == 1
+    rho = np.zeros((len(stress_tensors), 3))
+    moc = np.zeros(len(stress_tensors))
+    if concrete.any():
         #
-        # reinforcement ratios and mohr coulomb criterion
+        # for concrete scxx etc. are affected by
+        # reinforcement (see calculate_rho(stress_tensor)). for all other
+        # materials scxx etc. are the original stresses
         #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
-
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+        rho[concrete] = calculate_rho_array(stress_tensors[concrete], reinforce_yield)
+        moc[concrete] = calculate_mohr_coulomb_array(
+            prinstress1[concrete], prinstress3[concrete], matrix_af, matrix_cs
+        )
+
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     #
     # additional concrete and principal stress plot
     # results for use in _ViewProviderFemResultMechanical
     #
-    res_obj.ReinforcementRatio_x = rhx
-    res_obj.ReinforcementRatio_y = rhy
-    res_obj.ReinforcementRatio_z = rhz
-    res_obj.MohrCoulomb = moc
+    res_obj.ReinforcementRatio_x = rho[:, 0].tolist()
+    res_obj.ReinforcementRatio_y = rho[:, 1].tolist()
+    res_obj.ReinforcementRatio_z = rho[:, 2].tolist()
+    res_obj.MohrCoulomb = moc.tolist()
 
-    res_obj.PS1Vector = ps1v
-    res_obj.PS2Vector = ps2v
-    res_obj.PS3Vector = ps3v
+    res_obj.PS1Vector = list(map(tuple, psv[:, 0].tolist()))
+    res_obj.PS2Vector = list(map(tuple, psv[:, 1].tolist()))
+    res_obj.PS3Vector = list(map(tuple, psv[:, 2].tolist()))
 
     FreeCAD.Console.PrintLog(
         "Added reinforcement principal stresses and max shear values as well as "
@@ -692,6 +642,22 @@ def calculate_von_mises(stress_tensor):
     return von_mises
 
 
+def calculate_von_mises_array(stress_tensors):
+    """Calculate Von mises stress of many stress tensors at once.
+    Array version of calculate_von_mises.
+
+    stress_tensors ... array of shape (n, 6), a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = normal.mean(axis=1, keepdims=True)
+    von_mises = np.sqrt(
+        1.5 * np.sum((normal - pressure) ** 2, axis=1) + 3.0 * np.sum(shear**2, axis=1)
+    )
+    return von_mises
+
+
 def calculate_principal_stress_std(stress_tensor):
     # if NaN is inside the array, which can happen on Calculix frd result files return NaN
     # https://forum.freecad.org/viewtopic.php?f=22&t=33911&start=10#p284229
@@ -717,6 +683,42 @@ def calculate_principal_stress_std(stress_tensor):
     return (eigvals[0], eigvals[1], eigvals[2], maxshear)
 
 
+def get_stress_matrices(stress_tensors):
+    """Returns the symmetric 3x3 matrices of stress tensors given as rows
+    (Sxx, Syy, Szz, Sxy, Sxz, Syz), the returned array has the shape (n, 3, 3)
+    """
+    s11, s22, s33, s12, s31, s23 = stress_tensors.T
+    sigma = np.stack(
+        (
+            np.stack((s11, s12, s31), axis=-1),
+            np.stack((s12, s22, s23), axis=-1),
+            np.stack((s31, s23, s33), axis=-1),
+        ),
+        axis=1,
+    )  # https://forum.freecad.org/viewtopic.php?f=18&t=24637&start=10#p240408
+    return sigma
+
+
+def calculate_principal_stress_std_array(stress_tensors):
+    """Calculate principal stresses and max shear of many stress tensors at once.
+    Array version of calculate_principal_stress_std.
+
+    stress_tensors ... array of shape (n, 6), a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns an array of shape (n, 4), a row is (prin1, prin2, prin3, maxshear)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    results = np.full((len(stress_tensors), 4), np.nan)
+    # if NaN is inside a stress tensor, which can happen on Calculix frd result files,
+    # all values of this node are NaN, see calculate_principal_stress_std
+    valid = ~np.isnan(stress_tensors).any(axis=1)
+    if valid.any():
+        # eigvalsh returns the eigenvalues in ascending order
+        eigvals = np.linalg.eigvalsh(get_stress_matrices(stress_tensors[valid]))[:, ::-1]
+        results[valid, :3] = eigvals
+        results[valid, 3] = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return results
+
+
 def calculate_principal_stress_reinforced(stress_tensor):
     """Calculate principal stress vectors and values.
 
@@ -767,6 +769,45 @@ def calculate_principal_stress_reinforced(stress_tensor):
     )
 
 
+def calculate_principal_stress_reinforced_array(stress_tensors):
+    """Calculate principal stress vectors and values of many stress tensors at once.
+    Array version of calculate_principal_stress_reinforced.
+
+    stress_tensors ... array of shape (n, 6), a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns a tuple of two arrays:
+    - shape (n, 4), a row is (prin1, prin2, prin3, maxshear)
+    - shape (n, 3, 3), the principal stress vectors, [i, 0] is the vector of prin1 of node i
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    results = np.zeros((len(stress_tensors), 4))
+    vectors = np.zeros((len(stress_tensors), 3, 3))
+    if len(stress_tensors) == 0:
+        return results, vectors
+
+    eigenvalues, eigenvectors = np.linalg.eig(get_stress_matrices(stress_tensors))
+
+    #
+    #   suppress complex eigenvalue and vectors that may occur for
+    #   near-zero (numerical noise) stress fields
+    #
+
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real
+
+    # scale the eigenvectors (columns) by their eigenvalues
+    eigenvectors = eigenvectors * eigenvalues[:, np.newaxis, :]
+
+    # stable sort, the order of equal eigenvalues is the same as in the single tensor version
+    idx = np.argsort(eigenvalues, axis=1, kind="stable")[:, ::-1]
+    eigenvalues = np.take_along_axis(eigenvalues, idx, axis=1)
+    eigenvectors = np.take_along_axis(eigenvectors, idx[:, np.newaxis, :], axis=2)
+
+    results[:, :3] = eigenvalues
+    results[:, 3] = (eigenvalues[:, 0] - eigenvalues[:, 2]) / 2.0
+    vectors[:] = np.swapaxes(eigenvectors, 1, 2)
+    return results, vectors
+
+
 def calculate_rho(stress_tensor, fy):
     """Calculation of Reinforcement Ratios and Concrete Stresses
     (in accordance with http://heronjournal.nl/53-4/3.pdf)
@@ -925,6 +966,140 @@ def calculate_rho(stress_tensor, fy):
     return rhox[eqmin], rhoy[eqmin], rhoz[eqmin]
 
 
+def calculate_rho_array(stress_tensors, fy):
+    """Calculation of Reinforcement Ratios of many stress tensors at once.
+    Array version of calculate_rho, all 15 solutions are evaluated for all
+    stress tensors and the governing one is selected per stress tensor.
+
+    Parameters
+    ----------
+    - stress_tensors: array of shape (n, 6), a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    - fy: factored yield strength of reinforcement bars
+
+    returns an array of shape (n, 3), a row is (rhox, rhoy, rhoz)
+    """
+
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    nst = len(stress_tensors)
+
+    sxx = stress_tensors[:, 0]
+    syy = stress_tensors[:, 1]
+    szz = stress_tensors[:, 2]
+    sxy = stress_tensors[:, 3]
+    syz = stress_tensors[:, 5]
+    sxz = stress_tensors[:, 4]
+
+    rhox = np.zeros((nst, 15))
+    rhoy = np.zeros((nst, 15))
+    rhoz = np.zeros((nst, 15))
+
+    def divide(dividend, divisor):
+        # dividend / divisor, 0.0 if the divisor is 0.0 (solution not defined)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(divisor != 0.0, dividend / divisor, 0.0)
+
+    i3 = sxx * syy * szz + 2 * sxy * sxz * syz - sxx * syz**2 - syy * sxz**2 - szz * sxy**2
+
+    # Solution (5)
+    rhoz[:, 0] = divide(i3, sxx * syy - sxy**2) / fy
+
+    # Solution (6)
+    rhoy[:, 1] = divide(i3, sxx * szz - sxz**2) / fy
+
+    # Solution (7)
+    rhox[:, 2] = divide(i3, syy * szz - syz**2) / fy
+
+    # Solution (9)
+    nz = sxx != 0.0
+    fc = divide(sxz * sxy, sxx) - syz
+    fxy = divide(sxy**2, sxx)
+    fxz = divide(sxz**2, sxx)
+    # Solution (9+)
+    rhoy[:, 3] = np.where(nz, (syy - fxy + fc) / fy, 0.0)
+    rhoz[:, 3] = np.where(nz, (szz - fxz + fc) / fy, 0.0)
+    # Solution (9-)
+    rhoy[:, 4] = np.where(nz, (syy - fxy - fc) / fy, 0.0)
+    rhoz[:, 4] = np.where(nz, (szz - fxz - fc) / fy, 0.0)
+
+    # Solution (10)
+    nz = syy != 0.0
+    fc = divide(syz * sxy, syy) - sxz
+    fxy = divide(sxy**2, syy)
+    fyz = divide(syz**2, syy)
+    # Solution (10+)
+    rhox[:, 5] = np.where(nz, (sxx - fxy + fc) / fy, 0.0)
+    rhoz[:, 5] = np.where(nz, (szz - fyz + fc) / fy, 0.0)
+    # Solution (10-)
+    rhox[:, 6] = np.where(nz, (sxx - fxy - fc) / fy, 0.0)
+    rhoz[:, 6] = np.where(nz, (szz - fyz - fc) / fy, 0.0)
+
+    # Solution (11)
+    nz = szz != 0.0
+    fc = divide(sxz * syz, szz) - sxy
+    fxz = divide(sxz**2, szz)
+    fyz = divide(syz**2, szz)
+    # Solution (11+)
+    rhox[:, 7] = np.where(nz, (sxx - fxz + fc) / fy, 0.0)
+    rhoy[:, 7] = np.where(nz, (syy - fyz + fc) / fy, 0.0)
+    # Solution (11-)
+    rhox[:, 8] = np.where(nz, (sxx - fxz - fc) / fy, 0.0)
+    rhoy[:, 8] = np.where(nz, (syy - fyz - fc) / fy, 0.0)
+
+    # Solution (13)
+    rhox[:, 9] = (sxx + sxy + sxz) / fy
+    rhoy[:, 9] = (syy + sxy + syz) / fy
+    rhoz[:, 9] = (szz + sxz + syz) / fy
+
+    # Solution (14)
+    rhox[:, 10] = (sxx + sxy - sxz) / fy
+    rhoy[:, 10] = (syy + sxy - syz) / fy
+    rhoz[:, 10] = (szz - sxz - syz) / fy
+
+    # Solution (15)
+    rhox[:, 11] = (sxx - sxy - sxz) / fy
+    rhoy[:, 11] = (syy - sxy + syz) / fy
+    rhoz[:, 11] = (szz - sxz + syz) / fy
+
+    # Solution (16)
+    rhox[:, 12] = (sxx - sxy + sxz) / fy
+    rhoy[:, 12] = (syy - sxy - syz) / fy
+    rhoz[:, 12] = (szz + sxz - syz) / fy
+
+    # Solution (17)
+    rhox[:, 13] = np.where(syz != 0.0, (sxx - divide(sxy * sxz, syz)) / fy, 0.0)
+    rhoy[:, 13] = np.where(sxz != 0.0, (syy - divide(sxy * syz, sxz)) / fy, 0.0)
+    rhoz[:, 13] = np.where(sxy != 0.0, (szz - divide(sxz * syz, sxy)) / fy, 0.0)
+
+    # Concrete Stresses of all solutions
+    scxx = sxx[:, np.newaxis] - rhox * fy
+    scyy = syy[:, np.newaxis] - rhoy * fy
+    sczz = szz[:, np.newaxis] - rhoz * fy
+    sxy = sxy[:, np.newaxis]
+    sxz = sxz[:, np.newaxis]
+    syz = syz[:, np.newaxis]
+    ic1 = scxx + scyy + sczz
+    ic2 = scxx * scyy + scyy * sczz + sczz * scxx - sxy**2 - sxz**2 - syz**2
+    ic3 = scxx * scyy * sczz + 2 * sxy * sxz * syz - scxx * syz**2 - scyy * sxz**2 - sczz * sxy**2
+
+    rsum = rhox + rhoy + rhoz
+    valid = (
+        (rhox >= -1.0e-10)
+        & (rhoy >= -1.0e-10)
+        & (rhoz > -1.0e-10)
+        & (ic1 <= 1.0e-6)
+        & (ic2 >= -1.0e-6)
+        & (ic3 <= 1.0e-6)
+        & (rsum > 0.0)
+        & (rsum < 1.0e9)
+    )
+    # the first solution with the smallest sum governs, solution 14 (all zero) if none is valid
+    rsum = np.where(valid, rsum, np.inf)
+    eqmin = np.where(valid.any(axis=1), np.argmin(rsum, axis=1), 14)
+
+    rows = np.arange(nst)
+    return np.column_stack((rhox[rows, eqmin], rhoy[rows, eqmin], rhoz[rows, eqmin]))
+
+
 def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     """Calculation of Mohr Coulomb yield criterion to judge
     concrete crushing and shear failure.
@@ -945,9 +1120,33 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     return mc_stress
 
 
+def calculate_mohr_coulomb_array(prin1, prin3, phi, fck):
+    """Calculation of Mohr Coulomb yield criterion for arrays of principal stresses.
+    Array version of calculate_mohr_coulomb.
+    """
+
+    prin1 = np.asarray(prin1, dtype=float)
+    prin3 = np.asarray(prin3, dtype=float)
+
+    coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
+
+    mc_stress = (prin1 - prin3) + (prin1 + prin3) * np.sin(phi) - 2.0 * coh * np.cos(phi)
+
+    return np.where(mc_stress < 0.0, 0.0, mc_stress)
+
+
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    displacements = np.asarray(displacements, dtype=float).reshape(-1, 3)
+    return np.linalg.norm(displacements, axis=1).tolist()
+
+
+def get_min_max(values):
+    """Returns the minimum and the maximum of a list of values.
+    For a list of vectors the minimum and maximum of every component is returned.
+    """
+    values = np.asarray(values, dtype=float)
+    return values.min(axis=0).tolist(), values.max(axis=0).tolist()
 
 
 ##  @}
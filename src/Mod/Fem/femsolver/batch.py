@@ -0,0 +1,310 @@
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Run one analysis for many parameter variants in parallel.
+
+A parameter table is a list of variants, every variant is a dictionary which
+maps "Object.Property" to the value the property gets for this variant.
+Object is the Name or the Label of a document object. For dictionary
+properties a single key can be set by "Object.Property.Key", for example
+"MechanicalMaterial.Material.YoungsModulus". The table can be read from a csv
+file with one column per parameter by :func:`read_parameter_table`.
+
+The solver input of every variant is written into its own working directory
+one after the other, the document is restored after each variant. The solver
+processes run on a bounded pool, their results are summarized directly from
+the result files without creating any result objects. Thus the runner works
+headless in FreeCADCmd too::
+
+    import FreeCAD
+    from femsolver import batch
+
+    doc = FreeCAD.openDocument("/tmp/box_static.FCStd")
+    table = batch.read_parameter_table("/tmp/variants.csv")
+    rows = batch.run_batch(doc.Analysis, table, "/tmp/box_study")
+    batch.write_table(rows, "/tmp/box_study/summary.csv")
+
+Only parameters which do not change the mesh are supported, a geometry change
+does not trigger remeshing. ATM only the CalculiX solvers are supported.
+"""
+
+__title__ = "FreeCAD FEM solver batch run"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import concurrent.futures
+import contextlib
+import csv
+import os
+import subprocess
+import tempfile
+
+import FreeCAD
+
+from . import settings
+from femtools import femutils
+from femtools import membertools
+
+
+CALCULIX_SOLVERS = ("Fem::SolverCcxTools", "Fem::SolverCalculix", "Fem::SolverCalculiX")
+
+
+def read_parameter_table(filename):
+    """read a parameter table from a csv file
+
+    The header line holds the "Object.Property" names. Values which can be
+    converted to an int are returned as int, integer properties do not accept
+    a float. Other values which can be converted to a float are returned as
+    float, all others as str, thus quantities can be given with their unit,
+    e.g. "20 kN". Empty cells are skipped, the property keeps its value of the
+    document.
+    """
+    table = []
+    with open(filename, newline="") as f:
+        for row in csv.DictReader(f):
+            variant = {}
+            for key, value in row.items():
+                if value == "":
+                    continue
+                for convert in (int, float, str):
+                    try:
+                        variant[key] = convert(value)
+                        break
+                    except ValueError:
+                        pass
+            table.append(variant)
+    return table
+
+
+def write_table(rows, filename):
+    """write the result rows of run_batch into a csv file"""
+    fieldnames = []
+    for row in rows:
+        fieldnames.extend(key for key in row if key not in fieldnames)
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch(
+    analysis, parameters, working_dir=None, max_workers=None, progress=None, run_solver=True
+):
+    """run analysis once for every variant of the parameter table
+
+    :param analysis: the analysis, its solver must be a CalculiX solver
+    :param parameters: list of variants, see module documentation
+    :param working_dir: directory in which a sub directory is created per
+        variant, if None a temporary directory is used
+    :param max_workers: number of solver processes running at the same time,
+        defaults to the number of cores. The cores are divided between the
+        processes by OMP_NUM_THREADS.
+    :param progress: callable progress(done, total, row) called in the
+        calling thread after each finished variant, defaults to a console message
+    :param run_solver: if False only the solver input files are written
+
+    Returns one row per variant in the order of the parameter table. A row
+    holds the parameters, the Directory, the Status ("written", "done" or
+    "failed") and for finished mechanical analyses the maxima over all result
+    sets MaxDisplacement (mm) and MaxVonMisesStress (MPa).
+    """
+    solver = _get_solver(analysis)
+    mesh_obj, message = membertools.get_mesh_to_solve(analysis)
+    if mesh_obj is None:
+        raise ValueError(message)
+    binary = None
+    if run_solver:
+        binary = settings.get_binary("Calculix")
+        if binary is None:
+            raise ValueError("The CalculiX binary has not been found.")
+    if working_dir is None:
+        working_dir = tempfile.mkdtemp(prefix="fem_batch_")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if progress is None:
+        progress = _print_progress
+    env = dict(os.environ)
+    env["OMP_NUM_THREADS"] = str(max(1, (os.cpu_count() or 1) // max_workers))
+
+    rows = []
+    futures = {}
+    done = 0
+
+    def report(row):
+        nonlocal done
+        done += 1
+        progress(done, len(parameters), row)
+
+    def collect(future):
+        row = futures.pop(future)
+        try:
+            row.update(future.result())
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"{row['Directory']}: {e}\n")
+            row["Status"] = "failed"
+        report(row)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        # the document is not thread safe, the input files are written here
+        # while the solver processes of the finished variants run already
+        for index, variant in enumerate(parameters):
+            directory = os.path.join(working_dir, f"variant_{index:03d}")
+            os.makedirs(directory, exist_ok=True)
+            row = dict(variant)
+            row["Directory"] = directory
+            rows.append(row)
+            try:
+                with _applied_parameters(analysis.Document, variant):
+                    input_file = _write_calculix_input(analysis, solver, mesh_obj, directory)
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"{directory}: {e}\n")
+                input_file = ""
+            if input_file and run_solver:
+                futures[executor.submit(_run_calculix, binary, input_file, env)] = row
+            else:
+                row["Status"] = "written" if input_file else "failed"
+                report(row)
+            # report the variants finished meanwhile without waiting for the others
+            finished, _ = concurrent.futures.wait(futures, timeout=0)
+            for future in finished:
+                collect(future)
+
+        for future in concurrent.futures.as_completed(list(futures)):
+            collect(future)
+    return rows
+
+
+def summarize_frd(frd_file):
+    """maxima of the displacement and the von Mises stress over all result sets"""
+    import numpy as np
+    from feminout.importCcxFrdResults import FrdReader
+    from femresult.resulttools import calculate_von_mises_array
+
+    summary = {}
+    with FrdReader(frd_file) as reader:
+        for result_set in reader.iter_results():
+            if "disp" in result_set:
+                values = np.linalg.norm(result_set["disp"][1], axis=1).max(initial=0.0)
+                summary["MaxDisplacement"] = max(summary.get("MaxDisplacement", 0.0), values)
+            if "stress" in result_set:
+                values = calculate_von_mises_array(result_set["stress"][1]).max(initial=0.0)
+                summary["MaxVonMisesStress"] = max(summary.get("MaxVonMisesStress", 0.0), values)
+    return {key: float(value) for key, value in summary.items()}
+
+
+def _get_solver(analysis):
+    for m in analysis.Group:
+        if femutils.is_derived_from(m, "Fem::FemSolverObjectPython"):
+            if m.Proxy.Type not in CALCULIX_SOLVERS:
+                raise ValueError(f"Solver {m.Label} is not supported by the batch run.")
+            return m
+    raise ValueError("The analysis has no solver.")
+
+
+def _get_object(doc, name):
+    obj = doc.getObject(name)
+    if obj is None:
+        objs = doc.getObjectsByLabel(name)
+        if len(objs) != 1:
+            raise ValueError(f"Object {name} not found or not unique.")
+        obj = objs[0]
+    return obj
+
+
+@contextlib.contextmanager
+def _applied_parameters(doc, variant):
+    """set the parameters of a variant and restore the old values afterwards"""
+    restore = []
+    try:
+        for key, value in variant.items():
+            name, prop, *sub_key = key.split(".", 2)
+            obj = _get_object(doc, name)
+            old_value = getattr(obj, prop)
+            restore.append((obj, prop, old_value))
+            if sub_key:
+                new_value = dict(old_value)
+                new_value[sub_key[0]] = str(value)
+                value = new_value
+            setattr(obj, prop, value)
+        doc.recompute()
+        yield
+    finally:
+        for obj, prop, old_value in reversed(restore):
+            setattr(obj, prop, old_value)
+        doc.recompute()
+
+
+def _write_calculix_input(analysis, solver, mesh_obj, directory):
+    from femmesh import meshsetsgetter
+    from femtools.checksanalysis import check_member_for_solver_calculix
+    from .calculix import writer
+
+    message = check_member_for_solver_calculix(
+        analysis, solver, mesh_obj, membertools.AnalysisMember(analysis)
+    )
+    if message:
+        FreeCAD.Console.PrintError(f"{directory}: CalculiX can not be started...\n{message}\n")
+        return ""
+    meshdatagetter = meshsetsgetter.MeshSetsGetter(
+        analysis, solver, mesh_obj, membertools.AnalysisMember(analysis)
+    )
+    meshdatagetter.get_mesh_sets()
+    w = writer.FemInputWriterCcx(
+        analysis,
+        solver,
+        mesh_obj,
+        meshdatagetter.member,
+        directory,
+        meshdatagetter.mat_geo_sets,
+    )
+    return w.write_solver_input()
+
+
+def _run_calculix(binary, input_file, env):
+    """run in a worker thread, must not touch any document object"""
+    directory = os.path.dirname(input_file)
+    base_name = os.path.splitext(input_file)[0]
+    with open(base_name + ".log", "w") as log:
+        process = subprocess.run(
+            [binary, "-i", os.path.basename(base_name)],
+            cwd=directory,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    frd_file = base_name + ".frd"
+    if process.returncode != 0 or not os.path.isfile(frd_file):
+        return {"Status": "failed"}
+    result = {"Status": "done"}
+    result.update(summarize_frd(frd_file))
+    return result
+
+
+def _print_progress(done, total, row):
+    FreeCAD.Console.PrintMessage(
+        "FEM batch run {}/{}: {} {}\n".format(done, total, row["Status"], row["Directory"])
+    )
+
+
+##  @}
@@ -0,0 +1,334 @@
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM solver Elmer mesh writer"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+"""Write the mesh of a FemMeshObject as ElmerSolver mesh files.
+
+The files mesh.header, mesh.nodes, mesh.elements, mesh.boundary and mesh.names
+are written directly from the existing FemMesh, the bodies and boundaries are
+taken from the sub shapes of the mesh shape the group names refer to (Solid1,
+Face2, ...). Thus the mesh is not regrouped with Gmsh and not converted with
+ElmerGrid.
+"""
+
+import os
+
+import numpy as np
+
+from FreeCAD import Console
+
+from femmesh import meshtools
+
+
+# Elmer element type codes by mesh dimension and node count
+_ELMER_TYPES = {
+    1: {2: 202, 3: 203},
+    2: {3: 303, 6: 306, 4: 404, 8: 408},
+    3: {4: 504, 10: 510, 8: 808, 20: 820},
+}
+
+# node order of the SMESH volumes in Elmer, the volumes are reversed to get a positive volume
+# the order is the one of the CalculiX writer, besides the hexa20 edge nodes:
+# Elmer has the vertical edges before the top edges
+_ELMER_NODE_ORDER = {
+    504: [1, 0, 2, 3],
+    510: [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    808: [5, 6, 7, 4, 1, 2, 3, 0],
+    820: [5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 17, 18, 19, 16, 9, 10, 11, 8],
+}
+
+# local nodes of the boundary elements of the SMESH elements by mesh dimension and node count,
+# the faces of the volumes and the edges of the faces, corner nodes first
+_BOUNDARY_NODES = {
+    3: {
+        4: [(0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)],
+        10: [
+            (0, 1, 2, 4, 5, 6),
+            (0, 1, 3, 4, 8, 7),
+            (0, 2, 3, 6, 9, 7),
+            (1, 2, 3, 5, 9, 8),
+        ],
+        8: [
+            (0, 1, 2, 3),
+            (4, 5, 6, 7),
+            (0, 1, 5, 4),
+            (1, 2, 6, 5),
+            (2, 3, 7, 6),
+            (3, 0, 4, 7),
+        ],
+        20: [
+            (0, 1, 2, 3, 8, 9, 10, 11),
+            (4, 5, 6, 7, 12, 13, 14, 15),
+            (0, 1, 5, 4, 8, 17, 12, 16),
+            (1, 2, 6, 5, 9, 18, 13, 17),
+            (2, 3, 7, 6, 10, 19, 14, 18),
+            (3, 0, 4, 7, 11, 16, 15, 19),
+        ],
+    },
+    2: {
+        3: [(0, 1), (1, 2), (2, 0)],
+        6: [(0, 1, 3), (1, 2, 4), (2, 0, 5)],
+        4: [(0, 1), (1, 2), (2, 3), (3, 0)],
+        8: [(0, 1, 4), (1, 2, 5), (2, 3, 6), (3, 0, 7)],
+    },
+}
+
+# binary search masks of the boundary elements, see meshtools.get_elements_from_binary_search
+_BOUNDARY_MASKS = {
+    dimension: {
+        node_count: {
+            sum(1 << i for i in local_nodes): number
+            for number, local_nodes in enumerate(boundaries)
+        }
+        for node_count, boundaries in tables.items()
+    }
+    for dimension, tables in _BOUNDARY_NODES.items()
+}
+
+
+class UnsupportedMeshError(Exception):
+    """the mesh can not be written directly, the caller needs to regroup it"""
+
+
+def write_mesh(mesh_obj, bodies, boundaries, directory):
+    """write the mesh files of mesh_obj into directory
+
+    bodies and boundaries are the names of the sub shapes of the mesh shape
+    (Solid1, Face1, Edge1, ...) in the order of the Body and Boundary Condition
+    sections.
+    Raises UnsupportedMeshError if the mesh has element types Elmer mesh files
+    are not written for or if a group has no mesh elements.
+    """
+    writer = ElmerMeshWriter(mesh_obj, list(bodies), list(boundaries))
+    writer.write(directory)
+
+
+class ElmerMeshWriter:
+    """collects the body and boundary elements of a mesh and writes them in the
+    Elmer mesh format with bulk array output
+
+    The boundary elements are the faces (edges of a face mesh) of the body elements
+    which have all their nodes on the boundary shape. Thus the mesh does not need
+    to have face elements and the parents of the boundary elements are known.
+    """
+
+    def __init__(self, mesh_obj, bodies, boundaries):
+        self.femmesh = mesh_obj.FemMesh
+        if not mesh_obj.Shape:
+            raise UnsupportedMeshError("The mesh has no shape to get the groups from")
+        self.shape = mesh_obj.Shape.Shape
+        self.bodies = bodies
+        self.boundaries = boundaries
+        if self.femmesh.VolumeCount:
+            self.dimension = 3
+        elif self.femmesh.FaceCount:
+            self.dimension = 2
+        else:
+            self.dimension = 1
+
+    def write(self, directory):
+        if not self.bodies:
+            raise UnsupportedMeshError("There are no bodies to write")
+        body_elements = self.get_body_elements()
+        boundary_elements = self.get_boundary_elements(body_elements)
+
+        # node ids of Elmer are contiguous, nodes not used by any group are dropped
+        used_nodes = np.unique(
+            np.concatenate([nodes.ravel() for _, _, nodes in body_elements + boundary_elements])
+        )
+        all_nodes = self.femmesh.Nodes
+        coords = np.array([tuple(all_nodes[n]) for n in used_nodes.tolist()], dtype=float)
+
+        type_counts = {}
+        for elmer_type, _, nodes in body_elements + boundary_elements:
+            type_counts[elmer_type] = type_counts.get(elmer_type, 0) + len(nodes)
+        element_count = sum(len(nodes) for _, _, nodes in body_elements)
+        boundary_count = sum(len(nodes) for _, _, nodes in boundary_elements)
+
+        with open(os.path.join(directory, "mesh.header"), "w") as f:
+            f.write(f"{len(used_nodes)} {element_count} {boundary_count}\n")
+            f.write(f"{len(type_counts)}\n")
+            for elmer_type in sorted(type_counts):
+                f.write(f"{elmer_type} {type_counts[elmer_type]}\n")
+
+        with open(os.path.join(directory, "mesh.nodes"), "wb") as f:
+            ids = np.arange(1, len(used_nodes) + 1)
+            np.savetxt(f, np.column_stack((ids, coords)), fmt="%d -1 %.16g %.16g %.16g")
+
+        with open(os.path.join(directory, "mesh.elements"), "wb") as f:
+            first_id = 1
+            for elmer_type, body, nodes in body_elements:
+                if elmer_type in _ELMER_NODE_ORDER:
+                    nodes = nodes[:, _ELMER_NODE_ORDER[elmer_type]]
+                table = np.column_stack(
+                    (
+                        np.arange(first_id, first_id + len(nodes)),
+                        np.full(len(nodes), body),
+                        np.full(len(nodes), elmer_type),
+                        np.searchsorted(used_nodes, nodes) + 1,
+                    )
+                )
+                np.savetxt(f, table, fmt="%d")
+                first_id += len(nodes)
+
+        with open(os.path.join(directory, "mesh.boundary"), "wb") as f:
+            first_id = 1
+            for elmer_type, (boundary, parents), nodes in boundary_elements:
+                table = np.column_stack(
+                    (
+                        np.arange(first_id, first_id + len(nodes)),
+                        np.full(len(nodes), boundary),
+                        parents,
+                        np.full(len(nodes), elmer_type),
+                        np.searchsorted(used_nodes, nodes) + 1,
+                    )
+                )
+                np.savetxt(f, table, fmt="%d")
+                first_id += len(nodes)
+
+        with open(os.path.join(directory, "mesh.names"), "w") as f:
+            f.write("! ----- names for bodies -----\n")
+            for i, name in enumerate(self.bodies):
+                f.write(f"$ {name} = {i + 1}\n")
+            f.write("! ----- names for boundaries -----\n")
+            for i, name in enumerate(self.boundaries):
+                f.write(f"$ {name} = {i + 1}\n")
+
+        Console.PrintLog(
+            "Elmer mesh written: {} nodes, {} elements, {} boundary elements\n".format(
+                len(used_nodes), element_count, boundary_count
+            )
+        )
+
+    def get_body_elements(self):
+        """list of (elmer type, body id, SMESH node array) per body and element type"""
+        if self.dimension == 3:
+            # the volumes of a solid are the volumes with all nodes in the solid
+            volumes = meshtools.get_femelement_volumes_table(self.femmesh)
+            index = meshtools.FemNodesElementIndex(volumes)
+            full_patterns = np.left_shift(1, index.element_node_counts) - 1
+            assigned = np.zeros(len(index.element_ids), dtype=bool)
+            element_groups = []
+            for name in self.bodies:
+                solid = self._get_sub_shape(name, "Solid")
+                patterns = index.get_bit_patterns(self.femmesh.getNodesBySolid(solid))
+                inside = (patterns == full_patterns) & ~assigned
+                assigned |= inside
+                element_groups.append(index.element_ids[inside].tolist())
+        else:
+            volumes = {}
+            element_groups = []
+            for name in self.bodies:
+                if self.dimension == 2:
+                    sub_shape = self._get_sub_shape(name, "Face")
+                    element_groups.append(self.femmesh.getFacesByFace(sub_shape))
+                else:
+                    sub_shape = self._get_sub_shape(name, "Edge")
+                    element_groups.append(self.femmesh.getEdgesByEdge(sub_shape))
+
+        body_elements = []
+        for body, (name, elements) in enumerate(zip(self.bodies, element_groups), 1):
+            if not elements:
+                raise UnsupportedMeshError(f"The mesh has no elements in {name}")
+            by_type = {}
+            for ele in elements:
+                nodes = volumes[ele] if ele in volumes else self.femmesh.getElementNodes(ele)
+                elmer_type = _ELMER_TYPES[self.dimension].get(len(nodes))
+                if elmer_type is None:
+                    raise UnsupportedMeshError(
+                        f"{len(nodes)} node elements are not supported in {name}"
+                    )
+                by_type.setdefault(elmer_type, []).append(nodes)
+            for elmer_type, nodes in by_type.items():
+                body_elements.append((elmer_type, body, np.array(nodes, dtype=np.int64)))
+        return body_elements
+
+    def get_boundary_elements(self, body_elements):
+        """list of (elmer type, (boundary id, parents), SMESH node array) per boundary
+        and element type, parents are the numbers of the elements in mesh.elements
+        """
+        if not self.boundaries:
+            return []
+        if self.dimension == 1:
+            raise UnsupportedMeshError("Boundaries of edge meshes are not supported")
+
+        # the index has the body elements in the order of mesh.elements
+        table = {}
+        for _, _, nodes in body_elements:
+            for element_nodes in nodes.tolist():
+                table[len(table) + 1] = element_nodes
+        index = meshtools.FemNodesElementIndex(table)
+        masks = _BOUNDARY_MASKS[self.dimension]
+        local_nodes = _BOUNDARY_NODES[self.dimension]
+
+        boundary_elements = []
+        for boundary, name in enumerate(self.boundaries, 1):
+            if self.dimension == 3:
+                sub_shape = self._get_sub_shape(name, "Face")
+                node_set = self.femmesh.getNodesByFace(sub_shape)
+            else:
+                sub_shape = self._get_sub_shape(name, "Edge")
+                node_set = self.femmesh.getNodesByEdge(sub_shape)
+            # an element face shared by two body elements is one boundary element
+            found = {}
+            for ele, number in index.binary_search(node_set, masks):
+                element_nodes = table[ele]
+                nodes = [element_nodes[i] for i in local_nodes[len(element_nodes)][number]]
+                key = tuple(sorted(nodes))
+                if key in found:
+                    found[key][1].append(ele)
+                else:
+                    found[key] = (nodes, [ele])
+            if not found:
+                raise UnsupportedMeshError(f"The mesh has no elements on {name}")
+            by_type = {}
+            for nodes, parents in found.values():
+                elmer_type = _ELMER_TYPES[self.dimension - 1][len(nodes)]
+                nodes_list, parents_list = by_type.setdefault(elmer_type, ([], []))
+                nodes_list.append(nodes)
+                parents_list.append((parents + [0])[:2])
+            for elmer_type, (nodes, parents) in by_type.items():
+                boundary_elements.append(
+                    (
+                        elmer_type,
+                        (boundary, np.array(parents, dtype=np.int64)),
+                        np.array(nodes, dtype=np.int64),
+                    )
+                )
+        return boundary_elements
+
+    def _get_sub_shape(self, name, shape_type):
+        if not name.startswith(shape_type):
+            raise UnsupportedMeshError(f"{name} is not a {shape_type} of the mesh shape")
+        try:
+            return self.shape.getElement(name)
+        except Exception:
+            raise UnsupportedMeshError(f"{name} is not a sub shape of the mesh shape")
+
+
+##  @}
@@ -41,6 +41,7 @@ from FreeCAD import Units
 from FreeCAD import ParamGet
 
 import Fem
+from . import meshwriter
 from . import sifio
 from . import solver as solverClass
 from .. import settings
@@ -217,10 +218,37 @@ class Writer:
 
     def _writeMesh(self):
         mesh = self.getSingleMember("Fem::FemMeshObject")
+        bodies = list(self._builder.getBodyNames())
+        boundaries = list(self._builder.getBoundaryNames())
+        try:
+            meshwriter.write_mesh(mesh, bodies, boundaries, self.directory)
+        except meshwriter.UnsupportedMeshError as e:
+            # regroup the mesh with Gmsh and convert it with ElmerGrid
+            Console.PrintLog(f"Elmer mesh files can not be written directly: {e}\n")
+            self._writeMeshWithElmerGrid(mesh, bodies + boundaries)
+            return
+        if self.testmode:
+            Console.PrintMessage(
+                "Solver Elmer testmode, ElmerGrid will not be used. It might not be installed.\n"
+            )
+            return
+        num_cores = settings.get_cores("ElmerGrid")
+        if num_cores > 1:
+            # the mesh only needs to be split into the number of used cores
+            binary = settings.get_binary("ElmerGrid")
+            if binary is None:
+                raise WriteError("Could not find ElmerGrid binary.")
+            args = [binary, _ELMERGRID_OFORMAT, _ELMERGRID_OFORMAT, self.directory]
+            args.extend(["-partdual", "-metiskway", str(num_cores)])
+            if system() == "Windows":
+                subprocess.call(
+                    args, stdout=subprocess.DEVNULL, startupinfo=femutils.startProgramInfo("hide")
+                )
+            else:
+                subprocess.call(args, stdout=subprocess.DEVNULL)
+
+    def _writeMeshWithElmerGrid(self, mesh, groups):
         unvPath = os.path.join(self.directory, "mesh.unv")
-        groups = []
-        groups.extend(self._builder.getBodyNames())
-        groups.extend(self._builder.getBoundaryNames())
         self._exportToUnv(groups, mesh, unvPath)
         if self.testmode:
             Console.PrintMessage(
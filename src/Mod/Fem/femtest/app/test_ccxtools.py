@@ -120,6 +120,63 @@ class TestCcxTools(unittest.TestCase):
             res_obj_name=res_obj_name,
         )
 
+    # ********************************************************************************************
+    def test_box_static_batch(self):
+        from femexamples.boxanalysis_static import setup
+        from femsolver import batch
+
+        setup(self.document, "ccxtools")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "box_static_batch")
+        parameters = [
+            {"FemConstraintForce.Force": "20000.0 N"},
+            {"FemConstraintForce.Force": "10000.0 N"},
+        ]
+        rows = batch.run_batch(
+            self.document.Analysis,
+            parameters,
+            analysis_dir,
+            progress=lambda *args: None,
+            run_solver=False,
+        )
+        self.assertEqual([row["Status"] for row in rows], ["written", "written"])
+        # the document is restored after the input is written, 40000 N is the example's force
+        self.assertEqual(self.document.FemConstraintForce.Force.getValueAs("N"), 40000.0)
+
+        # the force is divided over the nodes of the face
+        with open(join(rows[0]["Directory"], self.mesh_name + ".inp")) as f:
+            self.assertIn("19,3,-416.6666666667", f.read())
+        with open(join(rows[1]["Directory"], self.mesh_name + ".inp")) as f:
+            self.assertIn("19,3,-208.3333333333", f.read())
+
+    # ********************************************************************************************
+    def test_box_static_batch_table(self):
+        from femexamples.boxanalysis_static import setup
+        from femsolver import batch
+
+        setup(self.document, "ccxtools")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "box_static_batch_table")
+        table_file = join(analysis_dir, "variants.csv")
+        parameters = [
+            {"FemConstraintForce.Force": "20000.0 N", "CalculiXCcxTools.EigenmodesCount": 5},
+            {"FemConstraintForce.Force": "40000.0 N", "CalculiXCcxTools.EigenmodesCount": 7},
+            {"FemConstraintForce.Force": "20000.0 N", "NoSuchObject.Value": 1.5},
+        ]
+        batch.write_table(parameters, table_file)
+        table = batch.read_parameter_table(table_file)
+        self.assertEqual(table, parameters)
+        self.assertIsInstance(table[0]["CalculiXCcxTools.EigenmodesCount"], int)
+
+        rows = batch.run_batch(
+            self.document.Analysis,
+            table,
+            analysis_dir,
+            progress=lambda *args: None,
+            run_solver=False,
+        )
+        # a variant which can not be applied fails without stopping the others
+        self.assertEqual([row["Status"] for row in rows], ["written", "written", "failed"])
+        self.assertEqual(self.document.CalculiXCcxTools.EigenmodesCount, 10)
+
     # ********************************************************************************************
     def test_ccx_buckling_flexuralbuckling(self):
         from femexamples.ccx_buckling_flexuralbuckling import setup
@@ -266,6 +323,25 @@ class TestCcxTools(unittest.TestCase):
         setup(self.document, "ccxtools")
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_constraint_tie_mesh_sets_threads(self):
+        # the constraint mesh sets looked up on a worker pool give the same inp file
+        from femexamples.constraint_tie import setup
+
+        setup(self.document, "ccxtools")
+        param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        param.SetInt("MeshSetsNumThreads", 4)
+        try:
+            self.input_file_writing_test(
+                "constraint_tie",
+                analysis_dir=testtools.get_fem_test_tmp_dir(
+                    self.pre_dir_name + "constraint_tie_mesh_sets_threads"
+                ),
+                test_end=True,
+            )
+        finally:
+            param.RemInt("MeshSetsNumThreads")
+
     # ********************************************************************************************
     def test_constraint_transform_beam_hinged(self):
         from femexamples.constraint_transform_beam_hinged import setup
@@ -129,6 +129,29 @@ class TestMeshCommon(unittest.TestCase):
             edge_data, expected_edges, "Edges of Python created seg3 element are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_mesh_bulk_python(self):
+        from feminout.importToolsFem import make_femmesh_from_arrays
+
+        mesh = Fem.FemMesh()
+        mesh.addNodes([0, 0, 0, 2, 0, 0, 4, 0, 0, 2, 2, 0], [1, 2, 3, 4])
+        mesh.addElements("Edge", 2, [1, 2, 2, 3], [1, 2])
+        mesh.addElements("Face", 3, [1, 2, 4, 2, 3, 4], [3, 4])
+        self.assertEqual(mesh.Nodes[4], FreeCAD.Vector(2.0, 2.0, 0.0))
+        self.assertEqual(mesh.Edges, (1, 2))
+        self.assertEqual(mesh.Faces, (3, 4))
+        self.assertEqual(mesh.getElementNodes(4), (2, 3, 4))
+        self.assertRaises(Exception, mesh.addElements, "Face", 3, [1, 2], [5])
+        self.assertRaises(Exception, mesh.addElements, "Face", 3, [1, 2, 9], [5])
+
+        arrays_mesh = make_femmesh_from_arrays(
+            ([1, 2, 3, 4], [[0, 0, 0], [2, 0, 0], [4, 0, 0], [2, 2, 0]]),
+            {"Seg2Elem": ([1, 2], [[1, 2], [2, 3]]), "Tria3Elem": ([3, 4], [[1, 2, 4], [2, 3, 4]])},
+        )
+        self.assertEqual(arrays_mesh.Nodes, mesh.Nodes)
+        self.assertEqual(arrays_mesh.Faces, mesh.Faces)
+        self.assertEqual(arrays_mesh.getElementNodes(3), (1, 2, 4))
+
     # ********************************************************************************************
     def test_unv_save_load(self):
         tetra10 = Fem.FemMesh()
@@ -192,6 +215,70 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_femnodes_ele_index(self):
+        from femmesh import meshtools
+
+        # two hexa8 elements sharing the face with the nodes 5, 6, 7, 8
+        # and a tetra4 element on the face with the nodes 9, 10, 11, 12
+        femelement_table = {
+            1: (1, 2, 3, 4, 5, 6, 7, 8),
+            2: (5, 6, 7, 8, 9, 10, 11, 12),
+            3: (9, 10, 11, 13),
+        }
+        femnodes_mesh = {n: None for n in range(1, 14)}
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(femnodes_mesh, femelement_table)
+        femnodes_ele_index = meshtools.get_femnodes_ele_index(None, femelement_table)
+        self.assertEqual(len(femnodes_ele_index), 13)
+
+        for node_set in ([5, 6, 7, 8], [9, 10, 11, 12, 13], list(range(1, 13)), []):
+            for masks, face_numbers in (
+                (meshtools.CCX_VOLUME_FACE_MASKS, True),
+                (meshtools.CCX_VOLUME_ELEMENT_MASKS, False),
+            ):
+                expected = meshtools.get_ccxelements_by_femnodes(
+                    femelement_table, femnodes_ele_table, node_set, masks, face_numbers
+                )
+                found = meshtools.get_ccxelements_by_femnodes(
+                    femelement_table, femnodes_ele_index, node_set, masks, face_numbers
+                )
+                self.assertEqual(expected, found, f"Unexpected elements for nodes {node_set}")
+
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table, femnodes_ele_index, list(range(1, 13))
+            ),
+            [1, 2],
+        )
+
+    # ********************************************************************************************
+    def test_femnodes_ele_index_of_mesh_object(self):
+        import ObjectsFem
+        from femmesh import meshtools
+
+        def make_femmesh(node_count):
+            femmesh = Fem.FemMesh()
+            for node_id in range(1, node_count + 1):
+                femmesh.addNode(float(node_id), 0.0, float(node_id % 2), node_id)
+            femmesh.addVolume(list(range(1, node_count + 1)), 1)
+            return femmesh
+
+        mesh_obj = ObjectsFem.makeMeshGmsh(self.document, "Mesh")
+        mesh_obj.FemMesh = make_femmesh(4)
+        femelement_table = meshtools.get_femelement_table(mesh_obj.FemMesh)
+        index = meshtools.get_femnodes_ele_index(mesh_obj.FemMesh, femelement_table, mesh_obj)
+        self.assertEqual(len(index), 4)
+        # the index is kept on the proxy of the mesh object
+        self.assertIs(
+            meshtools.get_femnodes_ele_index(mesh_obj.FemMesh, femelement_table, mesh_obj), index
+        )
+
+        # and built again for a new mesh
+        mesh_obj.FemMesh = make_femmesh(10)
+        femelement_table = meshtools.get_femelement_table(mesh_obj.FemMesh)
+        index = meshtools.get_femnodes_ele_index(mesh_obj.FemMesh, femelement_table, mesh_obj)
+        self.assertEqual(len(index), 10)
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -486,16 +573,9 @@ class TestMeshGroups(unittest.TestCase):
         correct.
         """
 
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -541,16 +621,9 @@ class TestMeshGroups(unittest.TestCase):
         Adds a number of groups to FemMesh and deletes them
         afterwards. Checks whether GroupCount is OK
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -576,16 +649,9 @@ class TestMeshGroups(unittest.TestCase):
         Add a node group, add elements to it. Verify that elements added
         and elements in getGroupElements are the same.
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
-
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        from femexamples.meshes import load_mesh
+
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
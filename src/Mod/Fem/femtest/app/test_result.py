@@ -191,3 +191,108 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_stress_array_versions(self):
+        # the array versions return the same values as the single stress tensor versions
+        # on a larger stress field the time of both versions is printed for comparison
+        from time import process_time
+
+        import numpy as np
+
+        from femresult import resulttools as rt
+
+        rng = np.random.default_rng(42)
+        stresses = rng.uniform(-500.0, 500.0, (2000, 6))
+        stresses[0] = self.get_stress_values()
+        stresses[1] = 0.0
+        stresses[2:100, 3:] = 0.0
+        # integer stresses hit the special cases of the reinforcement ratios
+        stresses[100:1000] = rng.integers(-10, 11, (900, 6))
+
+        start = process_time()
+        vm = [rt.calculate_von_mises(st) for st in stresses]
+        std = [rt.calculate_principal_stress_std(st) for st in stresses]
+        rc = [rt.calculate_principal_stress_reinforced(st) for st in stresses]
+        rho = [rt.calculate_rho(st, 500) for st in stresses]
+        time_loop = process_time() - start
+
+        start = process_time()
+        vm_array = rt.calculate_von_mises_array(stresses)
+        std_array = rt.calculate_principal_stress_std_array(stresses)
+        rc_array, rc_vectors = rt.calculate_principal_stress_reinforced_array(stresses)
+        rho_array = rt.calculate_rho_array(stresses, 500)
+        time_array = process_time() - start
+        fcc_print(
+            "Stresses of {} nodes, per node: {:.3f} s, array: {:.3f} s".format(
+                len(stresses), time_loop, time_array
+            )
+        )
+
+        self.assertTrue(np.allclose(vm, vm_array), "Von Mises stresses differ.")
+        self.assertTrue(np.allclose(std, std_array), "Principal stresses differ.")
+        self.assertTrue(
+            np.allclose([prin[:4] for prin in rc], rc_array),
+            "Principal reinforced stresses differ.",
+        )
+        self.assertTrue(
+            np.allclose([prin[4] for prin in rc], rc_vectors),
+            "Principal reinforced stress vectors differ.",
+        )
+        self.assertTrue(np.allclose(rho, rho_array), "Reinforcement ratios differ.")
+
+        # NaN in a stress tensor gives NaN for all principal stresses of this node
+        stresses[5, 2] = float("NaN")
+        std_array = rt.calculate_principal_stress_std_array(stresses[:10])
+        self.assertTrue(np.isnan(std_array[5]).all())
+        self.assertFalse(np.isnan(std_array[4]).any())
+
+    # ********************************************************************************************
+    def test_read_frd_result_stream(self):
+        from feminout.importCcxFrdResults import FrdReader
+        from feminout.importCcxFrdResults import read_frd_result
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        frd_data = read_frd_result(frd_file)
+        self.assertEqual(len(frd_data["Nodes"]), 280)
+        self.assertEqual(len(frd_data["Tetra10Elem"]), 129)
+        self.assertEqual(len(frd_data["Results"]), 1)
+
+        with FrdReader(frd_file, steps=[0]) as reader:
+            node_numbers, node_coords = reader.mesh_data["Nodes"]
+            self.assertEqual(node_coords.shape, (280, 3))
+            result_sets = list(reader.iter_results())
+            self.assertEqual(len(result_sets), 1)
+            self.assertFalse(reader.has_more_steps)
+            disp_numbers, disp_values = result_sets[0]["disp"]
+            stress_numbers, stress_values = result_sets[0]["stress"]
+            self.assertEqual(disp_values.shape, (280, 3))
+            self.assertEqual(stress_values.shape, (280, 6))
+
+        # the streamed arrays hold the same values as the dicts read at once
+        disp = frd_data["Results"][0]["disp"]
+        stress = frd_data["Results"][0]["stress"]
+        for i in (0, 139, 279):
+            node = int(disp_numbers[i])
+            self.assertEqual(tuple(disp[node]), tuple(disp_values[i]))
+            self.assertEqual(stress[int(stress_numbers[i])], tuple(stress_values[i]))
+
+        # a result set which does not exist in the frd file
+        with FrdReader(frd_file, steps=[1]) as reader:
+            self.assertEqual(list(reader.iter_results()), [])
+
+    # ********************************************************************************************
+    def test_batch_summarize_frd(self):
+        import numpy as np
+
+        from femresult import resulttools as rt
+        from feminout.importCcxFrdResults import read_frd_result
+        from femsolver.batch import summarize_frd
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        summary = summarize_frd(frd_file)
+        result_set = read_frd_result(frd_file)["Results"][0]
+        max_disp = max(v.Length for v in result_set["disp"].values())
+        max_vm = max(rt.calculate_von_mises(np.array(s)) for s in result_set["stress"].values())
+        self.assertAlmostEqual(summary["MaxDisplacement"], max_disp, places=9)
+        self.assertAlmostEqual(summary["MaxVonMisesStress"], max_vm, places=6)
@@ -26,6 +26,7 @@ __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
 import unittest
+from os.path import exists
 from os.path import join
 
 import FreeCAD
@@ -139,13 +140,86 @@ class TestSolverElmer(unittest.TestCase):
         ret = testtools.compare_files(casefile_given, casefile_totest)
         self.assertFalse(ret, f"case write file test failed.\n{ret}")
 
+        fcc_print("Test writing Elmer mesh files")
+        femmesh = self.document.Mesh.FemMesh
+        for mesh_file in ("mesh.header", "mesh.nodes", "mesh.elements", "mesh.boundary"):
+            self.assertTrue(exists(join(analysis_dir, mesh_file)), f"{mesh_file} not written.")
+        with open(join(analysis_dir, "mesh.header")) as f:
+            node_count, element_count, boundary_count = map(int, f.readline().split())
+        self.assertEqual(node_count, femmesh.NodeCount)
+        self.assertEqual(element_count, femmesh.VolumeCount)
+        self.assertGreater(boundary_count, 0)
+        with open(join(analysis_dir, "mesh.names")) as f:
+            names = f.read()
+        for name in ("Solid1", "Face1", "Face2", "Face6"):
+            self.assertIn(f"$ {name} = ", names)
+
+    # ********************************************************************************************
+    def test_box_static_0_mm_elmergrid(self):
+        # meshes with elements the Elmer mesh writer does not support are regrouped with Gmsh
+        import Fem
+        from femexamples.boxanalysis_static import setup
+
+        fcc_print("")
+        self.set_unit_schema(0)  # mm/kg/s
+        setup(self.document, "elmer")
+        # a penta6 volume, the nodes are corners of the box
+        femmesh = Fem.FemMesh()
+        for node_id, coords in enumerate(
+            ((0, 0, 0), (10, 0, 0), (0, 10, 0), (0, 0, 10), (10, 0, 10), (0, 10, 10)), 1
+        ):
+            femmesh.addNode(*coords, node_id)
+        femmesh.addVolume([1, 2, 3, 4, 5, 6], 1)
+        self.document.Mesh.FemMesh = femmesh
+
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "box_static_elmergrid")
+        machine_elmer = self.document.SolverElmer.Proxy.createMachine(
+            self.document.SolverElmer, analysis_dir, True
+        )
+        machine_elmer.target = femsolver.run.PREPARE
+        machine_elmer.start()
+        machine_elmer.join()  # wait for the machine to finish.
+
         fcc_print("Test writing GMSH geo file")
+        self.assertFalse(exists(join(analysis_dir, "mesh.header")))
         gmshgeofile_given = join(self.test_file_dir, "group_mesh.geo")
         gmshgeofile_totest = join(analysis_dir, "group_mesh.geo")
-        # fcc_print("Comparing {} to {}".format(gmshgeofile_given, gmshgeofile_totest))
         ret = testtools.compare_files(gmshgeofile_given, gmshgeofile_totest)
         self.assertFalse(ret, f"GMSH geo write file test failed.\n{ret}")
 
+    # ********************************************************************************************
+    def test_meshwriter_tetra4(self):
+        # the second tetra has its face (1, 3, 4) on Face1, the first one has no face on it
+        nodes = {
+            1: (0, 0, 0),
+            2: (10, 0, 0),
+            3: (0, 10, 0),
+            4: (0, 0, 10),
+            5: (10, 10, 10),
+        }
+        mesh_files = self.write_elmer_mesh(nodes, {1: [2, 3, 4, 5], 2: [1, 2, 3, 4]})
+        # Elmer gets the tetras with the first two nodes swapped
+        self.assertEqual(mesh_files["mesh.elements"], ["1 1 504 3 2 4 5", "2 1 504 2 1 3 4"])
+        # boundary id, parent elements, type and nodes of the boundary triangle
+        self.assertEqual(mesh_files["mesh.boundary"], ["1 1 2 0 303 1 3 4"])
+
+    # ********************************************************************************************
+    def test_meshwriter_hexa8(self):
+        nodes = {
+            1: (0, 0, 0),
+            2: (0, 10, 0),
+            3: (10, 10, 0),
+            4: (10, 0, 0),
+            5: (0, 0, 10),
+            6: (0, 10, 10),
+            7: (10, 10, 10),
+            8: (10, 0, 10),
+        }
+        mesh_files = self.write_elmer_mesh(nodes, {1: [1, 2, 3, 4, 5, 6, 7, 8]})
+        # Elmer gets the top face first, both faces start at their second node
+        self.assertEqual(mesh_files["mesh.elements"], ["1 1 808 6 7 8 5 2 3 4 1"])
+        self.assertEqual(mesh_files["mesh.boundary"], ["1 1 1 0 404 1 2 6 5"])
+
     # ********************************************************************************************
     def test_ccxcantilever_faceload_0_mm(self):
         fcc_print("")
@@ -206,3 +280,31 @@ class TestSolverElmer(unittest.TestCase):
         # fcc_print("Comparing {}  to  {}".format(inpfile_given, inpfile_totest))
         ret = testtools.compare_inp_files(inpfile_given, inpfile_totest)
         self.assertFalse(ret, f"Elmer write_inp_file for {base_name} test failed.\n{ret}")
+
+    # ********************************************************************************************
+    def write_elmer_mesh(self, nodes, volumes):
+        # write the volumes in the box of 10 mm with the body Solid1 and the boundary Face1
+        import Fem
+        import ObjectsFem
+        from femsolver.elmer import meshwriter
+
+        box = self.document.addObject("Part::Box", "Box")
+        self.document.recompute()
+        femmesh = Fem.FemMesh()
+        for node_id, coords in nodes.items():
+            femmesh.addNode(*coords, node_id)
+        for volume_id, volume_nodes in volumes.items():
+            femmesh.addVolume(volume_nodes, volume_id)
+        mesh_obj = ObjectsFem.makeMeshGmsh(self.document, "Mesh")
+        mesh_obj.Shape = box
+        mesh_obj.FemMesh = femmesh
+
+        working_dir = testtools.get_fem_test_tmp_dir(
+            self.pre_dir_name + "meshwriter_" + str(len(volumes[1]))
+        )
+        meshwriter.write_mesh(mesh_obj, ["Solid1"], ["Face1"], working_dir)
+        mesh_files = {}
+        for name in ("mesh.elements", "mesh.boundary"):
+            with open(join(working_dir, name)) as f:
+                mesh_files[name] = f.read().splitlines()
+        return mesh_files
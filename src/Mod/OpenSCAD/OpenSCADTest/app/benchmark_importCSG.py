@@ -0,0 +1,57 @@
+#***************************************************************************
+#*                                                                         *
+#*   This program is free software; you can redistribute it and/or modify  *
+#*   it under the terms of the GNU Lesser General Public License (LGPL)    *
+#*   as published by the Free Software Foundation; either version 2 of     *
+#*   the License, or (at your option) any later version.                   *
+#*   for detail see the LICENSE text file.                                 *
+#*                                                                         *
+#*   This program is distributed in the hope that it will be useful,       *
+#*   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+#*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+#*   GNU Library General Public License for more details.                  *
+#*                                                                         *
+#*   You should have received a copy of the GNU Library General Public     *
+#*   License along with this program; if not, write to the Free Software   *
+#*   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+#*   USA                                                                   *
+#*                                                                         *
+#***************************************************************************
+
+"""
+Benchmark of the CSG importer over the files in OpenSCADTest/data. Run it with FreeCADCmd:
+
+    FreeCADCmd -c "import OpenSCADTest.app.benchmark_importCSG as b; b.run()"
+"""
+
+import glob
+import os
+import time
+
+import FreeCAD
+import importCSG
+
+
+def run(count=20):
+    """imports every .csg test file count times, into a document and as plain shapes"""
+    data = os.path.join(FreeCAD.getHomePath(), "Mod", "OpenSCAD", "OpenSCADTest", "data")
+    files = sorted(glob.glob(os.path.join(data, "*.csg")))
+
+    start = time.perf_counter()
+    importCSG.getParser()
+    print("parser tables: {:.3f}s".format(time.perf_counter() - start))
+
+    for filename in files:
+        start = time.perf_counter()
+        for i in range(count):
+            doc = importCSG.open(filename)
+            FreeCAD.closeDocument(doc.Name)
+        documents = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(count):
+            importCSG.readShapes(filename)
+        shapes = time.perf_counter() - start
+
+        print("{}: {:.1f}ms per document, {:.1f}ms per shape import".format(
+            os.path.basename(filename), 1000 * documents / count, 1000 * shapes / count))
@@ -73,6 +73,39 @@ class TestImportCSG(unittest.TestCase):
 
         FreeCAD.closeDocument("CSG")
 
+    def test_read_shapes(self):
+        testfile = join(self.test_dir, "CSG.csg")
+        documents = set(FreeCAD.listDocuments())
+        shapes = importCSG.readShapes(testfile)
+
+        # a union, an intersection, and a difference, and no document left behind
+        self.assertEqual (len(shapes), 3)
+        for shape in shapes:
+            self.assertTrue (shape.isValid())
+            self.assertTrue (shape.Volume > 0)
+        self.assertEqual (set(FreeCAD.listDocuments()), documents)
+
+        # the parser is built only once
+        parser = importCSG.getParser()
+        importCSG.readShapes(testfile)
+        self.assertTrue (importCSG.getParser()[1] is parser[1])
+
+        # circles and polygons are not added to the open document
+        doc = FreeCAD.newDocument("ReadShapes")
+        box = doc.addObject("Part::Box", "Box")
+        filename = join(self.temp_dir.name, "circles.csg")
+        with open(filename, "w") as f:
+            f.write("circle($fn = 0, $fa = 12, $fs = 2, r = 5);\n")
+            f.write("circle($fn = 6, $fa = 12, $fs = 2, r = 5);\n")
+        shapes = importCSG.readShapes(filename)
+        self.assertTrue (len(shapes) >= 2)
+        for shape in shapes:
+            self.assertTrue (shape.Area > 0)
+        self.assertEqual ([obj.Name for obj in doc.Objects], [box.Name])
+        self.assertEqual (FreeCAD.ActiveDocument.Name, doc.Name)
+        self.assertEqual (set(FreeCAD.listDocuments()), documents | {doc.Name})
+        FreeCAD.closeDocument(doc.Name)
+
     def utility_create_scad(self, scadCode, name):
         filename = self.temp_dir.name + os.path.sep + name + ".scad"
         print (f"Creating {filename}")
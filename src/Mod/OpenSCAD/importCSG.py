@@ -61,6 +61,11 @@ hassetcolor = []
 alreadyhidden = []
 original_root_objects = []
 
+# The lexer and the LALR parser tables only depend on the grammar. They are
+# built for the first import and reused by all following ones.
+csglexer = None
+csgparser = None
+
 # Get the token map from the lexer. This is required.
 import tokrules
 from tokrules import tokens
@@ -151,27 +156,71 @@ def insert(filename, docname):
         pathName = os.path.dirname(os.path.normpath(filename))
         processcsg(filename)
 
+def readShapes(filename):
+    """returns the shapes of the top level objects of a .csg or .scad file
+    without adding any object to an open document"""
+    global doc
+    global pathName
+    global gui
+    active = FreeCAD.ActiveDocument
+    usegui = gui
+    doc = FreeCAD.newDocument("CSGShapes", hidden=True, temp=True)
+    # a temporary document does not become the active one, but some of the
+    # grammar actions add their objects to the active document
+    FreeCAD.setActiveDocument(doc.Name)
+    gui = False
+    try:
+        pathName = os.path.dirname(os.path.normpath(filename))
+        if filename.lower().endswith('.scad'):
+            tmpfile = callopenscad(filename)
+            processcsg(tmpfile)
+            try:
+                os.unlink(tmpfile)
+            except OSError:
+                pass
+        else:
+            processcsg(filename)
+        shapes = [obj.Shape.copy() for obj in doc.RootObjects
+                  if hasattr(obj, 'Shape') and not obj.Shape.isNull()]
+    finally:
+        gui = usegui
+        FreeCAD.closeDocument(doc.Name)
+        if active:
+            FreeCAD.setActiveDocument(active.Name)
+    return shapes
+
+
+def getParser():
+    """returns the CSG lexer and parser, they are only built once"""
+    global csglexer
+    global csgparser
+    if csgparser is None:
+        # Build the lexer
+        if printverbose: print('Start Lex')
+        csglexer = lex.lex(module=tokrules)
+        if printverbose: print('End Lex')
+
+        # Build the parser
+        if printverbose: print('Load Parser')
+        # Disable generation of debug ('parser.out') and table cache ('parsetab.py'),
+        # as it requires a writable location
+        csgparser = yacc.yacc(debug=False, write_tables=False)
+        if printverbose: print('Parser Loaded')
+    return csglexer, csgparser
+
+
 def processcsg(filename):
     global doc
 
     if printverbose: print('ImportCSG Version 0.6a')
-    # Build the lexer
-    if printverbose: print('Start Lex')
-    lex.lex(module=tokrules)
-    if printverbose: print('End Lex')
-
-    # Build the parser
-    if printverbose: print('Load Parser')
-    # Disable generation of debug ('parser.out') and table cache ('parsetab.py'),
-    # as it requires a writable location
-    parser = yacc.yacc(debug=False, write_tables=False)
-    if printverbose: print('Parser Loaded')
+    lexer, parser = getParser()
+    lexer.lineno = 1
 
     f = io.open(filename, 'r', encoding="utf8")
 
     if printverbose: print('Start Parser')
 
-    result = parser.parse(f.read())
+    result = parser.parse(f.read(), lexer=lexer)
     f.close()
     if printverbose:
         print('End Parser')
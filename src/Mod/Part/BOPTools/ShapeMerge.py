@@ -68,57 +68,74 @@ def splitIntoGroupsBySharing(list_of_shapes, element_extractor, split_connection
 
     split_connections = set([HashableShape(element) for element in split_connections])
 
-    groups = [] #list of tuples (shapes,elements). Shapes is a list of plain shapes. Elements is a set of HashableShapes - all elements of shapes in the group, excluding split_connections.
-
-    # add shapes to the list of groups, one by one. If not connected to existing groups,
-    # new group is created. If connected, shape is added to groups, and the groups are joined.
-    for shape in list_of_shapes:
-        shape_elements = set([HashableShape(element) for element in element_extractor(shape)])
-        shape_elements.difference_update(split_connections)
-        #search if shape is connected to any groups
-        connected_to = []
-        not_in_connected_to = []
-        for iGroup in range(len(groups)):
-            connected = False
-            for element in shape_elements:
-                if element in groups[iGroup][1]:
-                    connected_to.append(iGroup)
-                    connected = True
+    # Union-find over the indices of the shapes. owners maps every element to the first shape
+    # that has it, a shape sharing the element is joined into the group of that shape, thus
+    # the cost is about linear in the number of elements. Groups and shapes within the groups
+    # are returned in the same order as by the former implementation, which moved joined
+    # groups to the front of the list of groups. So every group root gets a sort key:
+    # new groups count up from 0, joined groups count down from -1.
+    parent = list(range(len(list_of_shapes)))
+    owners = {} # HashableShape -> index of the first shape having it
+    keys = {} # group root -> sort key
+    contents = {} # group root -> nested lists of shape indices, in order of the group
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    next_key = 0
+    next_join_key = -1
+    for index, shape in enumerate(list_of_shapes):
+        roots = set()
+        for element in element_extractor(shape):
+            element = HashableShape(element)
+            if element in split_connections:
+                continue
+            owner = owners.setdefault(element, index)
+            if owner != index:
+                roots.add(find(owner))
+
+        if len(roots) == 0:
+            keys[index] = next_key
+            next_key += 1
+            contents[index] = [index]
+        elif len(roots) == 1:
+            root = roots.pop()
+            parent[index] = root
+            contents[root].append(index)
+        else:
+            #shape bridges a gap between some groups. Join them into one.
+            roots = sorted(roots, key= keys.get)
+            root = roots[0]
+            joined = [contents.pop(r) for r in roots]
+            joined.append(index)
+            for r in roots:
+                parent[r] = root
+                del keys[r]
+            parent[index] = root
+            keys[root] = next_join_key
+            next_join_key -= 1
+            contents[root] = joined
+
+    # done. Flatten the nested lists of shape indices into lists of shapes.
+    groups = []
+    for root in sorted(contents, key= keys.get):
+        group = []
+        stack = [iter(contents[root])]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, list):
+                    stack.append(iter(item))
                     break
+                group.append(list_of_shapes[item])
             else:
-                # `break` not invoked, so `connected` is false
-                not_in_connected_to.append(iGroup)
-
-        # test if we need to join groups
-        if len(connected_to)>1:
-            #shape bridges a gap between some groups. Join them into one.
-            #rebuilding list of groups. First, add the new "supergroup", then add the rest
-            groups_new = []
-
-            supergroup = (list(),set())
-            for iGroup in connected_to:
-                supergroup[0].extend( groups[iGroup][0] )# merge lists of shapes
-                supergroup[1].update( groups[iGroup][1] )# merge lists of elements
-            groups_new.append(supergroup)
-
-            l_groups = len(groups)
-            groups_new.extend([groups[i_group] \
-                               for i_group in not_in_connected_to \
-                               if i_group < l_groups])
-            groups = groups_new
-            connected_to = [0]
-
-        # add shape to the group it is connected to (if to many, the groups should have been unified by the above code snippet)
-        if len(connected_to) > 0:
-            iGroup = connected_to[0]
-            groups[iGroup][0].append(shape)
-            groups[iGroup][1].update( shape_elements )
-        else:
-            newgroup = ([shape], shape_elements)
-            groups.append(newgroup)
-
-    # done. Discard unnecessary data and return result.
-    return [shapes for shapes,elements in groups]
+                stack.pop()
+        groups.append(group)
+    return groups
 
 def mergeSolids(list_of_solids_compsolids, flag_single = False, split_connections = [], bool_compsolid = False):
     """mergeSolids(list_of_solids, flag_single = False): merges touching solids that share
@@ -935,6 +935,29 @@ class PartBOPTestContainer(unittest.TestCase):
         fuse = bp.make_multi_common([cyl.Name, box.Name])
         self.assertEqual(part, fuse.getParent())
 
+    def testSplitIntoGroupsBySharing(self):
+        from BOPTools import ShapeMerge
+        box1 = Part.makeBox(1, 1, 1)
+        box2 = Part.makeBox(1, 1, 1, FreeCAD.Vector(1, 0, 0))
+        box3 = Part.makeBox(1, 1, 1, FreeCAD.Vector(5, 0, 0))
+        box4 = Part.makeBox(1, 1, 1, FreeCAD.Vector(2, 0, 0))
+        pieces, _ = box1.generalFuse([box3, box2, box4])
+        solids = sorted(pieces.Solids, key=lambda sh: sh.BoundBox.XMin)
+        groups = ShapeMerge.splitIntoGroupsBySharing(solids, lambda sh: sh.Faces)
+        self.assertEqual([len(group) for group in groups], [3, 1])
+        self.assertTrue(groups[1][0].isSame(solids[3]))
+        self.assertEqual(len(ShapeMerge.mergeSolids(solids).Solids), 2)
+
+        # the last solid joins the groups of the first ones
+        groups = ShapeMerge.splitIntoGroupsBySharing(
+            [solids[0], solids[2], solids[3], solids[1]], lambda sh: sh.Faces)
+        self.assertEqual([len(group) for group in groups], [3, 1])
+        self.assertEqual([round(sh.BoundBox.XMin) for sh in groups[0]], [0, 2, 1])
+
+        shared = ShapeMerge.findSharedElements(solids[1:3], lambda sh: sh.Faces)
+        groups = ShapeMerge.splitIntoGroupsBySharing(solids, lambda sh: sh.Faces, shared)
+        self.assertEqual([len(group) for group in groups], [2, 1, 1])
+
     def tearDown(self):
         FreeCAD.closeDocument(self.Doc.Name)
 
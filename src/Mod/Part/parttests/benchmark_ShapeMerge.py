@@ -0,0 +1,122 @@
+#***************************************************************************
+#*                                                                         *
+#*   This program is free software; you can redistribute it and/or modify  *
+#*   it under the terms of the GNU Lesser General Public License (LGPL)    *
+#*   as published by the Free Software Foundation; either version 2 of     *
+#*   the License, or (at your option) any later version.                   *
+#*   for detail see the LICENSE text file.                                 *
+#*                                                                         *
+#*   This program is distributed in the hope that it will be useful,       *
+#*   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+#*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+#*   GNU Library General Public License for more details.                  *
+#*                                                                         *
+#*   You should have received a copy of the GNU Library General Public     *
+#*   License along with this program; if not, write to the Free Software   *
+#*   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+#*   USA                                                                   *
+#*                                                                         *
+#***************************************************************************
+
+"""
+Benchmark of BOPTools.ShapeMerge.splitIntoGroupsBySharing against its former implementation,
+on the faces of the generalFuse result of a grid of overlapping boxes. Run it with FreeCADCmd:
+
+    FreeCADCmd -c "import parttests.benchmark_ShapeMerge as b; b.run()"
+"""
+
+import time
+
+import FreeCAD
+import Part
+from BOPTools import ShapeMerge
+from BOPTools.Utils import HashableShape
+
+
+def splitIntoGroupsBySharing_former(list_of_shapes, element_extractor, split_connections = []):
+    """the implementation before the union-find one, which tests every shape against every
+    group and rebuilds the list of groups on every join"""
+
+    split_connections = set([HashableShape(element) for element in split_connections])
+
+    groups = [] #list of tuples (shapes,elements). Shapes is a list of plain shapes. Elements is a set of HashableShapes - all elements of shapes in the group, excluding split_connections.
+
+    # add shapes to the list of groups, one by one. If not connected to existing groups,
+    # new group is created. If connected, shape is added to groups, and the groups are joined.
+    for shape in list_of_shapes:
+        shape_elements = set([HashableShape(element) for element in element_extractor(shape)])
+        shape_elements.difference_update(split_connections)
+        #search if shape is connected to any groups
+        connected_to = []
+        not_in_connected_to = []
+        for iGroup in range(len(groups)):
+            connected = False
+            for element in shape_elements:
+                if element in groups[iGroup][1]:
+                    connected_to.append(iGroup)
+                    connected = True
+                    break
+            else:
+                # `break` not invoked, so `connected` is false
+                not_in_connected_to.append(iGroup)
+
+        # test if we need to join groups
+        if len(connected_to)>1:
+            #shape bridges a gap between some groups. Join them into one.
+            #rebuilding list of groups. First, add the new "supergroup", then add the rest
+            groups_new = []
+
+            supergroup = (list(),set())
+            for iGroup in connected_to:
+                supergroup[0].extend( groups[iGroup][0] )# merge lists of shapes
+                supergroup[1].update( groups[iGroup][1] )# merge lists of elements
+            groups_new.append(supergroup)
+
+            l_groups = len(groups)
+            groups_new.extend([groups[i_group] \
+                               for i_group in not_in_connected_to \
+                               if i_group < l_groups])
+            groups = groups_new
+            connected_to = [0]
+
+        # add shape to the group it is connected to (if to many, the groups should have been unified by the above code snippet)
+        if len(connected_to) > 0:
+            iGroup = connected_to[0]
+            groups[iGroup][0].append(shape)
+            groups[iGroup][1].update( shape_elements )
+        else:
+            newgroup = ([shape], shape_elements)
+            groups.append(newgroup)
+
+    # done. Discard unnecessary data and return result.
+    return [shapes for shapes,elements in groups]
+
+
+def makeFusedBoxes(count):
+    """generalFuse result of count x count overlapping boxes"""
+    boxes = []
+    for i in range(count):
+        for j in range(count):
+            boxes.append(Part.makeBox(1, 1, 1, FreeCAD.Vector(0.7 * i, 0.7 * j, 0.3 * ((i + j) % 2))))
+    pieces, _ = boxes[0].generalFuse(boxes[1:])
+    return pieces
+
+
+def run(counts=(5, 10, 20, 30)):
+    """groups the faces of the fused boxes by shared edges with both implementations"""
+    for count in counts:
+        start = time.perf_counter()
+        faces = makeFusedBoxes(count).Faces
+        fuse = time.perf_counter() - start
+
+        results = []
+        for split in (splitIntoGroupsBySharing_former, ShapeMerge.splitIntoGroupsBySharing):
+            start = time.perf_counter()
+            groups = split(faces, lambda sh: sh.Edges)
+            results.append((time.perf_counter() - start, groups))
+        (former, former_groups), (current, groups) = results
+        same = [[HashableShape(sh) for sh in group] for group in former_groups] == \
+               [[HashableShape(sh) for sh in group] for group in groups]
+
+        print("{} faces, {} groups (fuse {:.1f}s): former {:.3f}s, union-find {:.3f}s, "
+              "same result: {}".format(len(faces), len(groups), fuse, former, current, same))
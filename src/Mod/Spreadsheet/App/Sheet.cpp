@@ -472,6 +472,35 @@ void Sheet::setCell(CellAddress address, const char* value)
     setContent(address, value);
 }
 
+/**
+ * Set several cells at once. The cells property is changed only once for the whole batch.
+ *
+ * @param contents Pairs of address and contents. An address may be an alias, a cell or a
+ *                 range of cells, as for the Python method set().
+ *
+ */
+
+void Sheet::setCells(const std::vector<std::pair<std::string, std::string>>& contents)
+{
+    PropertySheet::AtomicPropertyChange signaller(cells);
+
+    for (const auto& content : contents) {
+        std::string cellAddress = getAddressFromAlias(content.first);
+
+        if (!cellAddress.empty()) {
+            setCell(cellAddress.c_str(), content.second.c_str());
+        }
+        else {
+            Range rangeIter(content.first.c_str());
+
+            do {
+                setCell(rangeIter.address().c_str(), content.second.c_str());
+            } while (rangeIter.next());
+        }
+    }
+    signaller.tryInvoke();
+}
+
 /**
  * Get the Python object for the Sheet.
  *
@@ -124,6 +124,8 @@ public:
 
     void setCell(App::CellAddress address, const char* value);
 
+    void setCells(const std::vector<std::pair<std::string, std::string>>& contents);
+
     void clearAll();
 
     void clear(App::CellAddress address, bool all = true);
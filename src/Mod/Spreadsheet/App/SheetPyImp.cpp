@@ -93,6 +93,45 @@ PyObject* SheetPy::set(PyObject* args)
     Py_Return;
 }
 
+PyObject* SheetPy::setCells(PyObject* args)
+{
+    PyObject* pcObj;
+
+    if (!PyArg_ParseTuple(args, "O:setCells", &pcObj)) {
+        return nullptr;
+    }
+
+    PY_TRY
+    {
+        std::vector<std::pair<std::string, std::string>> contents;
+        Py::Object obj(pcObj);
+        if (PyDict_Check(pcObj)) {
+            PyObject* key;
+            PyObject* value;
+            Py_ssize_t pos = 0;
+            while (PyDict_Next(pcObj, &pos, &key, &value)) {
+                contents.emplace_back(Py::String(key).as_std_string("utf-8"),
+                                      Py::String(value).as_std_string("utf-8"));
+            }
+        }
+        else {
+            Py::Sequence seq(obj);
+            for (Py::Sequence::iterator it = seq.begin(); it != seq.end(); ++it) {
+                Py::Sequence item(*it);
+                if (item.size() != 2) {
+                    throw Py::TypeError("expected a sequence of (address, contents) pairs");
+                }
+                contents.emplace_back(Py::String(item[0]).as_std_string("utf-8"),
+                                      Py::String(item[1]).as_std_string("utf-8"));
+            }
+        }
+
+        getSheetPtr()->setCells(contents);
+        Py_Return;
+    }
+    PY_CATCH;
+}
+
 PyObject* SheetPy::get(PyObject* args)
 {
     const char* address;
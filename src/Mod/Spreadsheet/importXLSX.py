@@ -52,8 +52,11 @@ known issues:
 """
 
 
+import itertools
+import re
 import zipfile
 import xml.dom.minidom
+from xml.etree import ElementTree
 import FreeCAD as App
 
 try:
@@ -64,6 +67,9 @@ else:
     gui = True
 
 
+# Number of cells set by one call of Sheet.setCells() while reading a worksheet.
+cellBatchSize = 1000
+
 # The sepToken structure is used in the tokenizer functions isKey and
 # getNextToken.
 # sepToken defines a search tree for separator tokens with length of 1 to 3 characters
@@ -313,55 +319,140 @@ def getText(nodelist):
         return "".join(rc)
 
 
-def handleWorkSheet(theDom, actSheet, strList):
-    rows = theDom.getElementsByTagName("row")
-    for row in rows:
-        handleCells(row.getElementsByTagName("c"), actSheet, strList)
-
-
-def handleCells(cellList, actCellSheet, sList):
-    for cell in cellList:
-        cellAtts = cell.attributes
-        refRef = cellAtts.getNamedItem("r")
-        ref = getText(refRef.childNodes)
-
-        refType = cellAtts.getNamedItem("t")
-        if refType:
-            cellType = getText(refType.childNodes)
-        else:
-            cellType = "n"
-
-        # print("reference: ", ref, ' Cell type: ', cellType)
-
-        if cellType == "inlineStr":
-            iStringList = cell.getElementsByTagName("is")
-            # print('iString: ', iStringList)
-            for stringEle in iStringList:
-                tElement = stringEle.getElementsByTagName("t")[0]
-                theString = getText(tElement.childNodes)
-
-                # print('theString: ', theString)
-                actCellSheet.set(ref, theString)
-
-        formulaRef = cell.getElementsByTagName("f")
-        if len(formulaRef) == 1:
-            theFormula = getText(formulaRef[0].childNodes)
-            # print("theFormula: ", theFormula)
-            fTrans = FormulaTranslator()
-            actCellSheet.set(ref, fTrans.translateForm(theFormula))
-
-        else:
-            valueRef = cell.getElementsByTagName("v")
-            # print('valueRef: ', valueRef)
-            if len(valueRef) == 1:
-                valueRef = cell.getElementsByTagName("v")[0]
-                if valueRef:
-                    theValue = getText(valueRef.childNodes)
-                    # print("theValue: ", theValue)
-                    if cellType == "n":
-                        actCellSheet.set(ref, theValue)
-                    if cellType == "s":
-                        actCellSheet.set(ref, (sList[int(theValue)]))
+def localName(tag):
+    """Strips the namespace from an ElementTree tag."""
+    return tag.rpartition("}")[2]
+
+
+# Matches a cell reference like A1, $A1, A$1 or Sheet.$A$1 inside a translated formula.
+cellRefPattern = re.compile(r"(?<![A-Za-z0-9_$])(\$?)([A-Z]{1,3})(\$?)([0-9]+)(?![A-Za-z0-9_(])")
+
+
+def splitCellRef(ref):
+    """Returns the zero based (column, row) of a cell reference like B12."""
+    col = 0
+    pos = 0
+    while ref[pos].isalpha():
+        col = col * 26 + ord(ref[pos]) - ord("A") + 1
+        pos += 1
+    return col - 1, int(ref[pos:]) - 1
+
+
+def columnName(col):
+    name = ""
+    col += 1
+    while col > 0:
+        col, rest = divmod(col - 1, 26)
+        name = chr(ord("A") + rest) + name
+    return name
+
+
+def shiftFormula(theFormula, colOffset, rowOffset):
+    """Moves the relative cell references of a translated formula.
+    This is how Excel expands a shared formula to the other cells of its range."""
+    if colOffset == 0 and rowOffset == 0:
+        return theFormula
+
+    def shiftRef(match):
+        colAbs, colRef, rowAbs, rowRef = match.groups()
+        col, row = splitCellRef(colRef + rowRef)
+        if not colAbs:
+            col += colOffset
+        if not rowAbs:
+            row += rowOffset
+        if col < 0 or row < 0:
+            return match.group(0)
+        return colAbs + columnName(col) + rowAbs + str(row + 1)
+
+    return cellRefPattern.sub(shiftRef, theFormula)
+
+
+def handleWorkSheet(theFile, actSheet, strList, formulaCache=None):
+    """Reads a worksheet from the file object theFile with iterparse and
+    sets its cells in batches of cellBatchSize cells with bulk updates of actSheet.
+    Rows are dropped as soon as they are read to keep the memory bounded."""
+    cells = readCells(theFile, strList, formulaCache)
+    while True:
+        batch = list(itertools.islice(cells, cellBatchSize))
+        if not batch:
+            break
+        actSheet.setCells(batch)
+
+
+def readCells(theFile, sList, formulaCache=None):
+    """Generator yielding (reference, contents) for every cell of a worksheet."""
+    if formulaCache is None:
+        formulaCache = dict()
+    sharedFormulas = dict()  # shared-formula index: (master reference, translated formula)
+    sheetData = None
+    for event, elem in ElementTree.iterparse(theFile, events=("start", "end")):
+        tag = localName(elem.tag)
+        if event == "start":
+            if tag == "sheetData":
+                sheetData = elem
+            continue
+
+        if tag == "c":
+            contents = handleCell(elem, sList, formulaCache, sharedFormulas)
+            if contents is not None:
+                yield elem.get("r"), contents
+        elif tag == "row" and sheetData is not None:
+            sheetData.clear()
+
+
+def handleCell(cell, sList, formulaCache, sharedFormulas):
+    """Returns the FreeCAD contents of a cell element or None for an empty cell."""
+    ref = cell.get("r")
+    cellType = cell.get("t", "n")
+
+    formulaElem = None
+    valueElem = None
+    inlineElem = None
+    for child in cell:
+        tag = localName(child.tag)
+        if tag == "f":
+            formulaElem = child
+        elif tag == "v":
+            valueElem = child
+        elif tag == "is":
+            inlineElem = child
+
+    if formulaElem is not None:
+        theFormula = formulaElem.text
+        sharedIndex = formulaElem.get("si")
+        if formulaElem.get("t") == "shared" and sharedIndex is not None:
+            if theFormula:
+                sharedFormulas[sharedIndex] = (ref, translateFormula(theFormula, formulaCache))
+            if sharedIndex in sharedFormulas:
+                masterRef, masterFormula = sharedFormulas[sharedIndex]
+                masterCol, masterRow = splitCellRef(masterRef)
+                col, row = splitCellRef(ref)
+                return shiftFormula(masterFormula, col - masterCol, row - masterRow)
+        elif theFormula:
+            return translateFormula(theFormula, formulaCache)
+
+    if cellType == "inlineStr":
+        if inlineElem is not None:
+            for tElement in inlineElem.iter():
+                if localName(tElement.tag) == "t":
+                    return tElement.text or ""
+        return None
+
+    if valueElem is not None and valueElem.text is not None:
+        if cellType == "n":
+            return valueElem.text
+        if cellType == "s":
+            return sList[int(valueElem.text)]
+    return None
+
+
+def translateFormula(theFormula, formulaCache):
+    """Translates an Excel formula, reusing the result for repeated formulas."""
+    translated = formulaCache.get(theFormula)
+    if translated is None:
+        translated = FormulaTranslator().translateForm(theFormula)
+        formulaCache[theFormula] = translated
+    return translated
 
 
 def handleWorkBook(theBook, sheetDict, Doc):
@@ -425,14 +516,12 @@ def open(nameXLSX):
             handleStrings(theStrings, stringList)
             theStrings.unlink()
 
+        formulaCache = dict()
         for sheetSpec in sheetDict:
             # print("sheetSpec: ", sheetSpec)
             theSheet, sheetFile = sheetDict[sheetSpec]
-            f = z.open("xl/worksheets/" + sheetFile)
-            myDom = xml.dom.minidom.parse(f)
-
-            handleWorkSheet(myDom, theSheet, stringList)
-            myDom.unlink()
+            with z.open("xl/worksheets/" + sheetFile) as f:
+                handleWorkSheet(f, theSheet, stringList, formulaCache)
 
         z.close()
         # This is needed more than once, otherwise some references are not calculated!
@@ -464,14 +553,12 @@ def insert(nameXLSX, docname):
         handleStrings(theStrings, stringList)
         theStrings.unlink()
 
+    formulaCache = dict()
     for sheetSpec in sheetDict:
         # print("sheetSpec: ", sheetSpec)
         theSheet, sheetFile = sheetDict[sheetSpec]
-        f = z.open("xl/worksheets/" + sheetFile)
-        myDom = xml.dom.minidom.parse(f)
-
-        handleWorkSheet(myDom, theSheet, stringList)
-        myDom.unlink()
+        with z.open("xl/worksheets/" + sheetFile) as f:
+            handleWorkSheet(f, theSheet, stringList, formulaCache)
 
     z.close()
     # This is needed more than once, otherwise some references are not calculated!
@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
-from importXLSX import FormulaTranslator, getText, handleStrings, open
+import io
+
+from importXLSX import FormulaTranslator, getText, handleStrings, handleWorkSheet, open
 
 
 class TestFormulaTranslator(unittest.TestCase):
@@ -96,3 +98,55 @@ class TestFormulaTranslator(unittest.TestCase):
         # Then
         expected = [f"={expression}" for _, expression in formulas_and_expressions]
         self.assertListEqual(expected, result)
+
+
+class TestWorkSheet(unittest.TestCase):
+    def test_shared_formulas_and_bulk_update(self):
+        # With
+        sheet_xml = (
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b"<sheetData>"
+            b'<row r="1"><c r="A1"><v>1</v></c>'
+            b'<c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2+$A$1</f><v>2</v></c>'
+            b'<c r="C1" t="s"><v>0</v></c></row>'
+            b'<row r="2"><c r="B2"><f t="shared" si="0"/><v>4</v></c>'
+            b'<c r="C2" t="inlineStr"><is><t>text</t></is></c></row>'
+            b'<row r="3"><c r="B3"><f t="shared" si="0"/></c></row>'
+            b"</sheetData></worksheet>"
+        )
+        sheet = MagicMock()
+
+        # When
+        handleWorkSheet(io.BytesIO(sheet_xml), sheet, ["shared"])
+
+        # Then
+        sheet.setCells.assert_called_once_with(
+            [
+                ("A1", "1"),
+                ("B1", "=A1*2+$A$1"),
+                ("C1", "shared"),
+                ("B2", "=A2*2+$A$1"),
+                ("C2", "text"),
+                ("B3", "=A3*2+$A$1"),
+            ]
+        )
+        sheet.set.assert_not_called()
+
+    def test_cells_are_set_in_batches(self):
+        # With
+        rows = "".join(f'<row r="{i}"><c r="A{i}"><v>{i}</v></c></row>' for i in range(1, 6))
+        sheet_xml = (
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f"<sheetData>{rows}</sheetData></worksheet>"
+        ).encode()
+        sheet = MagicMock()
+
+        # When
+        with patch("importXLSX.cellBatchSize", 2):
+            handleWorkSheet(io.BytesIO(sheet_xml), sheet, [])
+
+        # Then
+        self.assertEqual(
+            [c.args[0] for c in sheet.setCells.call_args_list],
+            [[("A1", "1"), ("A2", "2")], [("A3", "3"), ("A4", "4")], [("A5", "5")]],
+        )